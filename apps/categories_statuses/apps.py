@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class CategoriesStatusesConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.categories_statuses"
+
+    def ready(self):
+        from apps.categories_statuses import signals  # noqa: F401
@@ -1,12 +1,29 @@
+from django.conf import settings
 from django.urls import path
 
+from apps.categories_statuses.controllers.async_controllers import (
+    AsyncListCategoriesView,
+    AsyncRetrieveCategoryView,
+)
 from apps.categories_statuses.controllers.category_controllers import (
     ListCategoriesAPIView,
     RetrieveCategoryAPIView
 )
+from apps.core.async_views import async_or_sync_view
+
 
+if settings.ASYNC_API_VIEWS:
+    list_view = async_or_sync_view(
+        AsyncListCategoriesView, ListCategoriesAPIView.as_view()
+    )
+    retrieve_view = async_or_sync_view(
+        AsyncRetrieveCategoryView, RetrieveCategoryAPIView.as_view()
+    )
+else:
+    list_view = ListCategoriesAPIView.as_view()
+    retrieve_view = RetrieveCategoryAPIView.as_view()
 
 urlpatterns = [
-    path("", ListCategoriesAPIView.as_view()),
-    path("<int:category_id>/", RetrieveCategoryAPIView.as_view()),
+    path("", list_view),
+    path("<int:category_id>/", retrieve_view),
 ]
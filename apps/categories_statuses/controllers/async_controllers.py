@@ -0,0 +1,142 @@
+from django.http import HttpRequest
+
+from apps.categories_statuses.services.category_services import CategoryService
+from apps.categories_statuses.services.status_services import StatusService
+from apps.core.async_views import AsyncAPIView, json_response
+from apps.core.conditional import (
+    get_not_modified_response,
+    response_variant,
+    set_validator_headers,
+)
+
+
+class AsyncListCategoriesView(AsyncAPIView):
+    """
+    Native async GET of ListCategoriesAPIView; creating categories
+    stays on the DRF view.
+
+    Attributes:
+        service (CategoryService): An instance of CategoryService
+        for handling category-related operations.
+    """
+    service = CategoryService()
+
+    async def get(self, request: HttpRequest, *args, **kwargs):
+        """
+        Handles GET requests to list all categories.
+
+        Returns:
+            HttpResponse: HTTP status 200 with all categories, or 304
+            if the client's copy is still current.
+        """
+        validators = await self.service.aget_categories_validators(
+            variant=response_variant(request)
+        )
+        not_modified = get_not_modified_response(request, validators)
+
+        if not_modified is not None:
+            return not_modified
+
+        categories_data = await self.service.aget_all_categories()
+
+        return set_validator_headers(json_response(categories_data), validators)
+
+
+class AsyncRetrieveCategoryView(AsyncAPIView):
+    """
+    Native async GET of RetrieveCategoryAPIView; updating and deleting
+    stay on the DRF view.
+
+    Attributes:
+        service (CategoryService): An instance of CategoryService
+        for handling category-related operations.
+    """
+    service = CategoryService()
+
+    async def get(self, request: HttpRequest, *args, **kwargs):
+        """
+        Handles GET requests to retrieve a specific category.
+
+        Returns:
+            HttpResponse: HTTP status 200 with the category, 404 if it
+            does not exist, or 304 if the client's copy is still current.
+        """
+        category_id = kwargs.get("category_id")
+        validators = await self.service.aget_category_validators(
+            pk=category_id,
+            variant=response_variant(request)
+        )
+        not_modified = get_not_modified_response(request, validators)
+
+        if not_modified is not None:
+            return not_modified
+
+        category = await self.service.aget_category_by_pk(pk=category_id)
+
+        return set_validator_headers(json_response(category), validators)
+
+
+class AsyncListStatusesView(AsyncAPIView):
+    """
+    Native async GET of ListStatusesAPIView; creating statuses
+    stays on the DRF view.
+
+    Attributes:
+        service (StatusService): An instance of StatusService
+        for handling status-related operations.
+    """
+    service = StatusService()
+
+    async def get(self, request: HttpRequest, *args, **kwargs):
+        """
+        Handles GET requests to list all statuses.
+
+        Returns:
+            HttpResponse: HTTP status 200 with all statuses, or 304
+            if the client's copy is still current.
+        """
+        validators = await self.service.aget_statuses_validators(
+            variant=response_variant(request)
+        )
+        not_modified = get_not_modified_response(request, validators)
+
+        if not_modified is not None:
+            return not_modified
+
+        statuses_data = await self.service.aget_all_statuses()
+
+        return set_validator_headers(json_response(statuses_data), validators)
+
+
+class AsyncRetrieveStatusView(AsyncAPIView):
+    """
+    Native async GET of RetrieveStatusAPIView; updating and deleting
+    stay on the DRF view.
+
+    Attributes:
+        service (StatusService): An instance of StatusService
+        for handling status-related operations.
+    """
+    service = StatusService()
+
+    async def get(self, request: HttpRequest, *args, **kwargs):
+        """
+        Handles GET requests to retrieve a specific status by its ID.
+
+        Returns:
+            HttpResponse: HTTP status 200 with the status, 404 if it
+            does not exist, or 304 if the client's copy is still current.
+        """
+        status_id = kwargs.get("status_id")
+        validators = await self.service.aget_status_validators(
+            pk=status_id,
+            variant=response_variant(request)
+        )
+        not_modified = get_not_modified_response(request, validators)
+
+        if not_modified is not None:
+            return not_modified
+
+        status_obj = await self.service.aget_status_by_pk(pk=status_id)
+
+        return set_validator_headers(json_response(status_obj), validators)
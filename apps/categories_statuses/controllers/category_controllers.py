@@ -8,6 +8,11 @@ from apps.categories_statuses.services.category_services import CategoryService
 from apps.categories_statuses.success_messages import (
     CATEGORY_SUCCESS_DELETING_MESSAGE,
 )
+from apps.core.conditional import (
+    get_not_modified_response,
+    response_variant,
+    set_validator_headers,
+)
 
 
 class ListCategoriesAPIView(APIView):
@@ -29,15 +34,25 @@ class ListCategoriesAPIView(APIView):
 
         Returns:
             Response: A Response object with HTTP status 200 and
-            a list of categories in its data.
+            a list of categories in its data, or HTTP status 304 if
+            the client's copy (If-None-Match) is still current.
         """
-        categories_data = self.service.get_all_categories()
+        validators = self.service.get_categories_validators(
+            variant=response_variant(request)
+        )
+        not_modified = get_not_modified_response(request, validators)
 
-        return Response(
+        if not_modified is not None:
+            return not_modified
+
+        categories_data = self.service.get_all_categories()
+        response = Response(
             status=status.HTTP_200_OK,
             data=categories_data
         )
 
+        return set_validator_headers(response, validators)
+
     def post(self, request: Request, *args, **kwargs):
         """
         Handles POST requests to create a new category.
@@ -81,19 +96,31 @@ class RetrieveCategoryAPIView(APIView):
 
         Returns:
             Response: A Response object with HTTP status 200 and
-            the requested category's data, if found.
+            the requested category's data, if found, or HTTP status
+            304 if the client's copy is still current.
         """
         category_id = kwargs.get("category_id")
 
         if category_id:
+            validators = self.service.get_category_validators(
+                pk=category_id,
+                variant=response_variant(request)
+            )
+            not_modified = get_not_modified_response(request, validators)
+
+            if not_modified is not None:
+                return not_modified
+
             category = self.service.get_category_by_pk(
                 pk=category_id
             )
-            return Response(
+            response = Response(
                 status=status.HTTP_200_OK,
                 data=category
             )
 
+            return set_validator_headers(response, validators)
+
     def put(self, request: Request, *args, **kwargs):
         """
         Handles PUT requests to update a specific category.
@@ -10,6 +10,11 @@ from apps.categories_statuses.services.status_services import (
 from apps.categories_statuses.success_messages import (
     STATUS_SUCCESS_DELETING_MESSAGE,
 )
+from apps.core.conditional import (
+    get_not_modified_response,
+    response_variant,
+    set_validator_headers,
+)
 
 
 class ListStatusesAPIView(APIView):
@@ -34,15 +39,25 @@ class ListStatusesAPIView(APIView):
 
         Returns:
             Response: A Response object with HTTP status 200 and
-            serialized data of all statuses.
+            serialized data of all statuses, or HTTP status 304 if
+            the client's copy (If-None-Match) is still current.
         """
-        statuses_data = self.service.get_all_statuses()
+        validators = self.service.get_statuses_validators(
+            variant=response_variant(request)
+        )
+        not_modified = get_not_modified_response(request, validators)
 
-        return Response(
+        if not_modified is not None:
+            return not_modified
+
+        statuses_data = self.service.get_all_statuses()
+        response = Response(
             status=status.HTTP_200_OK,
             data=statuses_data
         )
 
+        return set_validator_headers(response, validators)
+
     def post(self, request: Request, *args, **kwargs):
         """
         Handles POST requests to create a new status.
@@ -89,19 +104,31 @@ class RetrieveStatusAPIView(APIView):
 
         Returns:
             Response: A Response object with HTTP status 200 and
-            serialized data of the requested status.
+            serialized data of the requested status, or HTTP status
+            304 if the client's copy is still current.
         """
         status_id = kwargs.get("status_id")
 
         if status_id:
+            validators = self.service.get_status_validators(
+                pk=status_id,
+                variant=response_variant(request)
+            )
+            not_modified = get_not_modified_response(request, validators)
+
+            if not_modified is not None:
+                return not_modified
+
             status_obj = self.service.get_status_by_pk(
                 pk=status_id
             )
-            return Response(
+            response = Response(
                 status=status.HTTP_200_OK,
                 data=status_obj
             )
 
+            return set_validator_headers(response, validators)
+
     def put(self, request: Request, *args, **kwargs):
         """
         Handles PUT requests to update a specific status by its ID.
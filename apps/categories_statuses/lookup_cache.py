@@ -0,0 +1,145 @@
+import threading
+from typing import NamedTuple
+
+from django.db import DEFAULT_DB_ALIAS
+
+from apps.categories_statuses.models import (
+    Category,
+    Status,
+)
+from apps.core.versions import (
+    aget_version,
+    bump_version,
+    get_version,
+    versions_are_shared,
+)
+
+
+class LookupSnapshot(NamedTuple):
+    version: int
+    rows: tuple
+    by_id: dict
+    by_name: dict
+
+
+class LookupTableCache:
+    """
+    In-process copy of a small reference table, keyed by id and by name.
+
+    Every read compares the local snapshot with the version counter in
+    the shared Django cache and reloads the whole table when another
+    process (or this one) has bumped it, so a worker never serves a
+    name that was changed elsewhere. Without shared versions (see
+    ``versions_are_shared()``) every read loads the table again.
+
+    Attributes:
+        model (Model): Reference model with a unique ``name`` field.
+        namespace (str): Version counter name in the shared cache.
+    """
+    def __init__(self, model, namespace):
+        self.model = model
+        self.namespace = namespace
+        self._snapshot = None
+        self._lock = threading.Lock()
+
+    def all(self):
+        """
+        Returns all rows of the table ordered by id.
+        """
+        return list(self._get_snapshot().rows)
+
+    async def aall(self):
+        """
+        Async version of ``all()``.
+        """
+        return list((await self._aget_snapshot()).rows)
+
+    def get_by_id(self, pk):
+        """
+        Returns the row with the given id, or None.
+        """
+        return self._get_snapshot().by_id.get(pk)
+
+    def get_by_name(self, name):
+        """
+        Returns the row with the given name, or None.
+        """
+        return self._get_snapshot().by_name.get(name)
+
+    def version(self):
+        """
+        Returns the shared version of the table, which changes on
+        every write to it.
+        """
+        return get_version(self.namespace)
+
+    async def aversion(self):
+        """
+        Async version of ``version()``.
+        """
+        return await aget_version(self.namespace)
+
+    def invalidate(self):
+        """
+        Drops the local snapshot and bumps the shared version, so
+        every other process reloads on its next read.
+        """
+        bump_version(self.namespace)
+        self._snapshot = None
+
+    def __deepcopy__(self, memo):
+        # serializer fields deepcopy their kwargs; the cache is shared
+        return self
+
+    def _get_snapshot(self):
+        version = get_version(self.namespace)
+        snapshot = self._snapshot
+
+        if self._is_current(snapshot, version):
+            return snapshot
+
+        with self._lock:
+            snapshot = self._snapshot
+            if not self._is_current(snapshot, version):
+                snapshot = self._build_snapshot(version, tuple(self._rows()))
+
+        return snapshot
+
+    async def _aget_snapshot(self):
+        version = await aget_version(self.namespace)
+        snapshot = self._snapshot
+
+        if self._is_current(snapshot, version):
+            return snapshot
+
+        rows = tuple([row async for row in self._rows()])
+
+        return self._build_snapshot(version, rows)
+
+    @staticmethod
+    def _is_current(snapshot, version):
+        return (
+            snapshot is not None
+            and snapshot.version == version
+            and versions_are_shared()
+        )
+
+    def _rows(self):
+        # from the primary: rows of a lagging replica would be kept
+        # under the new version until the next write
+        return self.model.objects.using(DEFAULT_DB_ALIAS).order_by("id")
+
+    def _build_snapshot(self, version, rows):
+        snapshot = LookupSnapshot(
+            version=version,
+            rows=rows,
+            by_id={row.id: row for row in rows},
+            by_name={row.name: row for row in rows},
+        )
+        self._snapshot = snapshot
+
+        return snapshot
+
+
+category_cache = LookupTableCache(Category, namespace="categories")
+status_cache = LookupTableCache(Status, namespace="statuses")
@@ -1,5 +1,7 @@
+from django.http import Http404
 from rest_framework.generics import get_object_or_404
 
+from apps.categories_statuses.lookup_cache import category_cache
 from apps.categories_statuses.models import Category
 
 
@@ -13,13 +15,22 @@ class CategoryRepository:
     """
     def get_all(self):
         """
-        Retrieves all category instances from the database.
+        Retrieves all category instances from the in-process
+        lookup cache.
 
         Returns:
-            QuerySet: A Django QuerySet containing all
-            Category instances.
+            list: All Category instances ordered by id.
         """
-        return Category.objects.all()
+        return category_cache.all()
+
+    async def aget_all(self):
+        """
+        Async version of ``get_all()``.
+
+        Returns:
+            list: All Category instances ordered by id.
+        """
+        return await category_cache.aall()
 
     def get_by_pk(self, pk):
         """
@@ -36,6 +47,24 @@ class CategoryRepository:
         """
         return get_object_or_404(Category, id=pk)
 
+    async def aget_by_pk(self, pk):
+        """
+        Async version of ``get_by_pk()``.
+
+        Args:
+            pk (int): The primary key of the category to be retrieved.
+
+        Returns:
+            Category: The Category instance corresponding to the given pk.
+
+        Raises:
+            Http404: If no Category instance with the given pk is found.
+        """
+        try:
+            return await Category.objects.aget(id=pk)
+        except Category.DoesNotExist:
+            raise Http404
+
     def get_by_name(self, name):
         """
         Retrieves a single category instance by its name.
@@ -49,7 +78,12 @@ class CategoryRepository:
         Raises:
             Http404: If no Category instance with the given name is found.
         """
-        return get_object_or_404(Category, name=name)
+        category = category_cache.get_by_name(name)
+
+        if category is None:
+            raise Http404
+
+        return category
 
     def create_category(self, validated_data):
         """
@@ -1,17 +1,33 @@
+from django.http import Http404
 from rest_framework.generics import get_object_or_404
 
+from apps.categories_statuses.lookup_cache import status_cache
 from apps.categories_statuses.models import Status
 
 
 class StatusRepository:
     def get_all(self):
-        return Status.objects.all()
+        return status_cache.all()
+
+    async def aget_all(self):
+        return await status_cache.aall()
 
     def get_by_pk(self, pk):
         return get_object_or_404(Status, id=pk)
 
+    async def aget_by_pk(self, pk):
+        try:
+            return await Status.objects.aget(id=pk)
+        except Status.DoesNotExist:
+            raise Http404
+
     def get_by_name(self, name):
-        return get_object_or_404(Status, name=name)
+        status_obj = status_cache.get_by_name(name)
+
+        if status_obj is None:
+            raise Http404
+
+        return status_obj
 
     def create_status(self, validated_data):
         category = Status.objects.create(**validated_data)
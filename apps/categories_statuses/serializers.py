@@ -95,3 +95,39 @@ class StatusSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError(STATUS_NAME_TYPE_ERROR)
 
         return value
+
+
+class CachedNameRelatedField(serializers.SlugRelatedField):
+    """
+    SlugRelatedField over ``name`` that resolves Category/Status rows
+    through the in-process lookup cache instead of the database.
+
+    Attributes:
+        lookup_cache (LookupTableCache): Cache of the related table.
+    """
+    def __init__(self, lookup_cache, **kwargs):
+        self.lookup_cache = lookup_cache
+        kwargs.setdefault("slug_field", "name")
+        super().__init__(**kwargs)
+
+    def use_pk_only_optimization(self):
+        return True
+
+    def to_internal_value(self, data):
+        if not isinstance(data, str):
+            self.fail("invalid")
+
+        obj = self.lookup_cache.get_by_name(data)
+
+        if obj is None:
+            self.fail("does_not_exist", slug_name=self.slug_field, value=data)
+
+        return obj
+
+    def to_representation(self, value):
+        obj = self.lookup_cache.get_by_id(value.pk)
+
+        if obj is None:
+            obj = self.get_queryset().get(pk=value.pk)
+
+        return obj.name
@@ -1,5 +1,8 @@
+from apps.categories_statuses.lookup_cache import category_cache
 from apps.categories_statuses.repositories.category_repository import CategoryRepository
 from apps.categories_statuses.serializers import CategorySerializer
+from apps.core.conditional import Validators, build_etag
+from apps.core.response_cache import ResponseCache
 
 
 class CategoryService:
@@ -16,9 +19,12 @@ class CategoryService:
         for database operations.
         serializer (CategorySerializer): Serializer class for
         category data serialization.
+        list_cache (ResponseCache): Cache of the serialized
+        categories list, keyed by the table version.
     """
     category_repo = CategoryRepository()
     serializer = CategorySerializer
+    list_cache = ResponseCache("categories")
 
     def get_all_categories(self):
         """
@@ -27,10 +33,78 @@ class CategoryService:
         Returns:
             list: A list of serialized category data.
         """
-        categories = self.category_repo.get_all()
-        serializer = self.serializer(categories, many=True)
+        def build_list():
+            categories = self.category_repo.get_all()
+            serializer = self.serializer(categories, many=True)
 
-        return serializer.data
+            return serializer.data
+
+        return self.list_cache.get_or_set(category_cache.version(), {}, build_list)
+
+    async def aget_all_categories(self):
+        """
+        Async version of ``get_all_categories()``.
+
+        Returns:
+            list: A list of serialized category data.
+        """
+        async def build_list():
+            categories = await self.category_repo.aget_all()
+            serializer = self.serializer(categories, many=True)
+
+            return serializer.data
+
+        return await self.list_cache.aget_or_set(
+            await category_cache.aversion(), {}, build_list
+        )
+
+    def get_categories_validators(self, variant):
+        """
+        Builds the conditional GET validators of the categories list
+        from the table version, without touching the database.
+
+        Args:
+            variant (tuple): What else shapes the response body.
+
+        Returns:
+            Validators: ETag of the current representation.
+        """
+        return Validators(
+            etag=build_etag("categories", category_cache.version(), *variant)
+        )
+
+    async def aget_categories_validators(self, variant):
+        """
+        Async version of ``get_categories_validators()``.
+        """
+        version = await category_cache.aversion()
+
+        return Validators(etag=build_etag("categories", version, *variant))
+
+    def get_category_validators(self, pk, variant):
+        """
+        Builds the conditional GET validators of a single category.
+
+        Args:
+            pk (int): The primary key of the category.
+            variant (tuple): What else shapes the response body.
+
+        Returns:
+            Validators: ETag of the current representation.
+        """
+        return Validators(
+            etag=build_etag(
+                "category", pk, category_cache.version(), *variant
+            )
+        )
+
+    async def aget_category_validators(self, pk, variant):
+        """
+        Async version of ``get_category_validators()``.
+        """
+        version = await category_cache.aversion()
+
+        return Validators(etag=build_etag("category", pk, version, *variant))
 
     def get_category_by_pk(self, pk):
         """
@@ -48,6 +122,21 @@ class CategoryService:
 
         return serializer.data
 
+    async def aget_category_by_pk(self, pk):
+        """
+        Async version of ``get_category_by_pk()``.
+
+        Args:
+            pk (int): The primary key of the category.
+
+        Returns:
+            dict: Serialized data of the requested category.
+        """
+        category = await self.category_repo.aget_by_pk(pk=pk)
+        serializer = self.serializer(category)
+
+        return serializer.data
+
     def get_category_by_name(self, name):
         """
         Retrieves a category by its name and returns it
@@ -1,18 +1,56 @@
+from apps.categories_statuses.lookup_cache import status_cache
 from apps.categories_statuses.repositories.status_repository import (
     StatusRepository,
 )
 from apps.categories_statuses.serializers import StatusSerializer
+from apps.core.conditional import Validators, build_etag
+from apps.core.response_cache import ResponseCache
 
 
 class StatusService:
     status_repo = StatusRepository()
     serializer = StatusSerializer
+    list_cache = ResponseCache("statuses")
 
     def get_all_statuses(self):
-        statuses = self.status_repo.get_all()
-        serializer = self.serializer(statuses, many=True)
+        def build_list():
+            statuses = self.status_repo.get_all()
+            serializer = self.serializer(statuses, many=True)
 
-        return serializer.data
+            return serializer.data
+
+        return self.list_cache.get_or_set(status_cache.version(), {}, build_list)
+
+    async def aget_all_statuses(self):
+        async def build_list():
+            statuses = await self.status_repo.aget_all()
+            serializer = self.serializer(statuses, many=True)
+
+            return serializer.data
+
+        return await self.list_cache.aget_or_set(
+            await status_cache.aversion(), {}, build_list
+        )
+
+    def get_statuses_validators(self, variant):
+        return Validators(
+            etag=build_etag("statuses", status_cache.version(), *variant)
+        )
+
+    async def aget_statuses_validators(self, variant):
+        version = await status_cache.aversion()
+
+        return Validators(etag=build_etag("statuses", version, *variant))
+
+    def get_status_validators(self, pk, variant):
+        return Validators(
+            etag=build_etag("status", pk, status_cache.version(), *variant)
+        )
+
+    async def aget_status_validators(self, pk, variant):
+        version = await status_cache.aversion()
+
+        return Validators(etag=build_etag("status", pk, version, *variant))
 
     def get_status_by_pk(self, pk):
         status = self.status_repo.get_by_pk(pk=pk)
@@ -20,6 +58,12 @@ class StatusService:
 
         return serializer.data
 
+    async def aget_status_by_pk(self, pk):
+        status = await self.status_repo.aget_by_pk(pk=pk)
+        serializer = self.serializer(status)
+
+        return serializer.data
+
     def get_status_by_name(self, name):
         status = self.status_repo.get_by_name(name=name)
         serializer = self.serializer(status)
@@ -0,0 +1,45 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.categories_statuses.lookup_cache import (
+    category_cache,
+    status_cache,
+)
+from apps.categories_statuses.models import (
+    Category,
+    Status,
+)
+from apps.core.events import publish_event
+
+
+@receiver([post_save, post_delete], sender=Category)
+def invalidate_category_cache(sender, **kwargs):
+    transaction.on_commit(category_cache.invalidate)
+
+
+@receiver([post_save, post_delete], sender=Status)
+def invalidate_status_cache(sender, **kwargs):
+    transaction.on_commit(status_cache.invalidate)
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_save, sender=Status)
+def publish_lookup_saved_event(sender, instance, created, **kwargs):
+    publish_event(
+        sender._meta.model_name,
+        action="created" if created else "updated",
+        id=instance.pk,
+        name=instance.name
+    )
+
+
+@receiver(post_delete, sender=Category)
+@receiver(post_delete, sender=Status)
+def publish_lookup_deleted_event(sender, instance, **kwargs):
+    publish_event(
+        sender._meta.model_name,
+        action="deleted",
+        id=instance.pk,
+        name=instance.name
+    )
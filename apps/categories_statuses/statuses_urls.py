@@ -1,12 +1,29 @@
+from django.conf import settings
 from django.urls import path
 
+from apps.categories_statuses.controllers.async_controllers import (
+    AsyncListStatusesView,
+    AsyncRetrieveStatusView,
+)
 from apps.categories_statuses.controllers.status_controllers import (
     ListStatusesAPIView,
     RetrieveStatusAPIView
 )
+from apps.core.async_views import async_or_sync_view
+
 
+if settings.ASYNC_API_VIEWS:
+    list_view = async_or_sync_view(
+        AsyncListStatusesView, ListStatusesAPIView.as_view()
+    )
+    retrieve_view = async_or_sync_view(
+        AsyncRetrieveStatusView, RetrieveStatusAPIView.as_view()
+    )
+else:
+    list_view = ListStatusesAPIView.as_view()
+    retrieve_view = RetrieveStatusAPIView.as_view()
 
 urlpatterns = [
-    path("", ListStatusesAPIView.as_view()),
-    path("<int:status_id>/", RetrieveStatusAPIView.as_view()),
+    path("", list_view),
+    path("<int:status_id>/", retrieve_view),
 ]
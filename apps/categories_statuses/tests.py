@@ -1,3 +1,92 @@
-from django.test import TestCase
+from django.test import TestCase, override_settings
 
-# Create your tests here.
+from apps.categories_statuses.models import Category, Status
+from apps.core.db_routing import STICKY_COOKIE
+from apps.tasks.models import Task
+
+
+@override_settings(VERSIONS_SHARED=True)
+class LookupConditionalGetTestCase(TestCase):
+    def setUp(self):
+        # committed writes bump the versions the validators are built from
+        with self.captureOnCommitCallbacks(execute=True):
+            self.category = Category.objects.create(name="work")
+            self.status = Status.objects.create(name="open")
+        # replica reads get no validators; read the primary even when a
+        # replica is configured
+        self.client.cookies[STICKY_COOKIE] = "1"
+
+    def assertRevalidatedUntilRenamed(self, url, obj):
+        first = self.client.get(url)
+        unchanged = self.client.get(url, HTTP_IF_NONE_MATCH=first["ETag"])
+        with self.captureOnCommitCallbacks(execute=True):
+            obj.name = "renamed"
+            obj.save()
+        changed = self.client.get(url, HTTP_IF_NONE_MATCH=first["ETag"])
+
+        self.assertEqual(unchanged.status_code, 304)
+        self.assertEqual(changed.status_code, 200)
+        self.assertNotEqual(changed["ETag"], first["ETag"])
+        self.assertIn("renamed", changed.content.decode())
+
+    def test_statuses_list(self):
+        self.assertRevalidatedUntilRenamed("/statuses/", self.status)
+
+    def test_category_detail(self):
+        self.assertRevalidatedUntilRenamed(
+            f"/categories/{self.category.id}/", self.category
+        )
+
+    def test_status_detail(self):
+        self.assertRevalidatedUntilRenamed(
+            f"/statuses/{self.status.id}/", self.status
+        )
+
+
+@override_settings(VERSIONS_SHARED=True)
+class LookupCacheInvalidationTestCase(TestCase):
+    def setUp(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.category = Category.objects.create(name="work")
+            self.status = Status.objects.create(name="open")
+            Task.objects.create(
+                title="task", category=self.category, status=self.status
+            )
+        # the stats render names from the in-process lookup caches
+        self.client.get("/tasks/stats/")
+
+    def stats_names(self, group):
+        return {
+            row["name"]: row["count"]
+            for row in self.client.get("/tasks/stats/").json()[group]
+            if row["id"] is not None
+        }
+
+    def assertWritesReachTheStats(self, url, obj, group):
+        with self.captureOnCommitCallbacks(execute=True):
+            created = self.client.post(
+                url, {"name": "added"}, content_type="application/json"
+            )
+        self.assertEqual(created.status_code, 201)
+        self.assertEqual(self.stats_names(group), {obj.name: 1, "added": 0})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            renamed = self.client.put(
+                f"{url}{obj.id}/", {"name": "renamed"},
+                content_type="application/json"
+            )
+        self.assertEqual(renamed.status_code, 202)
+        self.assertEqual(self.stats_names(group), {"renamed": 1, "added": 0})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            deleted = self.client.delete(f"{url}{created.json()['id']}/")
+        self.assertEqual(deleted.status_code, 200)
+        self.assertEqual(self.stats_names(group), {"renamed": 1})
+
+    def test_category_writes(self):
+        self.assertWritesReachTheStats(
+            "/categories/", self.category, "by_category"
+        )
+
+    def test_status_writes(self):
+        self.assertWritesReachTheStats("/statuses/", self.status, "by_status")
@@ -0,0 +1,18 @@
+from django.apps import AppConfig
+from django.conf import settings
+from django.db.backends.signals import connection_created
+
+
+class CoreConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "apps.core"
+
+    def ready(self):
+        if settings.PERF_PROFILING:
+            from apps.core.perf import (
+                install_query_recorder,
+                install_serializer_recorder,
+            )
+
+            connection_created.connect(install_query_recorder)
+            install_serializer_recorder()
@@ -0,0 +1,98 @@
+import hashlib
+from datetime import datetime
+from typing import NamedTuple
+
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+
+from apps.core.db_routing import replica_reads_active
+from apps.core.versions import versions_are_shared
+
+
+class Validators(NamedTuple):
+    etag: str
+    last_modified: datetime | None = None
+
+
+def build_etag(*parts):
+    """
+    Builds a strong ETag from the parts that identify a representation.
+
+    Args:
+        parts: Version counters, ids, timestamps and the response variant.
+
+    Returns:
+        str: Quoted ETag value.
+    """
+    raw = ":".join(str(part) for part in parts).encode()
+
+    return f'"{hashlib.md5(raw, usedforsecurity=False).hexdigest()}"'
+
+
+def validators_apply():
+    """
+    Tells whether version-based validators describe the response of
+    the current request. They don't while the versions are per process,
+    nor while reads go to the replica: the version is the primary's,
+    and a body read from a lagging replica would be cached by the
+    client under it and answered with 304 after the replica caught up.
+    """
+    return versions_are_shared() and not replica_reads_active()
+
+
+def response_variant(request):
+    """
+    Returns what, besides the data itself, shapes the response body:
+    the full path with its query string and the negotiated format
+    (always JSON for plain Django requests served by async views).
+    """
+    renderer = getattr(request, "accepted_renderer", None)
+
+    return request.get_full_path(), getattr(renderer, "format", "json")
+
+
+def get_not_modified_response(request, validators):
+    """
+    Evaluates If-None-Match / If-Modified-Since (and If-Match /
+    If-Unmodified-Since) against the validators.
+
+    The validators come from the version counters, so nothing is
+    evaluated while those are per process (``versions_are_shared()``)
+    or while the body may come from a lagging replica (see
+    ``validators_apply()``).
+
+    Returns:
+        HttpResponse | None: A 304 (or 412) response if the client copy
+        can be reused, otherwise None and the view builds the payload.
+    """
+    if not validators_apply():
+        return None
+
+    last_modified = None
+
+    if validators.last_modified is not None:
+        last_modified = int(validators.last_modified.timestamp())
+
+    return get_conditional_response(
+        request,
+        etag=validators.etag,
+        last_modified=last_modified
+    )
+
+
+def set_validator_headers(response, validators):
+    """
+    Adds the ETag and Last-Modified headers to a response, unless
+    ``validators_apply()`` says they would not describe its body.
+    """
+    if validators is None or not validators_apply():
+        return response
+
+    response["ETag"] = validators.etag
+
+    if validators.last_modified is not None:
+        response["Last-Modified"] = http_date(
+            validators.last_modified.timestamp()
+        )
+
+    return response
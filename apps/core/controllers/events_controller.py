@@ -0,0 +1,73 @@
+import asyncio
+
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.http import StreamingHttpResponse
+from django.views import View
+
+from apps.core.async_views import json_response
+from apps.core.error_messages import (
+    EVENTS_NEED_ASGI_ERROR,
+    UNKNOWN_EVENT_TYPES_ERROR,
+)
+from apps.core.events import broker, format_event
+
+EVENT_TYPES = {"task", "category", "status"}
+
+
+class EventStreamController(View):
+    """
+    Server-sent events stream of task, category and status changes
+    (see apps.core.events); ``?types=task,status`` narrows it down.
+    Needs the ASGI server (config.asgi): WSGI servers and runserver
+    would consume the endless stream in one worker and never answer, so
+    they get a 501.
+    """
+    async def get(self, request, *args, **kwargs):
+        if not isinstance(request, ASGIRequest):
+            return json_response({"detail": EVENTS_NEED_ASGI_ERROR}, status=501)
+
+        types = {
+            name.strip()
+            for name in request.GET.get("types", "").split(",")
+            if name.strip()
+        }
+        unknown = types - EVENT_TYPES
+        if unknown:
+            return json_response(
+                {"types": [
+                    UNKNOWN_EVENT_TYPES_ERROR.format(types=", ".join(sorted(unknown)))
+                ]},
+                status=400
+            )
+
+        subscription = broker.subscribe(types or None)
+
+        return StreamingHttpResponse(
+            self.stream(subscription),
+            content_type="text/event-stream",
+            headers={
+                "Cache-Control": "no-cache",
+                # nginx would otherwise buffer the stream
+                "X-Accel-Buffering": "no",
+            }
+        )
+
+    @staticmethod
+    async def stream(subscription):
+        try:
+            yield b"retry: %d\n\n" % settings.EVENTS_RETRY_MS
+            while True:
+                try:
+                    event = await asyncio.wait_for(
+                        subscription.get(),
+                        timeout=settings.EVENTS_HEARTBEAT_SECONDS
+                    )
+                except TimeoutError:
+                    # keeps proxies from closing an idle connection
+                    yield b": keepalive\n\n"
+                    continue
+
+                yield format_event(event)
+        finally:
+            broker.unsubscribe(subscription)
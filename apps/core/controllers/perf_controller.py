@@ -0,0 +1,32 @@
+from rest_framework.permissions import IsAdminUser
+from rest_framework.views import APIView
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework import status
+
+from apps.core.perf import build_report, registry
+
+
+class PerfReportController(APIView):
+    """
+    Per-route request cost of all workers (see apps.core.perf).
+    ``?sort=`` picks the report column to sort by; DELETE resets
+    the collected data.
+    """
+    permission_classes = [IsAdminUser]
+
+    def get(self, request: Request, *args, **kwargs):
+        report = build_report(
+            registry.collect(),
+            sort=request.query_params.get("sort", "wall_p95")
+        )
+
+        return Response(
+            status=status.HTTP_200_OK,
+            data=report
+        )
+
+    def delete(self, request: Request, *args, **kwargs):
+        registry.reset()
+
+        return Response(status=status.HTTP_204_NO_CONTENT)
@@ -0,0 +1,149 @@
+"""
+Read-replica routing.
+
+Safe (GET/HEAD/OPTIONS) requests read the task, category, status and
+subtask tables from the ``replica`` database; everything else, and any
+code running outside a request (commands, shells), uses the primary.
+A client that writes gets a short-lived cookie that pins its reads to
+the primary for ``REPLICA_STICKY_SECONDS``, so it reads its own writes
+while the replica catches up.
+"""
+import contextlib
+import contextvars
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import DEFAULT_DB_ALIAS, connections
+
+REPLICA_DB_ALIAS = "replica"
+STICKY_COOKIE = "read_primary"
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+_read_alias = contextvars.ContextVar("read_db_alias", default=DEFAULT_DB_ALIAS)
+
+
+def replica_reads_active():
+    """
+    Tells whether reads of the current request may go to the replica.
+    """
+    return _read_alias.get() == REPLICA_DB_ALIAS
+
+
+@contextlib.contextmanager
+def use_primary():
+    """
+    Sends the reads of the block to the primary.
+    """
+    token = _read_alias.set(DEFAULT_DB_ALIAS)
+    try:
+        yield
+    finally:
+        _read_alias.reset(token)
+
+
+class ReplicaRouter:
+    """
+    Sends reads of the API apps to the replica when the current request
+    allows it (see ``ReplicaStickinessMiddleware``), all writes to the
+    primary.
+    """
+    replica_apps = {"tasks", "categories_statuses", "subtasks"}
+
+    def db_for_read(self, model, **hints):
+        # related objects come from where the instance came from
+        instance = hints.get("instance")
+        if instance is not None and instance._state.db:
+            return instance._state.db
+
+        if (
+            model._meta.app_label in self.replica_apps
+            and replica_reads_active()
+            and not self._replica_is_primary()
+        ):
+            return REPLICA_DB_ALIAS
+
+        return DEFAULT_DB_ALIAS
+
+    @staticmethod
+    def _replica_is_primary():
+        # a test mirror points at the primary's database; a second
+        # connection to it would not see the test's open transaction
+        replica = connections.settings.get(REPLICA_DB_ALIAS)
+        if replica is None:
+            return False
+
+        primary = connections.settings[DEFAULT_DB_ALIAS]
+        return all(
+            replica.get(key) == primary.get(key)
+            for key in ("ENGINE", "HOST", "PORT", "NAME")
+        )
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # both aliases hold the same data
+        aliases = {DEFAULT_DB_ALIAS, REPLICA_DB_ALIAS}
+        if obj1._state.db in aliases and obj2._state.db in aliases:
+            return True
+        return None
+
+
+class ReplicaStickinessMiddleware:
+    """
+    Lets safe requests read from the replica, unless the client wrote
+    recently: unsafe requests read the primary and set the
+    ``read_primary`` cookie for ``REPLICA_STICKY_SECONDS``. Enabled
+    when a replica is configured; works in sync and async stacks.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.REPLICA_READS:
+            raise MiddlewareNotUsed
+
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        token = _read_alias.set(self._read_alias(request))
+        try:
+            response = self.get_response(request)
+        finally:
+            _read_alias.reset(token)
+
+        return self._pin(request, response)
+
+    async def __acall__(self, request):
+        token = _read_alias.set(self._read_alias(request))
+        try:
+            response = await self.get_response(request)
+        finally:
+            _read_alias.reset(token)
+
+        return self._pin(request, response)
+
+    @staticmethod
+    def _read_alias(request):
+        if request.method in SAFE_METHODS and STICKY_COOKIE not in request.COOKIES:
+            return REPLICA_DB_ALIAS
+        return DEFAULT_DB_ALIAS
+
+    @staticmethod
+    def _pin(request, response):
+        if request.method not in SAFE_METHODS:
+            response.set_cookie(
+                STICKY_COOKIE,
+                "1",
+                max_age=settings.REPLICA_STICKY_SECONDS,
+                httponly=True,
+                samesite="Lax"
+            )
+
+        return response
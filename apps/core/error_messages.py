@@ -0,0 +1,2 @@
+EVENTS_NEED_ASGI_ERROR = "The event stream is only served by the ASGI server"
+UNKNOWN_EVENT_TYPES_ERROR = "Unknown event types: {types}"
@@ -0,0 +1,192 @@
+"""
+Live change events for the ``/events/`` server-sent events stream.
+
+Writes call ``publish_event()``, which hands the event to the
+configured backend once the transaction commits. The backend delivers
+it to the ``EventBroker`` of every worker: ``LocalEventBackend`` only
+to the one of this process, ``RedisEventBackend`` to all of them
+through a pub/sub channel. The broker fans every event out to the
+bounded queues of the open streams of its process; an idle stream is
+just a coroutine waiting on its queue.
+"""
+import asyncio
+import functools
+import logging
+import threading
+
+import orjson
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db import transaction
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+# sent instead of the dropped events when a stream falls too far behind
+OVERFLOW_EVENT = {"type": "overflow"}
+
+
+class Subscription:
+    """
+    Queue of the events one stream has not sent yet.
+
+    Attributes:
+        types (set[str] | None): Event types to receive, all if None.
+    """
+    def __init__(self, types=None, size=None):
+        self.types = types
+        self.queue = asyncio.Queue(size or settings.EVENTS_QUEUE_SIZE)
+
+    def offer(self, event):
+        if self.types and event["type"] not in self.types:
+            return
+
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # the client has to resync anyway, so the backlog goes
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(OVERFLOW_EVENT)
+
+    async def get(self):
+        return await self.queue.get()
+
+
+class EventBroker:
+    """
+    Per-process fan-out of events to the subscriptions of the open
+    streams. ``dispatch()`` may be called from any thread; each event
+    loop gets one wake-up per event, however many streams it serves.
+    While a loop has subscribers it also runs the backend listener, if
+    the backend has one.
+    """
+    def __init__(self):
+        self._subscriptions = {}
+        self._listeners = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, types=None):
+        """
+        Registers a subscription on the running event loop.
+        """
+        loop = asyncio.get_running_loop()
+        subscription = Subscription(types)
+
+        with self._lock:
+            self._subscriptions.setdefault(loop, set()).add(subscription)
+
+        if loop not in self._listeners:
+            listen = getattr(get_backend(), "listen", None)
+            if listen is not None:
+                self._listeners[loop] = loop.create_task(listen(self.dispatch))
+
+        return subscription
+
+    def unsubscribe(self, subscription):
+        loop = asyncio.get_running_loop()
+
+        with self._lock:
+            subscriptions = self._subscriptions.get(loop, set())
+            subscriptions.discard(subscription)
+            if not subscriptions:
+                self._subscriptions.pop(loop, None)
+
+        if loop not in self._subscriptions and loop in self._listeners:
+            self._listeners.pop(loop).cancel()
+
+    def dispatch(self, event):
+        with self._lock:
+            targets = [
+                (loop, tuple(subscriptions))
+                for loop, subscriptions in self._subscriptions.items()
+            ]
+
+        for loop, subscriptions in targets:
+            try:
+                loop.call_soon_threadsafe(self._fan_out, subscriptions, event)
+            except RuntimeError:
+                # the loop was closed under its subscriptions
+                with self._lock:
+                    self._subscriptions.pop(loop, None)
+
+    @staticmethod
+    def _fan_out(subscriptions, event):
+        for subscription in subscriptions:
+            subscription.offer(event)
+
+
+broker = EventBroker()
+
+
+class LocalEventBackend:
+    """
+    Delivers events to the broker of this process only; a stand-in for
+    single-worker and development setups.
+    """
+    def publish(self, event):
+        broker.dispatch(event)
+
+
+class RedisEventBackend:
+    """
+    Delivers events to the brokers of every worker through a Redis
+    pub/sub channel (``EVENTS_REDIS_URL``). Needs the ``redis`` package.
+    """
+    channel = "events"
+    reconnect_delay = 1
+
+    def __init__(self):
+        try:
+            import redis
+        except ImportError as err:
+            raise ImproperlyConfigured(
+                "RedisEventBackend requires the redis package"
+            ) from err
+
+        self.url = settings.EVENTS_REDIS_URL
+        self.client = redis.Redis.from_url(self.url)
+
+    def publish(self, event):
+        # this process gets it back through its own listener
+        self.client.publish(self.channel, orjson.dumps(event))
+
+    async def listen(self, dispatch):
+        import redis.asyncio
+
+        while True:
+            try:
+                client = redis.asyncio.Redis.from_url(self.url)
+                async with client.pubsub() as pubsub:
+                    await pubsub.subscribe(self.channel)
+                    async for message in pubsub.listen():
+                        if message["type"] == "message":
+                            dispatch(orjson.loads(message["data"]))
+            except redis.RedisError:
+                logger.exception("event listener lost its connection")
+                await asyncio.sleep(self.reconnect_delay)
+
+
+@functools.cache
+def get_backend():
+    return import_string(settings.EVENTS_BACKEND)()
+
+
+def publish_event(event_type, **data):
+    """
+    Publishes an event once the current transaction commits (right
+    away outside of one); nothing is sent for rolled back writes.
+    """
+    event = {"type": event_type, **data}
+
+    # a failing backend must not fail the committed request
+    transaction.on_commit(lambda: get_backend().publish(event), robust=True)
+
+
+def format_event(event):
+    """
+    Encodes an event as a server-sent events message.
+    """
+    return b"event: %s\ndata: %s\n\n" % (
+        event["type"].encode(), orjson.dumps(event)
+    )
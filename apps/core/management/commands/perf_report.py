@@ -0,0 +1,62 @@
+import json
+
+from django.core.management.base import BaseCommand
+
+from apps.core.perf import build_report, registry
+
+COLUMNS = (
+    ("route", "{:<45}"),
+    ("count", "{:>7}"),
+    ("wall_p50", "{:>9}"),
+    ("wall_p95", "{:>9}"),
+    ("wall_p99", "{:>9}"),
+    ("queries_avg", "{:>12}"),
+    ("queries_max", "{:>12}"),
+    ("sql_ms_avg", "{:>11}"),
+    ("serialize_ms_avg", "{:>17}"),
+    ("render_ms_avg", "{:>14}"),
+    ("bytes_avg", "{:>10}"),
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Prints the per-route request cost collected by the profiling "
+        "middleware (PERF_PROFILING) of every worker sharing the cache."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sort",
+            default="wall_p95",
+            choices=[name for name, _ in COLUMNS[1:]],
+            help="Column to sort by, descending.",
+        )
+        parser.add_argument(
+            "--json",
+            action="store_true",
+            help="Print the report as JSON.",
+        )
+        parser.add_argument(
+            "--reset",
+            action="store_true",
+            help="Drop the collected data after printing it.",
+        )
+
+    def handle(self, *args, **options):
+        report = build_report(registry.collect(), sort=options["sort"])
+
+        if options["json"]:
+            self.stdout.write(json.dumps(report, indent=2))
+        else:
+            self.stdout.write(
+                " ".join(fmt.format(name) for name, fmt in COLUMNS)
+            )
+            for row in report:
+                self.stdout.write(" ".join(
+                    fmt.format("-" if row[name] is None else row[name])
+                    for name, fmt in COLUMNS
+                ))
+
+        if options["reset"]:
+            registry.reset()
@@ -0,0 +1,382 @@
+import contextlib
+import contextvars
+import os
+import socket
+import threading
+import time
+from bisect import bisect_left
+
+from asgiref.sync import (
+    iscoroutinefunction,
+    markcoroutinefunction,
+    sync_to_async,
+)
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import MiddlewareNotUsed
+
+# upper bounds of the histogram buckets of every recorded metric; one
+# more bucket catches everything above the last bound
+HISTOGRAM_BOUNDS = {
+    "wall_ms": (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000),
+    "queries": (0, 1, 2, 3, 5, 10, 20, 50, 100, 200),
+    "sql_ms": (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000),
+    "serialize_ms": (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500),
+    "render_ms": (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500),
+    "bytes": (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304),
+}
+
+_WORKERS_KEY = "perf:workers"
+_EPOCH_KEY = "perf:epoch"
+_SNAPSHOT_TTL = 24 * 60 * 60
+_NO_EPOCH = object()
+
+_current_sample = contextvars.ContextVar("perf_sample", default=None)
+
+
+def _empty_histogram(metric):
+    return {
+        "buckets": [0] * (len(HISTOGRAM_BOUNDS[metric]) + 1),
+        "sum": 0,
+        "max": 0,
+    }
+
+
+def percentile(histogram, metric, fraction):
+    """
+    Estimates a percentile as the upper bound of the bucket it falls
+    into (the maximum for the overflow bucket).
+    """
+    total = sum(histogram["buckets"])
+    if not total:
+        return None
+
+    rank = fraction * total
+    seen = 0
+    bounds = HISTOGRAM_BOUNDS[metric]
+
+    for index, count in enumerate(histogram["buckets"]):
+        seen += count
+        if seen >= rank:
+            if index < len(bounds):
+                return round(min(bounds[index], histogram["max"]), 2)
+            break
+
+    return round(histogram["max"], 2)
+
+
+def merge_snapshots(snapshots):
+    """
+    Adds up route snapshots (of several workers) into one.
+    """
+    merged = {}
+
+    for snapshot in snapshots:
+        for route, stats in snapshot.items():
+            target = merged.setdefault(route, {"count": 0, "metrics": {}})
+            target["count"] += stats["count"]
+
+            for metric, histogram in stats["metrics"].items():
+                into = target["metrics"].setdefault(
+                    metric, _empty_histogram(metric)
+                )
+                into["buckets"] = [
+                    a + b for a, b in zip(into["buckets"], histogram["buckets"])
+                ]
+                into["sum"] += histogram["sum"]
+                into["max"] = max(into["max"], histogram["max"])
+
+    return merged
+
+
+def build_report(snapshot, sort="wall_p95"):
+    """
+    Flattens a snapshot into one row per route, most expensive first.
+
+    Args:
+        snapshot (dict): Merged route snapshot.
+        sort (str): Row key to sort by, descending.
+
+    Returns:
+        list[dict]: Report rows.
+    """
+    rows = []
+
+    for route, stats in snapshot.items():
+        metrics = stats["metrics"]
+        count = stats["count"]
+
+        def average(metric):
+            if metric not in metrics:
+                return None
+            return round(metrics[metric]["sum"] / count, 2)
+
+        wall = metrics["wall_ms"]
+        rows.append({
+            "route": route,
+            "count": count,
+            "wall_p50": percentile(wall, "wall_ms", 0.50),
+            "wall_p95": percentile(wall, "wall_ms", 0.95),
+            "wall_p99": percentile(wall, "wall_ms", 0.99),
+            "wall_max": round(wall["max"], 2),
+            "queries_avg": average("queries"),
+            "queries_max": metrics["queries"]["max"],
+            "sql_ms_avg": average("sql_ms"),
+            "serialize_ms_avg": average("serialize_ms"),
+            "render_ms_avg": average("render_ms"),
+            "bytes_avg": average("bytes"),
+        })
+
+    return sorted(rows, key=lambda row: row.get(sort) or 0, reverse=True)
+
+
+class PerfRegistry:
+    """
+    In-memory per-route histograms of request cost for this process.
+
+    Every worker periodically flushes its snapshot to the shared
+    Django cache, where ``collect()`` (the ``/_perf/`` endpoint and the
+    ``perf_report`` command) adds them up. A reset bumps an epoch in
+    the cache and each worker drops its data on its next flush.
+    """
+    def __init__(self):
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self._routes = {}
+        self._lock = threading.Lock()
+        self._epoch = _NO_EPOCH
+        self._flushed_at = time.monotonic()
+
+    def record(self, route, sample):
+        with self._lock:
+            stats = self._routes.setdefault(route, {"count": 0, "metrics": {}})
+            stats["count"] += 1
+
+            for metric, value in sample.items():
+                if value is None:
+                    continue
+                histogram = stats["metrics"].setdefault(
+                    metric, _empty_histogram(metric)
+                )
+                bucket = bisect_left(HISTOGRAM_BOUNDS[metric], value)
+                histogram["buckets"][bucket] += 1
+                histogram["sum"] += value
+                histogram["max"] = max(histogram["max"], value)
+
+    def snapshot(self):
+        with self._lock:
+            return merge_snapshots([self._routes])
+
+    def flush_due(self):
+        return time.monotonic() - self._flushed_at >= settings.PERF_FLUSH_INTERVAL
+
+    def flush(self):
+        self._flushed_at = time.monotonic()
+        epoch = cache.get(_EPOCH_KEY)
+
+        if epoch != self._epoch:
+            with self._lock:
+                # a worker joining keeps its data, a reset drops it
+                if self._epoch is not _NO_EPOCH:
+                    self._routes = {}
+                self._epoch = epoch
+
+        cache.set(
+            self._snapshot_key(self.worker_id), self.snapshot(), _SNAPSHOT_TTL
+        )
+
+        workers = cache.get(_WORKERS_KEY) or {}
+        now = time.time()
+        workers = {
+            worker: seen for worker, seen in workers.items()
+            if now - seen < _SNAPSHOT_TTL
+        }
+        workers[self.worker_id] = now
+        cache.set(_WORKERS_KEY, workers, _SNAPSHOT_TTL)
+
+    def collect(self):
+        """
+        Returns the merged snapshot of every worker that flushed
+        recently, this one included.
+        """
+        self.flush()
+        workers = cache.get(_WORKERS_KEY) or {}
+        snapshots = cache.get_many(
+            [self._snapshot_key(worker) for worker in workers]
+        )
+
+        return merge_snapshots(snapshots.values())
+
+    def reset(self):
+        cache.set(_EPOCH_KEY, time.time_ns(), None)
+        workers = cache.get(_WORKERS_KEY) or {}
+        cache.delete_many([self._snapshot_key(worker) for worker in workers])
+        cache.delete(_WORKERS_KEY)
+        self.flush()
+
+    @staticmethod
+    def _snapshot_key(worker_id):
+        return f"perf:worker:{worker_id}"
+
+
+registry = PerfRegistry()
+
+
+def record_query(execute, sql, params, many, context):
+    """
+    Database execute wrapper counting the queries and SQL time of the
+    request being profiled, if any.
+    """
+    sample = _current_sample.get()
+
+    if sample is None:
+        return execute(sql, params, many, context)
+
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        sample["queries"] += 1
+        sample["sql_ms"] += (time.perf_counter() - start) * 1000
+
+
+def install_query_recorder(sender, connection, **kwargs):
+    # connection_created receiver; wrappers survive reconnects
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
+
+
+@contextlib.contextmanager
+def record_serialization():
+    """
+    Adds the time spent in the block to the serialization time of the
+    request being profiled, if any. Nested blocks count once, and the
+    SQL of lazy querysets evaluated inside is counted as well (it is
+    also in ``sql_ms``).
+    """
+    sample = _current_sample.get()
+
+    if sample is None or sample["serializing"]:
+        yield
+        return
+
+    sample["serializing"] = True
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        sample["serializing"] = False
+        sample["serialize_ms"] = (
+            (sample["serialize_ms"] or 0)
+            + (time.perf_counter() - start) * 1000
+        )
+
+
+def install_serializer_recorder():
+    """
+    Times ``.data`` of every DRF serializer; Serializer and
+    ListSerializer both build theirs through BaseSerializer.data.
+    """
+    from rest_framework.serializers import BaseSerializer
+
+    data = BaseSerializer.data
+    if getattr(data.fget, "records_serialization", False):
+        return
+
+    def recorded_data(serializer):
+        with record_serialization():
+            return data.fget(serializer)
+
+    recorded_data.records_serialization = True
+    BaseSerializer.data = property(recorded_data)
+
+
+class PerfMiddleware:
+    """
+    Records wall time, SQL queries, SQL time, serialization time
+    (``record_serialization()``), render time and response size of
+    every request under its resolved route (``GET tasks/<int:
+    task_id>/``). Enabled by ``PERF_PROFILING``; works in sync and
+    async stacks since the per-request sample lives in a contextvar,
+    which ``sync_to_async`` carries to the ORM thread.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.PERF_PROFILING:
+            raise MiddlewareNotUsed
+
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        sample, token, start = self._start()
+        try:
+            response = self.get_response(request)
+        finally:
+            _current_sample.reset(token)
+
+        self._finish(request, response, sample, start)
+        if registry.flush_due():
+            registry.flush()
+
+        return response
+
+    async def __acall__(self, request):
+        sample, token, start = self._start()
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current_sample.reset(token)
+
+        self._finish(request, response, sample, start)
+        if registry.flush_due():
+            await sync_to_async(registry.flush)()
+
+        return response
+
+    def process_template_response(self, request, response):
+        # DRF responses are rendered right after this hook returns
+        sample = _current_sample.get()
+
+        if sample is not None:
+            render_start = time.perf_counter()
+
+            def record_render(rendered):
+                sample["render_ms"] = (time.perf_counter() - render_start) * 1000
+
+            response.add_post_render_callback(record_render)
+
+        return response
+
+    @staticmethod
+    def _start():
+        sample = {
+            "queries": 0,
+            "sql_ms": 0.0,
+            "serialize_ms": None,
+            "serializing": False,
+            "render_ms": None,
+        }
+        token = _current_sample.set(sample)
+
+        return sample, token, time.perf_counter()
+
+    @staticmethod
+    def _finish(request, response, sample, start):
+        match = request.resolver_match
+        route = match.route if match is not None else "<unresolved>"
+        size = None if response.streaming else len(response.content)
+
+        registry.record(f"{request.method} {route}", {
+            "wall_ms": (time.perf_counter() - start) * 1000,
+            "queries": sample["queries"],
+            "sql_ms": sample["sql_ms"],
+            "serialize_ms": sample["serialize_ms"],
+            "render_ms": sample["render_ms"],
+            "bytes": size,
+        })
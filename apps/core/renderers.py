@@ -0,0 +1,68 @@
+"""
+orjson-backed drop-ins for DRF's JSONRenderer and JSONParser.
+
+The output is what the stock renderer produces with the default
+settings (compact, unescaped unicode, U+2028/U+2029 escaped): dates,
+datetimes, decimals and the other types orjson would format differently
+are handed to DRF's own encoder. Indented output, non-default JSON
+settings and payloads orjson cannot encode (integers beyond 64 bits) go
+through the stock renderer. Two differences are left: NaN and Infinity
+render as null instead of failing the request, and floats Python writes
+in exponent notation (from 1e16, below 1e-4) get orjson's shortest
+form, the same number in other text: 1e16 for 1e+16, 1e-7 for 1e-07,
+0.000025 for 2.5e-05. No model of this project has a float field.
+"""
+import codecs
+
+import orjson
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+_drf_default = JSONEncoder().default
+
+
+class OrjsonRenderer(JSONRenderer):
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        renderer_context = renderer_context or {}
+        if (
+            self.get_indent(accepted_media_type, renderer_context)
+            or not (self.compact and self.strict and self.ensure_ascii is False)
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(data, default=_drf_default, option=ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # valid JSON but not valid JavaScript; escaped like DRF does
+        if b"\xe2\x80\xa8" in ret or b"\xe2\x80\xa9" in ret:
+            ret = ret.replace(b"\xe2\x80\xa8", b"\\u2028")
+            ret = ret.replace(b"\xe2\x80\xa9", b"\\u2029")
+
+        return ret
+
+
+class OrjsonParser(JSONParser):
+    renderer_class = OrjsonRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+
+        if not self.strict or codecs.lookup(encoding).name != "utf-8":
+            return super().parse(stream, media_type, parser_context)
+
+        # orjson, like a strict JSONParser, rejects NaN and Infinity
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError("JSON parse error - %s" % str(exc))
@@ -0,0 +1,110 @@
+import hashlib
+import json
+
+from django.conf import settings
+from django.core.cache import caches
+
+from apps.core.db_routing import replica_reads_active
+from apps.core.versions import versions_are_shared
+
+_MISSING = object()
+
+
+def _normalize(value):
+    # QueryDicts keep every value of a repeated parameter
+    if hasattr(value, "lists"):
+        return sorted(value.lists())
+    return value
+
+
+class ResponseCache:
+    """
+    Cache of serialized read responses in the ``responses`` cache.
+
+    Keys contain the current version of the resource, so a write only
+    has to bump the version (see ``apps.core.versions``) and every
+    entry built from the old data stops being read; stale entries are
+    never deleted, they just expire. With a local backend each worker
+    fills its own copy, which is still never stale as long as the
+    versions live in the shared default cache; without shared versions
+    (see ``versions_are_shared()``) nothing is cached.
+
+    Attributes:
+        namespace (str): Name of the cached resource.
+        timeout (int): Lifetime of an entry in seconds, defaults to
+        ``RESPONSE_CACHE_TIMEOUT``.
+    """
+    alias = "responses"
+
+    def __init__(self, namespace, timeout=None):
+        self.namespace = namespace
+        self.timeout = timeout
+
+    @property
+    def cache(self):
+        return caches[self.alias]
+
+    def make_key(self, version, params):
+        """
+        Builds the key of one response.
+
+        Args:
+            version (object): Current version(s) of the data the
+            response is built from.
+            params (dict): Everything else that shapes the response.
+
+        Returns:
+            str: The cache key.
+        """
+        raw = json.dumps(
+            {name: _normalize(value) for name, value in params.items()},
+            sort_keys=True,
+            default=str,
+        )
+        digest = hashlib.md5(raw.encode(), usedforsecurity=False).hexdigest()
+
+        return f"response:{self.namespace}:{version}:{digest}"
+
+    def get_or_set(self, version, params, producer):
+        """
+        Returns the cached response, building and storing it with
+        ``producer()`` on a miss. Exceptions of the producer (404,
+        validation errors) are not cached.
+        """
+        if not versions_are_shared():
+            return producer()
+
+        key = self.make_key(version, params)
+        data = self.cache.get(key, _MISSING)
+
+        if data is _MISSING:
+            data = producer()
+            self.cache.set(key, data, timeout=self._timeout())
+
+        return data
+
+    async def aget_or_set(self, version, params, producer):
+        """
+        Async version of ``get_or_set()``; ``producer`` is a coroutine
+        function.
+        """
+        if not versions_are_shared():
+            return await producer()
+
+        key = self.make_key(version, params)
+        data = await self.cache.aget(key, _MISSING)
+
+        if data is _MISSING:
+            data = await producer()
+            await self.cache.aset(key, data, timeout=self._timeout())
+
+        return data
+
+    def _timeout(self):
+        timeout = self.timeout
+        if timeout is None:
+            timeout = settings.RESPONSE_CACHE_TIMEOUT
+
+        if replica_reads_active():
+            return min(timeout, settings.REPLICA_RESPONSE_CACHE_TIMEOUT)
+        return timeout
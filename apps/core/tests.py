@@ -0,0 +1,443 @@
+import asyncio
+import datetime
+import decimal
+import json
+import shutil
+import tempfile
+import threading
+import uuid
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import connections
+from django.http import HttpResponse
+from django.test import (
+    AsyncRequestFactory,
+    RequestFactory,
+    SimpleTestCase,
+    TestCase,
+    override_settings,
+)
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+
+from apps.categories_statuses.lookup_cache import category_cache
+from apps.categories_statuses.models import Category
+from apps.core.async_views import async_or_sync_view
+from apps.core.db_routing import (
+    REPLICA_DB_ALIAS,
+    STICKY_COOKIE,
+    ReplicaRouter,
+    ReplicaStickinessMiddleware,
+    use_primary,
+)
+from apps.core.events import (
+    OVERFLOW_EVENT,
+    EventBroker,
+    format_event,
+)
+from apps.core.perf import (
+    PerfMiddleware,
+    PerfRegistry,
+    _current_sample,
+    _empty_histogram,
+    build_report,
+    install_serializer_recorder,
+    merge_snapshots,
+    percentile,
+    record_serialization,
+)
+from apps.core.renderers import OrjsonRenderer
+from apps.core.response_cache import ResponseCache
+from apps.core.versions import versions_are_shared
+from apps.tasks.controllers.all_tasks_controller import AllTasksController
+from apps.tasks.controllers.async_tasks_controllers import (
+    AsyncAllTasksController,
+)
+from apps.tasks.models import Task
+from apps.tasks.serializers import AllTasksSerializer
+
+
+@override_settings(REPLICA_READS=True, REPLICA_STICKY_SECONDS=5)
+class ReplicaRoutingTestCase(SimpleTestCase):
+    def setUp(self):
+        self.router = ReplicaRouter()
+        self.factory = RequestFactory()
+        self.replica_settings = {**connections.settings["default"], "NAME": "replica"}
+        patcher = mock.patch.dict(
+            connections.settings, {REPLICA_DB_ALIAS: self.replica_settings}
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def read_alias(self, request, model=Task):
+        """
+        Runs the request through the middleware and returns where the
+        view would have read ``model`` from, plus the response.
+        """
+        seen = []
+
+        def view(request):
+            seen.append(self.router.db_for_read(model))
+            return HttpResponse()
+
+        response = ReplicaStickinessMiddleware(view)(request)
+
+        return seen[0], response
+
+    def test_reads_outside_requests_use_the_primary(self):
+        self.assertEqual(self.router.db_for_read(Task), "default")
+
+    def test_safe_requests_read_api_tables_from_the_replica(self):
+        alias, response = self.read_alias(self.factory.get("/tasks/"))
+
+        self.assertEqual(alias, REPLICA_DB_ALIAS)
+        self.assertNotIn(STICKY_COOKIE, response.cookies)
+
+    def test_a_replica_mirroring_the_primary_is_skipped(self):
+        self.replica_settings["NAME"] = connections.settings["default"]["NAME"]
+        alias, _ = self.read_alias(self.factory.get("/tasks/"))
+
+        self.assertEqual(alias, "default")
+
+    def test_other_apps_are_read_from_the_primary(self):
+        alias, _ = self.read_alias(self.factory.get("/tasks/"), model=User)
+
+        self.assertEqual(alias, "default")
+
+    def test_writes_pin_the_client_to_the_primary(self):
+        alias, response = self.read_alias(self.factory.post("/tasks/"))
+
+        self.assertEqual(alias, "default")
+        self.assertEqual(response.cookies[STICKY_COOKIE]["max-age"], 5)
+        self.assertEqual(self.router.db_for_write(Task), "default")
+
+        request = self.factory.get("/tasks/")
+        request.COOKIES[STICKY_COOKIE] = "1"
+        alias, _ = self.read_alias(request)
+
+        self.assertEqual(alias, "default")
+
+    def test_use_primary_overrides_the_request(self):
+        def view(request):
+            with use_primary():
+                alias = self.router.db_for_read(Task)
+            return HttpResponse(alias)
+
+        response = ReplicaStickinessMiddleware(view)(self.factory.get("/"))
+
+        self.assertEqual(response.content, b"default")
+
+
+class EventBrokerTestCase(SimpleTestCase):
+    async def test_events_reach_matching_subscriptions(self):
+        broker = EventBroker()
+        everything = broker.subscribe()
+        tasks_only = broker.subscribe({"task"})
+
+        # writes publish from worker threads
+        thread = threading.Thread(
+            target=broker.dispatch, args=({"type": "status", "id": 1},)
+        )
+        thread.start()
+        thread.join()
+        broker.dispatch({"type": "task", "id": 2})
+
+        self.assertEqual((await everything.get())["type"], "status")
+        self.assertEqual((await everything.get())["type"], "task")
+        self.assertEqual(await tasks_only.get(), {"type": "task", "id": 2})
+
+        broker.unsubscribe(everything)
+        broker.unsubscribe(tasks_only)
+
+    @override_settings(EVENTS_QUEUE_SIZE=2)
+    async def test_slow_subscription_is_told_to_resync(self):
+        broker = EventBroker()
+        subscription = broker.subscribe()
+
+        for index in range(3):
+            broker.dispatch({"type": "task", "id": index})
+        await asyncio.sleep(0)
+
+        self.assertEqual(await subscription.get(), OVERFLOW_EVENT)
+        broker.unsubscribe(subscription)
+
+    def test_format_event(self):
+        self.assertEqual(
+            format_event({"type": "task", "id": 1}),
+            b'event: task\ndata: {"type":"task","id":1}\n\n'
+        )
+
+
+class PublishEventTestCase(TestCase):
+    def test_events_are_published_on_commit(self):
+        with mock.patch("apps.core.events.get_backend") as get_backend:
+            with self.captureOnCommitCallbacks() as callbacks:
+                category = Category.objects.create(name="errands")
+
+            get_backend.return_value.publish.assert_not_called()
+            for callback in callbacks:
+                callback()
+
+        get_backend.return_value.publish.assert_called_once_with({
+            "type": "category",
+            "action": "created",
+            "id": category.id,
+            "name": "errands",
+        })
+
+
+class AsyncOrSyncViewTestCase(TestCase):
+    def setUp(self):
+        self.view = async_or_sync_view(
+            AsyncAllTasksController, AllTasksController.as_view()
+        )
+        self.factory = AsyncRequestFactory()
+
+    async def test_writes_go_through_drf_csrf_checks(self):
+        user = await User.objects.acreate(username="browser")
+        request = self.factory.post(
+            "/tasks/",
+            {"title": "forged", "description": "d", "date_started": "2030-01-01"},
+            content_type="application/json"
+        )
+        # a browser session, as SessionAuthentication sees it
+        request.user = user
+        request._dont_enforce_csrf_checks = False
+
+        response = await self.view(request)
+
+        self.assertEqual(response.status_code, 403)
+        self.assertFalse(await Task.objects.filter(title="forged").aexists())
+
+    async def test_reads_are_served_natively(self):
+        response = await self.view(self.factory.get("/tasks/"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIsInstance(response, Response)
+
+
+class SharedVersionsTestCase(TestCase):
+    def test_per_process_cache_backends_are_not_shared(self):
+        local = {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+        files = {
+            "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+            "LOCATION": tempfile.mkdtemp(),
+        }
+        self.addCleanup(shutil.rmtree, files["LOCATION"])
+
+        with override_settings(CACHES={"default": local}):
+            self.assertFalse(versions_are_shared())
+        with override_settings(CACHES={"default": local}, VERSIONS_SHARED=True):
+            self.assertTrue(versions_are_shared())
+        with override_settings(CACHES={"default": files}):
+            self.assertTrue(versions_are_shared())
+
+    def test_backends_that_store_nothing_are_not_shared(self):
+        dummy = {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}
+        # a fresh backend, not one that already kept the probe
+        local = {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "unreachable",
+        }
+
+        with override_settings(CACHES={"default": dummy}, VERSIONS_SHARED=True):
+            self.assertFalse(versions_are_shared())
+
+        with override_settings(CACHES={"default": local}, VERSIONS_SHARED=True):
+            with mock.patch.object(LocMemCache, "get", return_value=None):
+                self.assertFalse(versions_are_shared())
+            self.assertTrue(versions_are_shared())
+
+    def test_response_cache_is_off_without_shared_versions(self):
+        cache = ResponseCache("test")
+        producer = mock.Mock(return_value={"id": 1})
+
+        with override_settings(VERSIONS_SHARED=False):
+            cache.get_or_set(1, {}, producer)
+            cache.get_or_set(1, {}, producer)
+        self.assertEqual(producer.call_count, 2)
+
+        with override_settings(VERSIONS_SHARED=True):
+            cache.get_or_set(1, {}, producer)
+            cache.get_or_set(1, {}, producer)
+        self.assertEqual(producer.call_count, 3)
+
+    def test_lookup_cache_reloads_without_shared_versions(self):
+        category = Category.objects.create(name="work")
+        category_cache.invalidate()
+        # a write in another worker: the local version does not move
+        rename = Category.objects.filter(id=category.id).update
+
+        with override_settings(VERSIONS_SHARED=True):
+            category_cache.get_by_id(category.id)
+            rename(name="office")
+            self.assertEqual(category_cache.get_by_id(category.id).name, "work")
+
+        with override_settings(VERSIONS_SHARED=False):
+            self.assertEqual(category_cache.get_by_id(category.id).name, "office")
+            rename(name="home")
+            self.assertEqual(category_cache.get_by_id(category.id).name, "home")
+
+
+class PerfHistogramTestCase(SimpleTestCase):
+    def test_samples_fill_buckets_and_percentiles(self):
+        registry = PerfRegistry()
+        for wall_ms in (0.5, 3, 3, 20000):
+            registry.record("GET tasks/", {"wall_ms": wall_ms, "render_ms": None})
+
+        stats = registry.snapshot()["GET tasks/"]
+        wall = stats["metrics"]["wall_ms"]
+
+        self.assertEqual(stats["count"], 4)
+        self.assertNotIn("render_ms", stats["metrics"])
+        self.assertEqual(wall["buckets"][0], 1)
+        self.assertEqual(wall["buckets"][2], 2)
+        self.assertEqual(wall["buckets"][-1], 1)
+        self.assertEqual(percentile(wall, "wall_ms", 0.5), 5)
+        self.assertEqual(percentile(wall, "wall_ms", 0.99), 20000)
+        self.assertIsNone(percentile(_empty_histogram("wall_ms"), "wall_ms", 0.5))
+
+    def test_worker_snapshots_add_up(self):
+        first, second = PerfRegistry(), PerfRegistry()
+        first.record("GET tasks/", {"wall_ms": 4, "queries": 2, "serialize_ms": 1})
+        second.record("GET tasks/", {"wall_ms": 40, "queries": 4, "serialize_ms": 3})
+        second.record("GET statuses/", {"wall_ms": 1, "queries": 1})
+
+        merged = merge_snapshots([first.snapshot(), second.snapshot()])
+        rows = build_report(merged)
+
+        self.assertEqual(merged["GET tasks/"]["count"], 2)
+        self.assertEqual(merged["GET tasks/"]["metrics"]["wall_ms"]["max"], 40)
+        self.assertEqual(
+            sum(merged["GET tasks/"]["metrics"]["queries"]["buckets"]), 2
+        )
+        self.assertEqual([row["route"] for row in rows], ["GET tasks/", "GET statuses/"])
+        self.assertEqual(rows[0]["queries_avg"], 3)
+        self.assertEqual(rows[0]["serialize_ms_avg"], 2)
+        self.assertIsNone(rows[1]["serialize_ms_avg"])
+
+
+class PerfSerializationTestCase(SimpleTestCase):
+    def test_serializer_data_is_timed_once(self):
+        install_serializer_recorder()
+        install_serializer_recorder()
+        sample, token, _ = PerfMiddleware._start()
+        self.addCleanup(_current_sample.reset, token)
+
+        with mock.patch(
+            "apps.core.perf.time.perf_counter", side_effect=[1.0, 1.25]
+        ):
+            AllTasksSerializer([Task(id=1, title="task")], many=True).data
+
+        self.assertEqual(sample["serialize_ms"], 250)
+        self.assertFalse(sample["serializing"])
+
+    def test_nothing_is_timed_outside_a_request(self):
+        with record_serialization():
+            pass
+
+        self.assertIsNone(_current_sample.get())
+
+
+class OrjsonRendererTestCase(SimpleTestCase):
+    def assertSameBytes(self, data):
+        self.assertEqual(OrjsonRenderer().render(data), JSONRenderer().render(data))
+
+    def test_task_pages_render_like_the_stock_renderer(self):
+        created_at = timezone.now()
+        tasks = [
+            Task(
+                id=index,
+                title=f"task {index} — ünïcode \u2028\u2029",
+                description="lorem ipsum",
+                category_id=index % 3 or None,
+                date_started=created_at.date(),
+                deadline=created_at.date() + datetime.timedelta(days=index),
+                created_at=created_at,
+                updated_at=created_at,
+            )
+            for index in range(1, 6)
+        ]
+
+        self.assertSameBytes({
+            "next": "http://testserver/tasks/?cursor=abc",
+            "previous": None,
+            "results": AllTasksSerializer(tasks, many=True).data,
+        })
+
+    def test_other_values_render_like_the_stock_renderer(self):
+        self.assertSameBytes([{
+            "at": datetime.datetime(2030, 1, 2, 3, 4, 5, 678901),
+            "day": datetime.date(2030, 1, 2),
+            "time": datetime.time(3, 4, 5),
+            "score": decimal.Decimal("12.30"),
+            "id": uuid.UUID(int=1),
+            "floats": [0.1, 1.5, 1e15, 0.0001],
+            3: "non-string key",
+            "nested": {"flag": True, "empty": [], "text": "\u2029 \"quoted\""},
+        }])
+        # beyond 64 bits: handed to the stock renderer
+        self.assertSameBytes({"big": 2 ** 70})
+
+    def test_exponent_floats_keep_their_value(self):
+        rendered = OrjsonRenderer().render([1e16, 1e-7, 2.5e-5])
+
+        self.assertEqual(rendered, b"[1e16,1e-7,0.000025]")
+        self.assertEqual(
+            json.loads(rendered), json.loads(JSONRenderer().render([1e16, 1e-7, 2.5e-5]))
+        )
+
+
+# a single test process shares its locmem version counters
+@override_settings(VERSIONS_SHARED=True)
+class ReplicaValidatorsTestCase(TestCase):
+    def setUp(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            Category.objects.create(name="work")
+        # read the primary even when a replica is configured
+        self.client.cookies[STICKY_COOKIE] = "1"
+
+    def test_replica_reads_get_no_validators(self):
+        first = self.client.get("/categories/")
+
+        with mock.patch(
+            "apps.core.conditional.replica_reads_active", return_value=True
+        ):
+            replica = self.client.get("/categories/")
+            revalidated = self.client.get(
+                "/categories/", HTTP_IF_NONE_MATCH=first["ETag"]
+            )
+
+        self.assertIn("ETag", first)
+        self.assertNotIn("ETag", replica)
+        self.assertNotIn("Last-Modified", replica)
+        self.assertEqual(revalidated.status_code, 200)
+        self.assertEqual(
+            self.client.get("/categories/", HTTP_IF_NONE_MATCH=first["ETag"]).status_code,
+            304
+        )
+
+
+class EventStreamControllerTestCase(TestCase):
+    def test_wsgi_requests_are_refused(self):
+        response = self.client.get("/events/")
+
+        self.assertEqual(response.status_code, 501)
+
+    async def test_unknown_types_are_rejected(self):
+        response = await self.async_client.get("/events/", {"types": "task,tasks"})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("tasks", response.json()["types"][0])
+
+    @override_settings(EVENTS_RETRY_MS=1000)
+    async def test_stream_starts_with_the_retry_delay(self):
+        response = await self.async_client.get("/events/", {"types": "task"})
+        content = response.streaming_content
+
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+        self.assertEqual(await anext(content), b"retry: 1000\n\n")
+        await content.aclose()
@@ -0,0 +1,113 @@
+import time
+import weakref
+
+from django.conf import settings
+from django.core.cache import DEFAULT_CACHE_ALIAS, cache, caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+
+_PROBE_KEY = "version:probe"
+
+# backends (one per thread) that kept the probe counter
+_storing_backends = weakref.WeakSet()
+
+
+def _version_key(namespace):
+    return f"version:{namespace}"
+
+
+def get_version(namespace):
+    """
+    Returns the current version of a namespace from the shared cache.
+
+    The version is a counter that every process can read and bump, so
+    in-process caches can tell that another worker changed the data.
+    Missing (or evicted) counters restart from the current time, which
+    never collides with a version handed out earlier.
+
+    Args:
+        namespace (str): Name of the versioned resource.
+
+    Returns:
+        int: The current version.
+    """
+    key = _version_key(namespace)
+    version = cache.get(key)
+
+    if version is None:
+        cache.add(key, time.time_ns(), timeout=None)
+        version = cache.get(key)
+
+    return version
+
+
+def bump_version(namespace):
+    """
+    Moves a namespace to a new version, invalidating everything
+    cached under the previous one.
+
+    Args:
+        namespace (str): Name of the versioned resource.
+
+    Returns:
+        int: The new version.
+    """
+    key = _version_key(namespace)
+
+    try:
+        return cache.incr(key)
+    except ValueError:
+        cache.add(key, time.time_ns(), timeout=None)
+        return cache.get(key)
+
+
+def versions_are_shared():
+    """
+    Tells whether every worker sees the same version counters.
+
+    Whatever is keyed by the versions (response cache, lookup table
+    snapshots, ETags) is only safe then: with a per-process default
+    cache, a write in one worker leaves the others on the old version.
+    A backend that doesn't store the counters (the dummy one, an
+    unreachable server) hands out None as every version and is never
+    shared. ``VERSIONS_SHARED`` overrides the guess made from the
+    backend, e.g. for a single-process server with the locmem default.
+    """
+    backend = caches[DEFAULT_CACHE_ALIAS]
+
+    if not _stores_versions(backend):
+        return False
+
+    if settings.VERSIONS_SHARED is not None:
+        return settings.VERSIONS_SHARED
+
+    return not isinstance(backend, LocMemCache)
+
+
+def _stores_versions(backend):
+    if isinstance(backend, DummyCache):
+        return False
+    if backend in _storing_backends:
+        return True
+
+    # a failed round trip is probed again on the next call
+    backend.add(_PROBE_KEY, 1, timeout=None)
+    if backend.get(_PROBE_KEY) is None:
+        return False
+
+    _storing_backends.add(backend)
+    return True
+
+
+async def aget_version(namespace):
+    """
+    Async version of ``get_version()``.
+    """
+    key = _version_key(namespace)
+    version = await cache.aget(key)
+
+    if version is None:
+        await cache.aadd(key, time.time_ns(), timeout=None)
+        version = await cache.aget(key)
+
+    return version
@@ -1,3 +1,11 @@
 from django.contrib import admin
 
-# Register your models here.
+from apps.subtasks.models import Subtask
+
+
+@admin.register(Subtask)
+class SubtaskAdmin(admin.ModelAdmin):
+    list_display = ('title', 'task', 'is_done', 'created_at')
+    list_filter = ('is_done',)
+    search_fields = ('title',)
+    raw_id_fields = ('task',)
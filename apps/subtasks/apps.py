@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class SubtasksConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.subtasks"
+
+    def ready(self):
+        from apps.subtasks import signals  # noqa: F401
@@ -0,0 +1,37 @@
+from rest_framework.views import APIView
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework import status
+
+from apps.subtasks.services.subtasks_services import SubtasksService
+from apps.tasks.pagination import build_page_link
+
+
+class AllSubtasksController(APIView):
+    service = SubtasksService()
+
+    def get(self, request: Request, *args, **kwargs):
+        subtasks_page = self.service.get_all_subtasks(
+            query_params=request.query_params.dict(),
+            cursor=request.query_params.get("cursor"),
+            page_size=request.query_params.get("page_size")
+        )
+
+        return Response(
+            status=status.HTTP_200_OK,
+            data={
+                "next": build_page_link(request, subtasks_page["next"]),
+                "previous": build_page_link(request, subtasks_page["previous"]),
+                "results": subtasks_page["results"],
+            }
+        )
+
+    def post(self, request: Request, *args, **kwargs):
+        new_subtask = self.service.create_new_subtask(
+            data=request.data
+        )
+
+        return Response(
+            status=status.HTTP_201_CREATED,
+            data=new_subtask
+        )
@@ -0,0 +1,54 @@
+from rest_framework.views import APIView
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework import status
+
+from apps.subtasks.services.subtasks_services import SubtasksService
+from apps.subtasks.success_messages import SUBTASK_SUCCESS_DELETING_MESSAGE
+
+
+class SubtaskInfoController(APIView):
+    service = SubtasksService()
+
+    def get(self, request: Request, *args, **kwargs):
+        subtask = self.service.get_subtask_by_id(
+            subtask_id=kwargs.get("subtask_id")
+        )
+
+        return Response(
+            status=status.HTTP_200_OK,
+            data=subtask
+        )
+
+    def put(self, request: Request, *args, **kwargs):
+        subtask = self.service.update_subtask_by_id(
+            subtask_id=kwargs.get("subtask_id"),
+            data=request.data
+        )
+
+        return Response(
+            status=status.HTTP_202_ACCEPTED,
+            data=subtask
+        )
+
+    def patch(self, request: Request, *args, **kwargs):
+        subtask = self.service.update_subtask_by_id(
+            subtask_id=kwargs.get("subtask_id"),
+            data=request.data,
+            partial=True
+        )
+
+        return Response(
+            status=status.HTTP_202_ACCEPTED,
+            data=subtask
+        )
+
+    def delete(self, request: Request, *args, **kwargs):
+        self.service.delete_subtask_by_id(
+            subtask_id=kwargs.get("subtask_id")
+        )
+
+        return Response(
+            status=status.HTTP_200_OK,
+            data=SUBTASK_SUCCESS_DELETING_MESSAGE
+        )
@@ -0,0 +1,2 @@
+SUBTASK_TITLE_TOO_LONG_ERROR = "Title cannot be more than 75 characters"
+SUBTASK_DESCRIPTION_TOO_LONG_ERROR = "The description cannot be more than 1500 characters"
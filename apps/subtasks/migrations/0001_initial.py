@@ -0,0 +1,56 @@
+# Generated by Django 5.0.1 on 2026-10-18 08:52
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ("tasks", "0005_task_search"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Subtask",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("title", models.CharField(max_length=75)),
+                (
+                    "description",
+                    models.TextField(blank=True, default="", max_length=1500),
+                ),
+                ("is_done", models.BooleanField(default=False)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "task",
+                    models.ForeignKey(
+                        db_index=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="subtasks",
+                        to="tasks.task",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Subtask",
+                "verbose_name_plural": "Subtasks",
+                "indexes": [
+                    models.Index(
+                        fields=["task", "is_done"], name="subtask_task_done_idx"
+                    )
+                ],
+            },
+        ),
+    ]
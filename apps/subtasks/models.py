@@ -1,3 +1,36 @@
 from django.db import models
 
-# Create your models here.
+from apps.tasks.models import Task
+
+
+class Subtask(models.Model):
+    title = models.CharField(max_length=75)
+    description = models.TextField(
+        max_length=1500,
+        blank=True,
+        default=""
+    )
+    task = models.ForeignKey(
+        Task,
+        on_delete=models.CASCADE,
+        related_name="subtasks",
+        db_index=False
+    )
+    is_done = models.BooleanField(default=False)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.title[:6]}..."
+
+    class Meta:
+        verbose_name = 'Subtask'
+        verbose_name_plural = 'Subtasks'
+        # leads with the FK, so it serves the FK lookups (prefetch,
+        # cascades) and the done/total counts without a separate index
+        indexes = [
+            models.Index(
+                fields=['task', 'is_done'],
+                name='subtask_task_done_idx'
+            ),
+        ]
@@ -0,0 +1,104 @@
+from django.db import transaction
+from django.db.models import Count, IntegerField, OuterRef, Prefetch, Subquery
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from rest_framework.generics import get_object_or_404
+
+from apps.subtasks.models import Subtask
+from apps.tasks.models import Task, TaskChange
+from apps.tasks.repositories.task_changes_repo import TaskChangesRepository
+
+
+class SubtasksRepository:
+    def get_all_subtasks(self, task_id=None):
+        # subtasks of soft-deleted tasks are hidden with their task
+        subtasks = Subtask.objects.filter(task__deleted_at__isnull=True)
+
+        if task_id is not None:
+            subtasks = subtasks.filter(task_id=task_id)
+
+        return subtasks
+
+    def get_subtask_by_pk(self, pk):
+        return get_object_or_404(self.get_all_subtasks(), id=pk)
+
+    def create_subtask(self, data):
+        with transaction.atomic():
+            subtask = Subtask.objects.create(**data)
+            self.touch_tasks(subtask.task_id)
+
+        return subtask
+
+    def update_subtask(self, subtask, data):
+        previous_task_id = subtask.task_id
+
+        with transaction.atomic():
+            for field, value in data.items():
+                setattr(subtask, field, value)
+            subtask.save()
+            self.touch_tasks(previous_task_id, subtask.task_id)
+
+        return subtask
+
+    def delete_subtask(self, subtask):
+        with transaction.atomic():
+            subtask.delete()
+            self.touch_tasks(subtask.task_id)
+
+    @staticmethod
+    def purge_task_subtasks(task_ids):
+        """
+        Deletes the subtasks of tasks being purged with one DELETE and
+        no signals; they went out of sight with their soft-deleted task.
+        """
+        subtasks = Subtask.objects.filter(task_id__in=task_ids)
+        subtasks._raw_delete(subtasks.db)
+
+    @staticmethod
+    def touch_tasks(*task_ids):
+        # the subtasks are part of the task representation, so its
+        # Last-Modified has to move with them
+        Task.all_objects.filter(id__in=set(task_ids)).update(
+            updated_at=timezone.now()
+        )
+        TaskChangesRepository().record(set(task_ids), TaskChange.UPDATED)
+
+    @staticmethod
+    def with_progress(tasks):
+        """
+        Annotates a Task queryset with ``subtasks_done`` and
+        ``subtasks_total``, counted in SQL by correlated subqueries
+        over the (task, is_done) index.
+        """
+        def count(**filters):
+            counts = (
+                Subtask.objects
+                .filter(task=OuterRef("pk"), **filters)
+                .order_by()
+                .values("task")
+                .annotate(count=Count("id"))
+                .values("count")
+            )
+            return Coalesce(
+                Subquery(counts, output_field=IntegerField()), 0
+            )
+
+        return tasks.annotate(
+            subtasks_done=count(is_done=True),
+            subtasks_total=count(),
+        )
+
+    @staticmethod
+    def with_subtasks(tasks):
+        """
+        Loads the subtasks of every task of the queryset with one
+        extra query, however many tasks there are.
+        """
+        return tasks.prefetch_related(
+            Prefetch(
+                "subtasks",
+                queryset=Subtask.objects.only(
+                    "id", "task_id", "title", "is_done"
+                ).order_by("id")
+            )
+        )
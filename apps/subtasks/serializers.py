@@ -0,0 +1,63 @@
+from rest_framework import serializers
+
+from apps.subtasks.error_messages import (
+    SUBTASK_DESCRIPTION_TOO_LONG_ERROR,
+    SUBTASK_TITLE_TOO_LONG_ERROR,
+)
+from apps.subtasks.models import Subtask
+from apps.tasks.models import Task
+
+
+class SubtaskSerializer(serializers.ModelSerializer):
+    # only live tasks can get subtasks
+    task = serializers.PrimaryKeyRelatedField(queryset=Task.objects.all())
+
+    class Meta:
+        model = Subtask
+        fields = '__all__'
+
+    def validate(self, data):
+        title = data.get("title", "")
+        description = data.get("description", "")
+
+        if len(title) > 75:
+            raise serializers.ValidationError(
+                SUBTASK_TITLE_TOO_LONG_ERROR
+            )
+        if len(description) > 1500:
+            raise serializers.ValidationError(
+                SUBTASK_DESCRIPTION_TOO_LONG_ERROR
+            )
+
+        return data
+
+
+class SubtaskShortSerializer(serializers.ModelSerializer):
+    """
+    Subtask as embedded into a task.
+    """
+    class Meta:
+        model = Subtask
+        fields = ['id', 'title', 'is_done']
+
+
+class SubtaskProgressField(serializers.Field):
+    """
+    Read-only ``{"done": ..., "total": ...}`` of the subtasks of a
+    task, read from the annotations of
+    ``SubtasksRepository.with_progress()``.
+    """
+    def __init__(self, **kwargs):
+        kwargs["source"] = "*"
+        kwargs["read_only"] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, task):
+        return {
+            "done": getattr(task, "subtasks_done", 0),
+            "total": getattr(task, "subtasks_total", 0),
+        }
+
+
+class SubtaskListQuerySerializer(serializers.Serializer):
+    task = serializers.IntegerField(required=False)
@@ -0,0 +1,71 @@
+from apps.subtasks.repositories.subtasks_repo import SubtasksRepository
+from apps.subtasks.serializers import (
+    SubtaskListQuerySerializer,
+    SubtaskSerializer,
+)
+from apps.tasks.pagination import KeysetPaginator
+
+
+class SubtasksService:
+    subtasks_repo = SubtasksRepository()
+    serializer = SubtaskSerializer
+    query_serializer = SubtaskListQuerySerializer
+    paginator = KeysetPaginator(ordering=("id",))
+
+    def get_all_subtasks(self, query_params=None, cursor=None, page_size=None):
+        query = self.query_serializer(data=query_params or {})
+        query.is_valid(raise_exception=True)
+
+        subtasks = self.subtasks_repo.get_all_subtasks(
+            task_id=query.validated_data.get("task")
+        )
+        page = self.paginator.paginate(
+            subtasks,
+            cursor=cursor,
+            page_size=page_size
+        )
+
+        return {
+            "next": page.next_cursor,
+            "previous": page.previous_cursor,
+            "results": self.serializer(page.items, many=True).data,
+        }
+
+    def get_subtask_by_id(self, subtask_id):
+        subtask = self.subtasks_repo.get_subtask_by_pk(
+            pk=subtask_id
+        )
+
+        return self.serializer(subtask).data
+
+    def create_new_subtask(self, data):
+        serializer = self.serializer(
+            data=data
+        )
+        serializer.is_valid(raise_exception=True)
+
+        new_subtask = self.subtasks_repo.create_subtask(
+            data=serializer.validated_data
+        )
+
+        return self.serializer(new_subtask).data
+
+    def update_subtask_by_id(self, subtask_id, data, partial=False):
+        subtask = self.subtasks_repo.get_subtask_by_pk(
+            pk=subtask_id
+        )
+        serializer = self.serializer(subtask, data=data, partial=partial)
+        serializer.is_valid(raise_exception=True)
+
+        updated_subtask = self.subtasks_repo.update_subtask(
+            subtask=subtask,
+            data=serializer.validated_data
+        )
+
+        return self.serializer(updated_subtask).data
+
+    def delete_subtask_by_id(self, subtask_id):
+        subtask = self.subtasks_repo.get_subtask_by_pk(
+            pk=subtask_id
+        )
+        self.subtasks_repo.delete_subtask(subtask=subtask)
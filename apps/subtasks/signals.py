@@ -0,0 +1,11 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.subtasks.models import Subtask
+from apps.tasks.repositories.tasks_repo import TasksRepository
+
+
+@receiver([post_save, post_delete], sender=Subtask)
+def bump_tasks_version_on_subtask_change(sender, **kwargs):
+    # tasks embed their subtasks and progress
+    TasksRepository().bump_version()
@@ -0,0 +1 @@
+SUBTASK_SUCCESS_DELETING_MESSAGE = "Subtask was deleted successful."
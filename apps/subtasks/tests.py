@@ -1,3 +1,130 @@
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
-# Create your tests here.
+from apps.subtasks.models import Subtask
+from apps.tasks.models import Task
+
+
+class SubtasksPrefetchTestCase(TestCase):
+    """
+    Embedded subtasks must cost one query per page of tasks, not one
+    per task, and their progress must come from the database.
+    """
+    def create_tasks(self, count):
+        # run the on_commit version bumps, as a real commit would
+        with self.captureOnCommitCallbacks(execute=True):
+            for index in range(count):
+                task = Task.objects.create(title=f"task {index}")
+                Subtask.objects.bulk_create([
+                    Subtask(task=task, title="first", is_done=True),
+                    Subtask(task=task, title="second"),
+                ])
+
+    def get_expanded_tasks(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get("/tasks/?expand=subtasks")
+
+        return response.json()["results"], len(queries)
+
+    def test_expanded_tasks_query_count_is_constant(self):
+        self.create_tasks(2)
+        _, small_page_queries = self.get_expanded_tasks()
+
+        self.create_tasks(10)
+        tasks, large_page_queries = self.get_expanded_tasks()
+
+        self.assertEqual(len(tasks), 12)
+        self.assertEqual(small_page_queries, large_page_queries)
+
+    def test_task_detail_embeds_subtasks_and_progress(self):
+        self.create_tasks(1)
+        task = Task.objects.get()
+
+        response = self.client.get(f"/tasks/{task.id}/")
+
+        self.assertEqual(
+            [subtask["title"] for subtask in response.json()["subtasks"]],
+            ["first", "second"]
+        )
+        self.assertEqual(response.json()["progress"], {"done": 1, "total": 2})
+
+
+class SubtaskEndpointsTestCase(TestCase):
+    def setUp(self):
+        self.task = Task.objects.create(title="task")
+        self.subtask = Subtask.objects.create(task=self.task, title="first")
+
+    def progress(self, task=None):
+        task = task or self.task
+        return self.client.get(f"/tasks/{task.id}/").json()["progress"]
+
+    def test_create_counts_towards_the_progress(self):
+        response = self.client.post(
+            "/subtasks/",
+            {"task": self.task.id, "title": "second", "is_done": True},
+            content_type="application/json"
+        )
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json()["task"], self.task.id)
+        self.assertEqual(self.progress(), {"done": 1, "total": 2})
+
+    def test_update_moves_the_progress(self):
+        url = f"/subtasks/{self.subtask.id}/"
+        done = self.client.patch(
+            url, {"is_done": True}, content_type="application/json"
+        )
+        self.assertEqual(done.status_code, 202)
+        self.assertEqual(self.progress(), {"done": 1, "total": 1})
+
+        other = Task.objects.create(title="other task")
+        moved = self.client.put(
+            url,
+            {"task": other.id, "title": "first", "is_done": True},
+            content_type="application/json"
+        )
+
+        self.assertEqual(moved.status_code, 202)
+        self.assertEqual(self.progress(), {"done": 0, "total": 0})
+        self.assertEqual(self.progress(other), {"done": 1, "total": 1})
+
+    def test_delete_leaves_the_progress(self):
+        response = self.client.delete(f"/subtasks/{self.subtask.id}/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(Subtask.objects.exists())
+        self.assertEqual(self.progress(), {"done": 0, "total": 0})
+
+    def test_writes_touch_the_parent_task(self):
+        before = Task.objects.get(id=self.task.id).updated_at
+
+        self.client.patch(
+            f"/subtasks/{self.subtask.id}/", {"is_done": True},
+            content_type="application/json"
+        )
+
+        self.assertGreater(Task.objects.get(id=self.task.id).updated_at, before)
+
+    def test_subtasks_of_a_missing_task_are_not_found(self):
+        url = f"/subtasks/{self.subtask.id}/"
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.delete(f"/tasks/{self.task.id}/")
+
+        self.assertEqual(self.client.get(url).status_code, 404)
+        self.assertEqual(
+            self.client.patch(
+                url, {"is_done": True}, content_type="application/json"
+            ).status_code,
+            404
+        )
+        self.assertEqual(self.client.delete(url).status_code, 404)
+        self.assertEqual(self.client.get(f"/tasks/{self.task.id}/").status_code, 404)
+        # a new subtask cannot be hung on it either
+        self.assertEqual(
+            self.client.post(
+                "/subtasks/", {"task": self.task.id, "title": "late"},
+                content_type="application/json"
+            ).status_code,
+            400
+        )
@@ -1,5 +1,13 @@
 from django.urls import path
 
+from apps.subtasks.controllers.all_subtasks_controller import (
+    AllSubtasksController,
+)
+from apps.subtasks.controllers.subtask_info_controller import (
+    SubtaskInfoController,
+)
+
 urlpatterns = [
-    path("", ...)
+    path("", AllSubtasksController.as_view()),
+    path("<int:subtask_id>/", SubtaskInfoController.as_view()),
 ]
@@ -1,6 +1,7 @@
 from django.contrib import admin
 
 from apps.tasks.models import Task
+from apps.tasks.repositories.task_search_repo import TaskSearchRepository
 
 
 @admin.register(Task)
@@ -8,3 +9,16 @@ class TaskAdmin(admin.ModelAdmin):
     list_display = ('title', 'category', 'status', 'creator', 'created_at')
     list_filter = ('category', 'status', 'creator', 'created_at')
     search_fields = ('title',)
+
+    search_repo = TaskSearchRepository()
+
+    def get_queryset(self, request):
+        # the admin also shows soft-deleted tasks
+        return Task.all_objects.all()
+
+    def get_search_results(self, request, queryset, search_term):
+        # full-text index instead of ILIKE '%term%' over the title
+        if not search_term:
+            return queryset, False
+
+        return self.search_repo.filter_matching(queryset, search_term), False
@@ -3,6 +3,12 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework import status
 
+from apps.core.conditional import (
+    get_not_modified_response,
+    response_variant,
+    set_validator_headers,
+)
+from apps.tasks.pagination import build_page_link
 from apps.tasks.services.tasks_services import TasksService
 
 
@@ -10,13 +16,31 @@ class AllTasksController(APIView):
     service = TasksService()
 
     def get(self, request: Request, *args, **kwargs):
-        tasks = self.service.get_all_tasks()
+        validators = self.service.get_tasks_validators(
+            variant=response_variant(request)
+        )
+        not_modified = get_not_modified_response(request, validators)
 
-        return Response(
+        if not_modified is not None:
+            return not_modified
+
+        tasks_page = self.service.get_all_tasks(
+            query_params=request.query_params.dict(),
+            cursor=request.query_params.get("cursor"),
+            page_size=request.query_params.get("page_size")
+        )
+
+        response = Response(
             status=status.HTTP_200_OK,
-            data=tasks
+            data={
+                "next": build_page_link(request, tasks_page["next"]),
+                "previous": build_page_link(request, tasks_page["previous"]),
+                "results": tasks_page["results"],
+            }
         )
 
+        return set_validator_headers(response, validators)
+
     def post(self, request: Request, *args, **kwargs):
         new_task = self.service.create_new_task(
             data=request.data
@@ -26,3 +50,4 @@ class AllTasksController(APIView):
             status=status.HTTP_201_CREATED,
             data=new_task
         )
+
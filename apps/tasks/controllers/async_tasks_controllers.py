@@ -0,0 +1,65 @@
+from django.http import HttpRequest
+
+from apps.core.async_views import AsyncAPIView, json_response
+from apps.core.conditional import (
+    get_not_modified_response,
+    response_variant,
+    set_validator_headers,
+)
+from apps.tasks.pagination import build_page_link
+from apps.tasks.services.tasks_services import TasksService
+
+
+class AsyncAllTasksController(AsyncAPIView):
+    """
+    Native async counterpart of AllTasksController.
+    """
+    service = TasksService()
+
+    async def get(self, request: HttpRequest, *args, **kwargs):
+        validators = await self.service.aget_tasks_validators(
+            variant=response_variant(request)
+        )
+        not_modified = get_not_modified_response(request, validators)
+
+        if not_modified is not None:
+            return not_modified
+
+        tasks_page = await self.service.aget_all_tasks(
+            query_params=request.GET.dict(),
+            cursor=request.GET.get("cursor"),
+            page_size=request.GET.get("page_size")
+        )
+        response = json_response({
+            "next": build_page_link(request, tasks_page["next"]),
+            "previous": build_page_link(request, tasks_page["previous"]),
+            "results": tasks_page["results"],
+        })
+
+        return set_validator_headers(response, validators)
+
+
+class AsyncTaskInfoController(AsyncAPIView):
+    """
+    Native async counterpart of TaskInfoController.
+    """
+    service = TasksService()
+
+    async def get(self, request: HttpRequest, *args, **kwargs):
+        task_id = kwargs.get("task_id")
+        validators = await self.service.aget_task_validators(
+            task_id=task_id,
+            variant=response_variant(request)
+        )
+
+        if validators is not None:
+            not_modified = get_not_modified_response(request, validators)
+
+            if not_modified is not None:
+                return not_modified
+
+        task_info = await self.service.aget_task_info_by_task_id(
+            task_id=task_id
+        )
+
+        return set_validator_headers(json_response(task_info), validators)
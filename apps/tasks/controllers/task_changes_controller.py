@@ -0,0 +1,20 @@
+from rest_framework.views import APIView
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework import status
+
+from apps.tasks.services.task_changes_services import TaskChangesService
+
+
+class TaskChangesController(APIView):
+    service = TaskChangesService()
+
+    def get(self, request: Request, *args, **kwargs):
+        changes = self.service.get_changes(
+            query_params=request.query_params.dict()
+        )
+
+        return Response(
+            status=status.HTTP_200_OK,
+            data=changes
+        )
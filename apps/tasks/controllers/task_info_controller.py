@@ -3,7 +3,13 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework import status
 
+from apps.core.conditional import (
+    get_not_modified_response,
+    response_variant,
+    set_validator_headers,
+)
 from apps.tasks.services.tasks_services import TasksService
+from apps.tasks.success_messages import TASK_SUCCESS_DELETING_MESSAGE
 
 
 class TaskInfoController(APIView):
@@ -13,11 +19,36 @@ class TaskInfoController(APIView):
         task_id = kwargs.get("task_id")
 
         if task_id:
+            validators = self.service.get_task_validators(
+                task_id=task_id,
+                variant=response_variant(request)
+            )
+
+            if validators is not None:
+                not_modified = get_not_modified_response(request, validators)
+
+                if not_modified is not None:
+                    return not_modified
+
             task_info = self.service.get_task_info_by_task_id(
                 task_id=task_id
             )
+            response = Response(
+                status=status.HTTP_200_OK,
+                data=task_info
+            )
+
+            return set_validator_headers(response, validators)
+
+    def delete(self, request: Request, *args, **kwargs):
+        task_id = kwargs.get("task_id")
+
+        if task_id:
+            self.service.delete_task_by_id(
+                task_id=task_id
+            )
 
             return Response(
                 status=status.HTTP_200_OK,
-                data=task_info
+                data=TASK_SUCCESS_DELETING_MESSAGE
             )
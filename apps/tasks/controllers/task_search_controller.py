@@ -0,0 +1,27 @@
+from rest_framework.views import APIView
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework import status
+
+from apps.tasks.pagination import build_page_link
+from apps.tasks.services.task_search_services import TaskSearchService
+
+
+class TaskSearchController(APIView):
+    service = TaskSearchService()
+
+    def get(self, request: Request, *args, **kwargs):
+        results = self.service.search_tasks(
+            query_params=request.query_params.dict()
+        )
+
+        return Response(
+            status=status.HTTP_200_OK,
+            data={
+                "next": build_page_link(request, results["next"], param="page"),
+                "previous": build_page_link(
+                    request, results["previous"], param="page"
+                ),
+                "results": results["results"],
+            }
+        )
@@ -0,0 +1,18 @@
+from rest_framework.views import APIView
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework import status
+
+from apps.tasks.services.task_stats_services import TaskStatsService
+
+
+class TaskStatsController(APIView):
+    service = TaskStatsService()
+
+    def get(self, request: Request, *args, **kwargs):
+        stats = self.service.get_tasks_stats()
+
+        return Response(
+            status=status.HTTP_200_OK,
+            data=stats
+        )
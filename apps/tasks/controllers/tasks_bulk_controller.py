@@ -0,0 +1,20 @@
+from rest_framework.views import APIView
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework import status
+
+from apps.tasks.services.tasks_services import TasksService
+
+
+class TasksBulkController(APIView):
+    service = TasksService()
+
+    def post(self, request: Request, *args, **kwargs):
+        new_tasks = self.service.create_new_tasks(
+            data=request.data
+        )
+
+        return Response(
+            status=status.HTTP_201_CREATED,
+            data=new_tasks
+        )
@@ -0,0 +1,20 @@
+from rest_framework.views import APIView
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework import status
+
+from apps.tasks.services.tasks_services import TasksService
+
+
+class TasksBulkUpdateController(APIView):
+    service = TasksService()
+
+    def post(self, request: Request, *args, **kwargs):
+        result = self.service.update_tasks_in_bulk(
+            data=request.data
+        )
+
+        return Response(
+            status=status.HTTP_200_OK,
+            data=result
+        )
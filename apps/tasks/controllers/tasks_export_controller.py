@@ -0,0 +1,24 @@
+from django.core.handlers.asgi import ASGIRequest
+from django.http import StreamingHttpResponse
+from rest_framework.views import APIView
+from rest_framework.request import Request
+
+from apps.tasks.services.tasks_services import TasksService
+
+
+class TasksExportController(APIView):
+    service = TasksService()
+
+    def get(self, request: Request, *args, **kwargs):
+        if isinstance(request._request, ASGIRequest):
+            lines = self.service.aexport_all_tasks()
+        else:
+            lines = self.service.export_all_tasks()
+
+        response = StreamingHttpResponse(
+            lines,
+            content_type="application/x-ndjson"
+        )
+        response["Content-Disposition"] = 'attachment; filename="tasks.ndjson"'
+
+        return response
@@ -1,3 +1,8 @@
 TASK_TITLE_TOO_LONG_ERROR = "Title cannot be more than 75 characters"
 TASK_DESCRIPTION_TOO_LONG_ERROR = "The description cannot be more than 1500 characters"
 WRONG_DEADLINE_ERROR = "Deadline can't be later than the start date, or today's date"
+INVALID_CURSOR_ERROR = "Invalid cursor"
+INVALID_PAGE_SIZE_ERROR = "Page size must be a positive integer"
+UNKNOWN_TASK_FIELDS_ERROR = "Unknown task fields: {fields}"
+EMPTY_BULK_UPDATE_FILTER_ERROR = "At least one filter is required"
+EMPTY_BULK_UPDATE_PATCH_ERROR = "At least one field to update is required"
@@ -0,0 +1,147 @@
+import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from apps.subtasks.models import Subtask
+from apps.tasks.models import Task
+from apps.tasks.repositories.task_search_repo import TaskSearchRepository
+
+# what serves the full-text search on each database vendor
+SEARCH_INDEXES = {
+    "postgresql": "task_search_idx",
+    "sqlite": "tasks_task_fts",
+}
+
+
+def planned_queries():
+    """
+    The hot Task queries of the API, each paired with the index
+    that is expected to serve it. ``Task.objects`` only returns live
+    rows, which the partial indexes require.
+
+    Returns:
+        list: ``(name, index_name, query)`` tuples; ``query`` is a
+        queryset or, for raw SQL, a ``(sql, params)`` pair.
+    """
+    today = datetime.date.today()
+    queries = [
+        (
+            "tasks by status with deadline range",
+            "task_status_deadline_idx",
+            Task.objects.filter(status_id=1, deadline__lte=today),
+        ),
+        (
+            "tasks of a category, newest first",
+            "task_category_created_idx",
+            Task.objects.filter(category_id=1).order_by("-created_at"),
+        ),
+        (
+            "tasks of a creator, newest first",
+            "task_creator_created_idx",
+            Task.objects.filter(creator_id=1).order_by("-created_at"),
+        ),
+        (
+            "unique_for_date check on title",
+            "task_title_started_idx",
+            Task.objects.filter(
+                title="DEFAULT TITLE",
+                date_started__year=today.year,
+                date_started__month=today.month,
+                date_started__day=today.day,
+            ),
+        ),
+        (
+            "live tasks keyset page",
+            "task_live_created_idx",
+            Task.objects.order_by("created_at", "id")[:50],
+        ),
+        (
+            "soft-deleted tasks due for purge",
+            "task_deleted_at_idx",
+            Task.all_objects.filter(
+                deleted_at__lt=datetime.datetime.now(datetime.timezone.utc)
+            ).values("id")[:500],
+        ),
+        (
+            "subtasks prefetched for a page of tasks",
+            "subtask_task_done_idx",
+            Subtask.objects.filter(task_id__in=[1, 2, 3]),
+        ),
+    ]
+
+    if connection.vendor in SEARCH_INDEXES:
+        search_repo = TaskSearchRepository()
+        queries += [
+            (
+                "full-text task search (admin)",
+                SEARCH_INDEXES[connection.vendor],
+                search_repo.filter_matching(Task.objects.all(), "task"),
+            ),
+            (
+                "ranked full-text task search (API)",
+                SEARCH_INDEXES[connection.vendor],
+                search_repo.ranked_search_sql("task", limit=51),
+            ),
+        ]
+
+    return queries
+
+
+def explain(query):
+    if not isinstance(query, tuple):
+        return query.explain()
+
+    sql, params = query
+    with connection.cursor() as cursor:
+        cursor.execute(f"{connection.ops.explain_query_prefix()} {sql}", params)
+        return "\n".join(
+            " ".join(str(column) for column in row) for row in cursor.fetchall()
+        )
+
+
+class Command(BaseCommand):
+    help = (
+        "Prints the query plan of every planned Task query and whether "
+        "it is served by the expected index."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Exit with an error if any query does not use its index.",
+        )
+        parser.add_argument(
+            "--verbose-plan",
+            action="store_true",
+            help="Print the full plan of every query.",
+        )
+
+    def handle(self, *args, **options):
+        missing = []
+
+        with transaction.atomic():
+            if connection.vendor == "postgresql":
+                # on a small table the planner rightly prefers a seq scan;
+                # this only checks that the index *can* serve the query
+                with connection.cursor() as cursor:
+                    cursor.execute("SET LOCAL enable_seqscan = off")
+
+            for name, index_name, query in planned_queries():
+                plan = explain(query)
+                used = index_name in plan
+
+                if not used:
+                    missing.append(name)
+
+                self.stdout.write(
+                    f"{'OK  ' if used else 'MISS'} {name} -> {index_name}"
+                )
+                if options["verbose_plan"] or not used:
+                    self.stdout.write(plan)
+
+        if options["check"] and missing:
+            raise CommandError(
+                f"Queries not using their index: {', '.join(missing)}"
+            )
@@ -0,0 +1,56 @@
+import datetime
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.tasks.repositories.tasks_repo import TasksRepository
+
+
+class Command(BaseCommand):
+    help = (
+        "Hard-deletes tasks that were soft-deleted long enough ago, in "
+        "small batches so that no transaction holds locks for long."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--older-than-days",
+            type=int,
+            default=settings.TASKS_PURGE_AFTER_DAYS,
+            help="Purge tasks soft-deleted more than this many days ago.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.TASKS_PURGE_BATCH_SIZE,
+            help="Number of tasks deleted per transaction.",
+        )
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=0.1,
+            help="Seconds to pause between batches.",
+        )
+
+    def handle(self, *args, **options):
+        repo = TasksRepository()
+        deleted_before = timezone.now() - datetime.timedelta(
+            days=options["older_than_days"]
+        )
+        total = 0
+
+        while True:
+            purged = repo.purge_deleted_tasks(
+                deleted_before=deleted_before,
+                batch_size=options["batch_size"],
+            )
+            total += purged
+
+            if purged < options["batch_size"]:
+                break
+
+            time.sleep(options["sleep"])
+
+        self.stdout.write(f"Purged {total} soft-deleted tasks.")
@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from apps.tasks.services.task_stats_services import TaskStatsService
+
+
+class Command(BaseCommand):
+    help = (
+        "Recomputes the per-status and per-category task counters from "
+        "the tasks table, fixing any drift left by writes that bypass "
+        "the ORM (raw SQL, queryset.update(), restored backups)."
+    )
+
+    def handle(self, *args, **options):
+        rebuilt = TaskStatsService().reconcile_counters()
+
+        self.stdout.write(f"Rebuilt {rebuilt} task counters.")
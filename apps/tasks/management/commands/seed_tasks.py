@@ -0,0 +1,61 @@
+import os
+
+from django.core.management.base import BaseCommand
+
+from apps.tasks.seeding import seed_tasks
+
+
+class Command(BaseCommand):
+    help = (
+        "Generates users, categories, statuses and a large number of "
+        "tasks with realistic spreads, using COPY on Postgres and "
+        "bulk_create batches elsewhere, across a process pool."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--count",
+            type=int,
+            required=True,
+            help="Number of tasks to create.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="Worker processes (SQLite always uses one).",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=20000,
+            help="Tasks generated and written per worker transaction.",
+        )
+        parser.add_argument(
+            "--users",
+            type=int,
+            default=100,
+            help="Number of seed users the tasks are spread over.",
+        )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=0,
+            help="Random seed, for reproducible datasets.",
+        )
+
+    def handle(self, *args, **options):
+        log = self.stdout.write if options["verbosity"] > 1 else None
+        elapsed = seed_tasks(
+            count=options["count"],
+            workers=options["workers"],
+            chunk_size=options["chunk_size"],
+            users=options["users"],
+            seed=options["seed"],
+            log=log,
+        )
+
+        self.stdout.write(
+            f"Seeded {options['count']} tasks in {elapsed:.1f}s "
+            f"({options['count'] / max(elapsed, 1e-9):,.0f} tasks/s)."
+        )
@@ -0,0 +1,72 @@
+# Generated by Django 5.0.1 on 2026-10-18 08:46
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("categories_statuses", "0001_initial"),
+        ("tasks", "0002_task_access_pattern_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="task",
+            name="task_status_deadline_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="task",
+            name="task_category_created_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="task",
+            name="task_creator_created_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="task",
+            name="task_title_started_idx",
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=["status", "deadline"],
+                name="task_status_deadline_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=["category", "created_at"],
+                name="task_category_created_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=["creator", "created_at"],
+                name="task_creator_created_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=["title", "date_started"],
+                name="task_title_started_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", False)),
+                fields=["deleted_at"],
+                name="task_deleted_at_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,64 @@
+# Generated by Django 5.0.1 on 2026-10-18 08:47
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def fill_task_counters(apps, schema_editor):
+    Task = apps.get_model("tasks", "Task")
+    TaskCounter = apps.get_model("tasks", "TaskCounter")
+    live_tasks = Task.objects.filter(deleted_at__isnull=True).order_by()
+    counters = []
+
+    for kind, column in (("status", "status_id"), ("category", "category_id")):
+        rows = live_tasks.values(column).annotate(total=Count("id"))
+        counters.extend(
+            TaskCounter(kind=kind, object_id=row[column] or 0, count=row["total"])
+            for row in rows
+        )
+
+    TaskCounter.objects.bulk_create(counters)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0003_task_soft_delete"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TaskCounter",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "kind",
+                    models.CharField(
+                        choices=[("status", "Status"), ("category", "Category")],
+                        max_length=10,
+                    ),
+                ),
+                ("object_id", models.BigIntegerField(default=0)),
+                ("count", models.BigIntegerField(default=0)),
+            ],
+            options={
+                "verbose_name": "Task counter",
+                "verbose_name_plural": "Task counters",
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="taskcounter",
+            constraint=models.UniqueConstraint(
+                fields=("kind", "object_id"), name="task_counter_kind_object_uniq"
+            ),
+        ),
+        migrations.RunPython(fill_task_counters, migrations.RunPython.noop),
+    ]
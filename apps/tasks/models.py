@@ -1,5 +1,5 @@
 from django.contrib.auth.models import User
-from django.db import models
+from django.db import models, router, transaction
 
 from apps.categories_statuses.models import (
     Category,
@@ -7,6 +7,15 @@ from apps.categories_statuses.models import (
 )
 
 
+class LiveTaskManager(models.Manager):
+    """
+    Default manager of Task: soft-deleted rows (``deleted_at`` set) are
+    excluded, which also lets the partial indexes serve every query.
+    """
+    def get_queryset(self):
+        return super().get_queryset().filter(deleted_at__isnull=True)
+
+
 class Task(models.Model):
     title = models.CharField(
         max_length=75,
@@ -22,19 +31,22 @@ class Task(models.Model):
         User,
         on_delete=models.CASCADE,
         blank=True,
-        null=True
+        null=True,
+        db_index=False
     )
     category = models.ForeignKey(
         Category,
         null=True,
         blank=True,
-        on_delete=models.SET_NULL
+        on_delete=models.SET_NULL,
+        db_index=False
     )
     status = models.ForeignKey(
         Status,
         on_delete=models.SET_NULL,
         blank=True,
-        null=True
+        null=True,
+        db_index=False
     )
     date_started = models.DateField(
         help_text="День, когда задача должна начаться",
@@ -52,9 +64,115 @@ class Task(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
     deleted_at = models.DateTimeField(null=True, blank=True)
 
+    objects = LiveTaskManager()
+    all_objects = models.Manager()
+
     def __str__(self):
         return f"{self.title[:6]}..."
 
+    def save(self, *args, **kwargs):
+        # Django sends post_save after the row is written and, outside
+        # of a transaction, committed; the counters and the change feed
+        # updated by the receivers must commit together with it
+        using = kwargs.get("using") or router.db_for_write(type(self), instance=self)
+
+        with transaction.atomic(using=using, savepoint=False):
+            super().save(*args, **kwargs)
+
     class Meta:
         verbose_name = 'Task'
         verbose_name_plural = 'Tasks'
+        # the composite indexes lead with the FK columns, so the FKs
+        # themselves don't get a separate single-column index; all of them
+        # only cover live rows, which is what the default manager queries
+        indexes = [
+            models.Index(
+                fields=['status', 'deadline'],
+                name='task_status_deadline_idx',
+                condition=models.Q(deleted_at__isnull=True)
+            ),
+            models.Index(
+                fields=['category', 'created_at'],
+                name='task_category_created_idx',
+                condition=models.Q(deleted_at__isnull=True)
+            ),
+            models.Index(
+                fields=['creator', 'created_at'],
+                name='task_creator_created_idx',
+                condition=models.Q(deleted_at__isnull=True)
+            ),
+            models.Index(
+                fields=['title', 'date_started'],
+                name='task_title_started_idx',
+                condition=models.Q(deleted_at__isnull=True)
+            ),
+            models.Index(
+                fields=['created_at', 'id'],
+                name='task_live_created_idx',
+                condition=models.Q(deleted_at__isnull=True)
+            ),
+            models.Index(
+                fields=['deleted_at'],
+                name='task_deleted_at_idx',
+                condition=models.Q(deleted_at__isnull=False)
+            ),
+        ]
+
+
+class TaskCounter(models.Model):
+    """
+    Denormalized number of live tasks per status and per category,
+    kept up to date by TasksRepository writes. ``object_id`` 0 counts
+    the tasks without a status/category.
+    """
+    STATUS = 'status'
+    CATEGORY = 'category'
+    KIND_CHOICES = [
+        (STATUS, 'Status'),
+        (CATEGORY, 'Category'),
+    ]
+
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES)
+    object_id = models.BigIntegerField(default=0)
+    count = models.BigIntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.kind} {self.object_id}: {self.count}"
+
+    class Meta:
+        verbose_name = 'Task counter'
+        verbose_name_plural = 'Task counters'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['kind', 'object_id'],
+                name='task_counter_kind_object_uniq'
+            ),
+        ]
+
+
+class TaskChange(models.Model):
+    """
+    One entry of the task change feed (``/tasks/changes/``), written in
+    the transaction of the task write; ``id`` is the feed sequence.
+    ``task_id`` is not a foreign key, so the tombstones of deleted tasks
+    outlive their rows.
+    """
+    CREATED = 'created'
+    UPDATED = 'updated'
+    DELETED = 'deleted'
+    ACTION_CHOICES = [
+        (CREATED, 'Created'),
+        (UPDATED, 'Updated'),
+        (DELETED, 'Deleted'),
+    ]
+
+    task_id = models.BigIntegerField()
+    action = models.CharField(max_length=10, choices=ACTION_CHOICES)
+    changed_at = models.DateTimeField()
+
+    def __str__(self):
+        return f"#{self.id} task {self.task_id} {self.action}"
+
+    class Meta:
+        verbose_name = 'Task change'
+        verbose_name_plural = 'Task changes'
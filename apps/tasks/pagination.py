@@ -0,0 +1,211 @@
+import base64
+import binascii
+import json
+from typing import NamedTuple
+
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Q
+from rest_framework.exceptions import ValidationError
+from rest_framework.utils.urls import replace_query_param
+
+from apps.tasks.error_messages import (
+    INVALID_CURSOR_ERROR,
+    INVALID_PAGE_SIZE_ERROR,
+)
+
+
+def build_page_link(request, cursor, param="cursor"):
+    """
+    Returns the absolute URL of the current request pointing at the
+    page of the given cursor (or page number, with ``param="page"``),
+    or None if there is no such page.
+    """
+    if cursor is None:
+        return None
+
+    return replace_query_param(request.build_absolute_uri(), param, cursor)
+
+
+class KeysetPage(NamedTuple):
+    items: list
+    next_cursor: str | None
+    previous_cursor: str | None
+
+
+class KeysetPaginator:
+    """
+    Cursor (keyset) paginator over a composite, unique ordering.
+
+    Instead of OFFSET, every page continues from the position of the
+    last row of the previous one (``WHERE (created_at, id) > (...)``),
+    so the cost of a page does not depend on how deep the client is
+    in the table.
+
+    Attributes:
+        ordering (tuple): Ordering field names, ``-`` prefixed for
+        descending. The last field must be unique (normally ``id``).
+    """
+    def __init__(self, ordering=("created_at", "id")):
+        self.ordering = tuple(ordering)
+
+    def get_page_size(self, page_size=None):
+        """
+        Validates the requested page size, falling back to
+        ``TASKS_PAGE_SIZE`` and capping at ``TASKS_MAX_PAGE_SIZE``.
+        """
+        if page_size in (None, ""):
+            return settings.TASKS_PAGE_SIZE
+
+        try:
+            page_size = int(page_size)
+        except (TypeError, ValueError):
+            raise ValidationError({"page_size": INVALID_PAGE_SIZE_ERROR})
+
+        if page_size < 1:
+            raise ValidationError({"page_size": INVALID_PAGE_SIZE_ERROR})
+
+        return min(page_size, settings.TASKS_MAX_PAGE_SIZE)
+
+    def paginate(self, queryset, cursor=None, page_size=None):
+        """
+        Returns one page of the queryset starting at the given cursor.
+
+        Args:
+            queryset (QuerySet): Unordered queryset to paginate.
+            cursor (str): Opaque cursor from a previous page, if any.
+            page_size (int | str): Requested number of rows.
+
+        Returns:
+            KeysetPage: Page rows with the next and previous cursors.
+        """
+        window, page_size, reverse = self._page_window(
+            queryset, cursor, page_size
+        )
+
+        return self._build_page(list(window), page_size, reverse, cursor)
+
+    async def apaginate(self, queryset, cursor=None, page_size=None):
+        """
+        Async version of ``paginate()``.
+        """
+        window, page_size, reverse = self._page_window(
+            queryset, cursor, page_size
+        )
+        rows = [row async for row in window]
+
+        return self._build_page(rows, page_size, reverse, cursor)
+
+    def _page_window(self, queryset, cursor, page_size):
+        page_size = self.get_page_size(page_size)
+        position, reverse = None, False
+
+        if cursor:
+            position, reverse = self.decode_cursor(queryset.model, cursor)
+
+        ordering = self._flip(self.ordering) if reverse else self.ordering
+        queryset = queryset.order_by(*ordering)
+
+        if position is not None:
+            queryset = queryset.filter(self._seek(ordering, position))
+
+        # one extra row tells whether there is a page after this one
+        return queryset[:page_size + 1], page_size, reverse
+
+    def _build_page(self, rows, page_size, reverse, cursor):
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+
+        if reverse:
+            rows.reverse()
+
+        if not rows:
+            return KeysetPage(items=rows, next_cursor=None, previous_cursor=None)
+
+        has_next = has_more if not reverse else True
+        has_previous = has_more if reverse else cursor is not None
+
+        return KeysetPage(
+            items=rows,
+            next_cursor=self.encode_cursor(rows[-1]) if has_next else None,
+            previous_cursor=(
+                self.encode_cursor(rows[0], reverse=True) if has_previous else None
+            ),
+        )
+
+    def encode_cursor(self, row, reverse=False):
+        position = [
+            self._serialize(self._value(row, name.lstrip("-")))
+            for name in self.ordering
+        ]
+        payload = {"o": ",".join(self.ordering), "p": position, "r": int(reverse)}
+        raw = json.dumps(payload, separators=(",", ":")).encode()
+
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    def decode_cursor(self, model, cursor):
+        try:
+            raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            payload = json.loads(raw)
+            if payload["o"] != ",".join(self.ordering):
+                raise ValueError(payload["o"])
+            position = [
+                model._meta.get_field(name.lstrip("-")).to_python(value)
+                for name, value in zip(self.ordering, payload["p"], strict=True)
+            ]
+            return position, bool(payload["r"])
+        except (
+            binascii.Error,
+            ValueError,
+            TypeError,
+            KeyError,
+            FieldDoesNotExist,
+            DjangoValidationError,
+        ) as err:
+            raise ValidationError({"cursor": INVALID_CURSOR_ERROR}) from err
+
+    @staticmethod
+    def _seek(ordering, position):
+        """
+        Builds the lexicographic "row comes after position" condition:
+        ``a > x OR (a = x AND b > y) OR ...``.
+
+        The extra ``a >= x`` in front is implied by the OR and changes
+        no result. It is there for the planner, which can't derive an
+        index range from an OR of conjunctions: without it a deep page
+        walks the ``(a, b)`` index from its start and filters row by
+        row; with it the scan starts at the cursor.
+        """
+        condition = Q()
+        equal = Q()
+
+        for name, value in zip(ordering, position):
+            field = name.lstrip("-")
+            lookup = "lt" if name.startswith("-") else "gt"
+            condition |= equal & Q(**{f"{field}__{lookup}": value})
+            equal &= Q(**{field: value})
+
+        leading = ordering[0]
+        lookup = "lte" if leading.startswith("-") else "gte"
+
+        return Q(**{f"{leading.lstrip('-')}__{lookup}": position[0]}) & condition
+
+    @staticmethod
+    def _flip(ordering):
+        return tuple(
+            name[1:] if name.startswith("-") else f"-{name}"
+            for name in ordering
+        )
+
+    @staticmethod
+    def _value(row, name):
+        if isinstance(row, dict):
+            return row[name]
+        return getattr(row, name)
+
+    @staticmethod
+    def _serialize(value):
+        if hasattr(value, "isoformat"):
+            return value.isoformat()
+        return value
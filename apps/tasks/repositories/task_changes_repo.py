@@ -0,0 +1,101 @@
+from django.db import connection
+from django.db.transaction import TransactionManagementError
+from django.utils import timezone
+
+from apps.core.events import publish_event
+from apps.tasks.models import TaskChange
+
+# pg_advisory_xact_lock() key serializing the writers of the feed
+_SEQUENCE_LOCK_KEY = 0x7461736B
+
+
+class TaskChangesRepository:
+    """
+    Writes and reads the task change feed.
+
+    A reader resumes from the last ``id`` it has seen, so ids must
+    become visible in order: on Postgres every writer takes a
+    transaction-level advisory lock before drawing its ids and keeps
+    it until commit (SQLite already serializes writers).
+
+    Every write also publishes a ``task`` event carrying the cursor to
+    read the new changes from (``since``).
+    """
+    def record(self, task_ids, action):
+        """
+        Records one change per task; call inside the transaction of
+        the task write.
+        """
+        if not task_ids:
+            return
+
+        self._lock_sequence()
+        now = timezone.now()
+        task_ids = sorted(task_ids)
+        changes = TaskChange.objects.bulk_create(
+            TaskChange(task_id=task_id, action=action, changed_at=now)
+            for task_id in task_ids
+        )
+
+        publish_event(
+            "task", action=action, ids=task_ids, since=changes[0].id - 1
+        )
+
+    def record_matching(self, tasks, action):
+        """
+        Records one change per task of the queryset with a single
+        INSERT ... SELECT, without loading the ids.
+
+        Returns:
+            int: The head before the insert; the changes after it are
+            the recorded ones until the transaction ends.
+        """
+        self._lock_sequence()
+        since = self.get_head()
+        sql, params = tasks.order_by("id").values("id").query.sql_with_params()
+        changed_at = connection.ops.adapt_datetimefield_value(timezone.now())
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {TaskChange._meta.db_table} "
+                "(task_id, action, changed_at) "
+                f"SELECT id, %s, %s FROM ({sql}) matching",
+                [action, changed_at, *params]
+            )
+            if cursor.rowcount:
+                publish_event("task", action=action, since=since)
+
+        return since
+
+    def get_head(self):
+        """
+        Returns the id of the latest change, 0 while there is none.
+        """
+        return (
+            TaskChange.objects.order_by("-id").values_list("id", flat=True).first()
+            or 0
+        )
+
+    def get_changes(self, since, limit):
+        return list(
+            TaskChange.objects
+            .filter(id__gt=since)
+            .order_by("id")
+            .values_list("id", "task_id", "action")[:limit]
+        )
+
+    @staticmethod
+    def _lock_sequence():
+        # the lock ends with the transaction: in autocommit it would be
+        # gone before the insert, which would not commit with the write
+        if not connection.in_atomic_block:
+            raise TransactionManagementError(
+                "Task changes must be recorded inside the transaction "
+                "of the task write."
+            )
+
+        if connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT pg_advisory_xact_lock(%s)", [_SEQUENCE_LOCK_KEY]
+                )
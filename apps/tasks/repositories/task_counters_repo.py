@@ -0,0 +1,114 @@
+from collections import Counter
+
+from django.db import transaction
+from django.db.models import Count, F
+
+from apps.tasks.models import Task, TaskCounter
+
+
+class TaskCountersRepository:
+    # counter kind -> Task column it counts by
+    kinds = {
+        TaskCounter.STATUS: "status_id",
+        TaskCounter.CATEGORY: "category_id",
+    }
+    # object_id of the "no status / no category" counter
+    none_id = 0
+
+    def get_counts(self, kind):
+        return dict(
+            TaskCounter.objects
+            .filter(kind=kind)
+            .values_list("object_id", "count")
+        )
+
+    def task_deltas(self, task, sign=1, deltas=None):
+        """
+        Adds the counters affected by one task to ``deltas``.
+
+        Args:
+            task (Task | dict): Task or a dict of its ``status_id``,
+            ``category_id`` and ``deleted_at``.
+            sign (int): 1 when the task is added, -1 when it is removed;
+            n / -n stands for n tasks with the same values.
+            deltas (Counter): Deltas to add to, a new one by default.
+
+        Returns:
+            Counter: ``(kind, object_id) -> delta``.
+        """
+        deltas = Counter() if deltas is None else deltas
+        row = task if isinstance(task, dict) else vars(task)
+
+        # soft-deleted tasks are not counted
+        if row.get("deleted_at") is not None:
+            return deltas
+
+        for kind, column in self.kinds.items():
+            deltas[(kind, row.get(column) or self.none_id)] += sign
+
+        return deltas
+
+    def apply_deltas(self, deltas):
+        with transaction.atomic():
+            # a fixed order keeps concurrent writers from deadlocking
+            for (kind, object_id), delta in sorted(deltas.items()):
+                if delta:
+                    self._add(kind, object_id, delta)
+
+    def move_to_none(self, kind, object_id):
+        """
+        Moves the count of a deleted status/category to the "none"
+        counter, mirroring the SET_NULL of its tasks.
+        """
+        with transaction.atomic():
+            counter = (
+                TaskCounter.objects
+                .select_for_update()
+                .filter(kind=kind, object_id=object_id)
+                .first()
+            )
+            if counter is None:
+                return
+
+            counter.delete()
+            if counter.count:
+                self._add(kind, self.none_id, counter.count)
+
+    def rebuild(self):
+        """
+        Recomputes every counter from the live tasks.
+
+        Returns:
+            list[TaskCounter]: The new counters.
+        """
+        counters = []
+
+        for kind, column in self.kinds.items():
+            rows = (
+                Task.objects
+                .order_by()
+                .values(column)
+                .annotate(total=Count("id"))
+                .values_list(column, "total")
+            )
+            counters.extend(
+                TaskCounter(
+                    kind=kind,
+                    object_id=object_id or self.none_id,
+                    count=total
+                )
+                for object_id, total in rows
+            )
+
+        with transaction.atomic():
+            TaskCounter.objects.all().delete()
+            TaskCounter.objects.bulk_create(counters)
+
+        return counters
+
+    def _add(self, kind, object_id, delta):
+        counters = TaskCounter.objects.filter(kind=kind, object_id=object_id)
+
+        if not counters.update(count=F("count") + delta):
+            TaskCounter.objects.get_or_create(kind=kind, object_id=object_id)
+            counters.update(count=F("count") + delta)
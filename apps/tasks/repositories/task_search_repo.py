@@ -0,0 +1,119 @@
+import re
+
+from django.db import connection
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+
+from apps.tasks.models import Task
+
+# Search SQL per database vendor; the indexes behind it are created by
+# the 0005_task_search migration. Every query returns matching live
+# task ids, best match first. The index finds the matches, but ranking
+# them is not bounded by LIMIT: every match is scored before the top
+# rows are kept, so a query costs in proportion to how many tasks it
+# matches, not to the page size.
+POSTGRES_SEARCH_SQL = """
+    SELECT t.id
+    FROM tasks_task t, websearch_to_tsquery('simple', %s) query
+    WHERE t.search_vector @@ query AND t.deleted_at IS NULL
+    ORDER BY ts_rank(t.search_vector, query) DESC, t.id
+    LIMIT %s OFFSET %s
+"""
+
+SQLITE_SEARCH_SQL = """
+    SELECT t.id
+    FROM tasks_task_fts JOIN tasks_task t ON t.id = tasks_task_fts.rowid
+    WHERE tasks_task_fts MATCH %s AND t.deleted_at IS NULL
+    ORDER BY bm25(tasks_task_fts, 10.0, 1.0), t.id
+    LIMIT %s OFFSET %s
+"""
+
+SEARCH_SQL = {
+    "postgresql": POSTGRES_SEARCH_SQL,
+    "sqlite": SQLITE_SEARCH_SQL,
+}
+
+# unranked ids of every matching task, for filtering a queryset
+MATCH_SQL = {
+    "postgresql": (
+        "SELECT id FROM tasks_task "
+        "WHERE search_vector @@ websearch_to_tsquery('simple', %s)"
+    ),
+    "sqlite": (
+        "SELECT rowid FROM tasks_task_fts WHERE tasks_task_fts MATCH %s"
+    ),
+}
+
+
+class TaskSearchRepository:
+    def search_task_ids(self, query, limit, offset=0):
+        """
+        Returns the ids of live tasks whose title or description match
+        the query, ranked by relevance (title matches weigh more).
+        """
+        if connection.vendor not in SEARCH_SQL:
+            return self._scan_task_ids(query, limit, offset)
+
+        ranked = self.ranked_search_sql(query, limit, offset)
+        if ranked is None:
+            return []
+
+        with connection.cursor() as cursor:
+            cursor.execute(*ranked)
+            return [row[0] for row in cursor.fetchall()]
+
+    def ranked_search_sql(self, query, limit, offset=0):
+        """
+        Returns the ranked search SQL of this database and its params,
+        or None if the query has nothing to search for.
+        """
+        query = self._to_vendor_query(query)
+        if not query:
+            return None
+
+        return SEARCH_SQL[connection.vendor], [query, limit, offset]
+
+    def filter_matching(self, tasks, query):
+        """
+        Narrows a Task queryset down to the tasks matching the query,
+        without ranking them.
+        """
+        sql = MATCH_SQL.get(connection.vendor)
+
+        if sql is None:
+            return tasks.filter(
+                Q(title__icontains=query) | Q(description__icontains=query)
+            )
+
+        query = self._to_vendor_query(query)
+        if not query:
+            return tasks.none()
+
+        return tasks.filter(id__in=RawSQL(sql, [query]))
+
+    def get_tasks_in_order(self, ids):
+        tasks = Task.objects.in_bulk(ids)
+
+        # a task may be soft-deleted between the two queries
+        return [tasks[pk] for pk in ids if pk in tasks]
+
+    @staticmethod
+    def _to_vendor_query(query):
+        if connection.vendor != "sqlite":
+            return query
+
+        # FTS5 has its own query syntax; search the words as plain
+        # phrases so that user input can't break it
+        return " ".join(f'"{word}"' for word in re.findall(r"\w+", query))
+
+    @staticmethod
+    def _scan_task_ids(query, limit, offset):
+        # databases without a full-text index: unranked substring scan
+        ids = (
+            Task.objects
+            .filter(Q(title__icontains=query) | Q(description__icontains=query))
+            .order_by("id")
+            .values_list("id", flat=True)
+        )
+
+        return list(ids[offset:offset + limit])
@@ -1,16 +1,250 @@
+from collections import Counter
+
+from django.db import connection, transaction
+from django.db.models import Count
+from django.http import Http404
+from django.utils import timezone
 from rest_framework.generics import get_object_or_404
 
-from apps.tasks.models import Task
+from apps.core.versions import aget_version, bump_version, get_version
+from apps.subtasks.repositories.subtasks_repo import SubtasksRepository
+from apps.tasks.models import Task, TaskChange
+from apps.tasks.repositories.task_changes_repo import TaskChangesRepository
+from apps.tasks.repositories.task_counters_repo import TaskCountersRepository
 
 
 class TasksRepository:
-    def get_all_tasks(self):
-        return Task.objects.all()
+    # query parameter -> ORM lookup pushed down into WHERE
+    filter_lookups = {
+        "status": "status_id",
+        "category": "category_id",
+        "creator": "creator_id",
+        "date_started_after": "date_started__gte",
+        "date_started_before": "date_started__lte",
+        "deadline_after": "deadline__gte",
+        "deadline_before": "deadline__lte",
+        "ids": "id__in",
+    }
+    version_namespace = "tasks"
+    counters_repo = TaskCountersRepository()
+    changes_repo = TaskChangesRepository()
+    subtasks_repo = SubtasksRepository()
+
+    def get_all_tasks(self, filters=None, fields=None, expand=None,
+                      related=()):
+        """
+        Returns the filtered tasks. The serializers render relations as
+        their ids, read from the FK columns; only the relations whose
+        own fields a caller reads are worth joining through ``related``.
+        """
+        tasks = self._filter_tasks(filters)
+
+        if fields:
+            tasks = tasks.only(*fields)
+
+        if expand == "subtasks":
+            tasks = self._with_subtasks(tasks)
+
+        return self._with_related(tasks, related, fields=fields)
+
+    def get_all_task_rows(self, filters=None, columns=()):
+        """
+        Same tasks as ``get_all_tasks()``, as named tuples of the given
+        columns: no model instances, no joins.
+        """
+        return self._filter_tasks(filters).values_list(*columns, named=True)
+
+    def iter_all_tasks(self, chunk_size):
+        return Task.objects.order_by("id").iterator(chunk_size=chunk_size)
 
     def get_task_by_pk(self, pk):
-        return get_object_or_404(Task, id=pk)
+        return get_object_or_404(Task.objects.all(), id=pk)
+
+    def get_task_info_by_pk(self, pk):
+        tasks = self._with_subtasks(Task.objects.all())
+
+        return get_object_or_404(tasks, id=pk)
+
+    async def aget_task_info_by_pk(self, pk):
+        tasks = self._with_subtasks(Task.objects.all())
+
+        try:
+            return await tasks.aget(id=pk)
+        except Task.DoesNotExist:
+            raise Http404
+
+    def get_task_updated_at(self, pk):
+        return Task.objects.filter(id=pk).values_list(
+            "updated_at", flat=True
+        ).first()
+
+    async def aget_task_updated_at(self, pk):
+        return await Task.objects.filter(id=pk).values_list(
+            "updated_at", flat=True
+        ).afirst()
+
+    def get_version(self):
+        return get_version(self.version_namespace)
+
+    async def aget_version(self):
+        return await aget_version(self.version_namespace)
+
+    def bump_version(self):
+        transaction.on_commit(lambda: bump_version(self.version_namespace))
 
     def create_task(self, data):
-        task = Task.objects.create(**data)
+        # the post_save counter update commits together with the row
+        with transaction.atomic():
+            task = Task.objects.create(**data)
 
         return task
+
+    def soft_delete_task(self, task):
+        with transaction.atomic():
+            task.deleted_at = timezone.now()
+            task.save(update_fields=["deleted_at", "updated_at"])
+
+        return task
+
+    def purge_deleted_tasks(self, deleted_before, batch_size):
+        """
+        Hard-deletes one batch of tasks soft-deleted before the given
+        time, in its own short transaction.
+
+        The soft delete already recorded the tombstones and moved the
+        counters, so the rows go with raw DELETEs: ``delete()`` would
+        send post_delete per row and repeat all of it. The version is
+        bumped once for the batch (``?deleted=true`` lists the rows).
+
+        Returns:
+            int: Number of purged tasks; 0 once nothing is left.
+        """
+        with transaction.atomic():
+            ids = list(
+                Task.all_objects
+                .filter(deleted_at__lt=deleted_before)
+                .values_list("id", flat=True)[:batch_size]
+            )
+            if ids:
+                self.subtasks_repo.purge_task_subtasks(ids)
+                tasks = Task.all_objects.filter(id__in=ids)
+                tasks._raw_delete(tasks.db)
+                self.bump_version()
+
+        return len(ids)
+
+    def bulk_create_tasks(self, data, batch_size):
+        with transaction.atomic():
+            tasks = Task.objects.bulk_create(
+                [Task(**item) for item in data],
+                batch_size=batch_size
+            )
+            # bulk_create sends no post_save signals
+            deltas = Counter()
+            for task in tasks:
+                self.counters_repo.task_deltas(task, deltas=deltas)
+            self.counters_repo.apply_deltas(deltas)
+            self.changes_repo.record(
+                [task.pk for task in tasks], TaskChange.CREATED
+            )
+            self.bump_version()
+
+        return tasks
+
+    def bulk_update_tasks(self, filters, patch):
+        """
+        Applies the same patch to every live task matching the
+        filters with a single UPDATE statement.
+
+        A new deadline skips the tasks that start after it, the rule
+        the single writes enforce.
+
+        Returns:
+            int: Number of updated tasks.
+        """
+        tasks = Task.objects.filter(**{
+            self.filter_lookups[name]: value
+            for name, value in filters.items()
+        })
+        if patch.get("deadline") is not None:
+            tasks = tasks.exclude(date_started__gt=patch["deadline"])
+
+        with transaction.atomic():
+            # the recorded changes fix the set of tasks: a task starting
+            # to match later must not be updated without its deltas
+            since = self.changes_repo.record_matching(tasks, TaskChange.UPDATED)
+            tasks = Task.objects.filter(
+                id__in=TaskChange.objects.filter(id__gt=since).values("task_id")
+            )
+            # and locking them keeps their counters' columns as read
+            self._lock_tasks(tasks)
+            deltas = self._bulk_update_counter_deltas(tasks, patch)
+            # update() bypasses save(): auto_now and signals don't run
+            updated = tasks.update(updated_at=timezone.now(), **patch)
+            self.counters_repo.apply_deltas(deltas)
+            self.bump_version()
+
+        return updated
+
+    @staticmethod
+    def _lock_tasks(tasks):
+        # SELECT ... FOR UPDATE in a COUNT, so no id reaches Python
+        sql, params = (
+            tasks.select_for_update().values("id").query.sql_with_params()
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(f"SELECT COUNT(*) FROM ({sql}) locked", params)
+
+    def _bulk_update_counter_deltas(self, tasks, patch):
+        deltas = Counter()
+        columns = {
+            column: getattr(patch[name], "pk", None)
+            for name, column in (("status", "status_id"), ("category", "category_id"))
+            if name in patch
+        }
+
+        if not columns:
+            return deltas
+
+        # one GROUP BY instead of loading the tasks
+        groups = (
+            tasks.order_by()
+            .values("status_id", "category_id")
+            .annotate(total=Count("id"))
+        )
+        for group in groups:
+            total = group.pop("total")
+            self.counters_repo.task_deltas(group, sign=-total, deltas=deltas)
+            self.counters_repo.task_deltas(
+                {**group, **columns}, sign=total, deltas=deltas
+            )
+
+        return deltas
+
+    def _with_subtasks(self, tasks):
+        # one prefetch query for the page, progress counted in SQL
+        return self.subtasks_repo.with_subtasks(
+            self.subtasks_repo.with_progress(tasks)
+        )
+
+    def _filter_tasks(self, filters):
+        tasks = Task.objects.all()
+        filters = dict(filters or {})
+
+        if filters.pop("deleted", False):
+            tasks = Task.all_objects.filter(deleted_at__isnull=False)
+
+        return tasks.filter(**{
+            self.filter_lookups[name]: value
+            for name, value in filters.items()
+        })
+
+    @staticmethod
+    def _with_related(tasks, related, fields=None):
+        # a relation deferred by .only() can't be joined
+        related = [
+            name for name in related
+            if fields is None or name in fields
+        ]
+
+        return tasks.select_related(*related) if related else tasks
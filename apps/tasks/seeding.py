@@ -0,0 +1,250 @@
+"""
+Fast generation of large, realistic task datasets.
+
+Rows are generated in chunks by a pool of worker processes, each with
+its own database connection, and written with ``COPY FROM STDIN`` on
+Postgres or ``bulk_create`` batches elsewhere. Statuses and categories
+get skewed spreads (most tasks are done, a few categories hold most of
+the tasks, some tasks have none) and dates cover the last year.
+"""
+import contextlib
+import csv
+import datetime
+import io
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import django
+from django.apps import apps
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.db import connection, connections, transaction
+from django.utils import timezone
+
+from apps.categories_statuses.lookup_cache import category_cache, status_cache
+from apps.categories_statuses.models import Category, Status
+from apps.core.versions import bump_version
+from apps.tasks.models import Task, TaskChange
+from apps.tasks.repositories.task_changes_repo import TaskChangesRepository
+from apps.tasks.repositories.task_counters_repo import TaskCountersRepository
+from apps.tasks.repositories.tasks_repo import TasksRepository
+
+STATUS_WEIGHTS = {
+    "new": 15,
+    "in progress": 20,
+    "pending": 10,
+    "blocked": 5,
+    "done": 50,
+}
+CATEGORY_COUNT = 12
+NO_CATEGORY_SHARE = 0.05
+USERNAME_PREFIX = "seed-user-"
+
+# Task columns written by the seeder, in COPY order
+COLUMNS = (
+    "title",
+    "description",
+    "creator_id",
+    "category_id",
+    "status_id",
+    "date_started",
+    "deadline",
+    "created_at",
+    "updated_at",
+)
+
+
+def seed_reference_rows(users):
+    """
+    Makes sure the seed users, categories and statuses exist.
+
+    Returns:
+        dict: Ids of the users, categories and statuses to pick from.
+    """
+    password = make_password(None)
+    User.objects.bulk_create(
+        [
+            User(username=f"{USERNAME_PREFIX}{index}", password=password)
+            for index in range(users)
+        ],
+        ignore_conflicts=True
+    )
+    Category.objects.bulk_create(
+        [Category(name=f"category {index}") for index in range(CATEGORY_COUNT)],
+        ignore_conflicts=True
+    )
+    Status.objects.bulk_create(
+        [Status(name=name) for name in STATUS_WEIGHTS],
+        ignore_conflicts=True
+    )
+    status_ids = dict(
+        Status.objects.filter(name__in=STATUS_WEIGHTS).values_list("name", "id")
+    )
+
+    return {
+        "users": list(
+            User.objects
+            .filter(username__startswith=USERNAME_PREFIX)
+            .values_list("id", flat=True)
+        ),
+        "categories": list(
+            Category.objects
+            .filter(name__startswith="category ")
+            .order_by("id")
+            .values_list("id", flat=True)
+        ),
+        "statuses": [status_ids[name] for name in STATUS_WEIGHTS],
+    }
+
+
+def generate_rows(start, stop, seed, refs, now):
+    """
+    Yields the COLUMNS values of the tasks numbered ``start`` to
+    ``stop``. Titles carry the task number, so they are unique and
+    ``unique_for_date`` holds whatever the dates are.
+    """
+    rng = random.Random(f"{seed}:{start}")
+    status_weights = list(STATUS_WEIGHTS.values())
+    # Zipf-like: category k is picked ~1/(k+1) as often as the first
+    category_weights = [1 / (k + 1) for k in range(len(refs["categories"]))]
+
+    for index in range(start, stop):
+        created_at = now - datetime.timedelta(seconds=rng.randrange(365 * 86400))
+        started = created_at.date() + datetime.timedelta(days=rng.randrange(14))
+        category_id = None
+        if refs["categories"] and rng.random() >= NO_CATEGORY_SHARE:
+            category_id = rng.choices(refs["categories"], category_weights)[0]
+
+        yield (
+            f"task {index}",
+            "lorem ipsum " * rng.randrange(1, 20),
+            rng.choice(refs["users"]) if refs["users"] else None,
+            category_id,
+            rng.choices(refs["statuses"], status_weights)[0],
+            started,
+            started + datetime.timedelta(days=rng.randrange(1, 90)),
+            created_at,
+            created_at,
+        )
+
+
+@contextlib.contextmanager
+def explicit_timestamps():
+    # let bulk_create store the generated created_at/updated_at
+    fields = [Task._meta.get_field(name) for name in ("created_at", "updated_at")]
+    saved = [(field.auto_now, field.auto_now_add) for field in fields]
+
+    for field in fields:
+        field.auto_now = field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field, (auto_now, auto_now_add) in zip(fields, saved):
+            field.auto_now, field.auto_now_add = auto_now, auto_now_add
+
+
+def copy_rows(rows):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        # None -> empty unquoted field, which COPY ... csv reads as NULL
+        writer.writerow(["" if value is None else value for value in row])
+    buffer.seek(0)
+
+    sql = (
+        f"COPY {Task._meta.db_table} ({', '.join(COLUMNS)}) "
+        "FROM STDIN WITH (FORMAT csv)"
+    )
+    with connection.cursor() as cursor:
+        raw = cursor.cursor
+        if hasattr(raw, "copy_expert"):  # psycopg2
+            raw.copy_expert(sql, buffer)
+        else:  # psycopg 3
+            with raw.copy(sql) as copy:
+                copy.write(buffer.getvalue())
+
+
+def insert_rows(rows, batch_size):
+    with explicit_timestamps():
+        Task.objects.bulk_create(
+            [Task(**dict(zip(COLUMNS, row))) for row in rows],
+            batch_size=batch_size
+        )
+
+
+def seed_chunk(start, stop, seed, refs, now, batch_size):
+    """
+    Generates and writes one chunk of tasks in one transaction; runs
+    in a worker process.
+    """
+    rows = generate_rows(start, stop, seed, refs, now)
+
+    with transaction.atomic():
+        if connection.vendor == "postgresql":
+            copy_rows(rows)
+        else:
+            insert_rows(rows, batch_size)
+
+    return stop - start
+
+
+def _init_worker():
+    # forked workers inherit a set-up Django; spawned ones don't
+    if not apps.ready:
+        django.setup()
+
+
+def seed_tasks(count, workers=1, chunk_size=20000, batch_size=2000,
+               users=100, seed=0, log=None):
+    """
+    Creates ``count`` tasks, plus the users, categories and statuses
+    they point to, then rebuilds the derived data that the bulk writes
+    bypass (change feed, counters, cache versions).
+
+    Returns:
+        float: Seconds spent.
+    """
+    started = time.perf_counter()
+    refs = seed_reference_rows(users)
+    now = timezone.now()
+    # numbering after the highest id keeps the titles of earlier runs unique
+    last_id = (
+        Task.all_objects.order_by("-id").values_list("id", flat=True).first()
+    )
+    first = (last_id or 0) + 1
+    chunks = [
+        (start, min(start + chunk_size, first + count), seed, refs, now, batch_size)
+        for start in range(first, first + count, chunk_size)
+    ]
+
+    if connection.vendor == "sqlite":
+        # SQLite takes one writer at a time
+        workers = 1
+
+    done = 0
+    if workers > 1:
+        # forked children must not share the parent's connections
+        connections.close_all()
+        with ProcessPoolExecutor(workers, initializer=_init_worker) as pool:
+            for created in pool.map(seed_chunk, *zip(*chunks)):
+                done += created
+                if log:
+                    log(f"seeded {done}/{count} tasks")
+    else:
+        for chunk in chunks:
+            done += seed_chunk(*chunk)
+            if log:
+                log(f"seeded {done}/{count} tasks")
+
+    # the seeded rows join the change feed, in one statement
+    with transaction.atomic():
+        TaskChangesRepository().record_matching(
+            Task.all_objects.filter(id__gt=last_id or 0), TaskChange.CREATED
+        )
+    TaskCountersRepository().rebuild()
+    bump_version(TasksRepository.version_namespace)
+    category_cache.invalidate()
+    status_cache.invalidate()
+
+    return time.perf_counter() - started
@@ -1,26 +1,44 @@
 import datetime
 
-from rest_framework import serializers
+from django.conf import settings
+from rest_framework import ISO_8601, serializers
+from rest_framework.fields import empty
+from rest_framework.settings import api_settings
+from rest_framework.validators import UniqueForDateValidator
 
+from apps.categories_statuses.lookup_cache import (
+    category_cache,
+    status_cache,
+)
 from apps.categories_statuses.models import (
     Category,
     Status,
 )
+from apps.categories_statuses.serializers import CachedNameRelatedField
+from apps.core.perf import record_serialization
+from apps.subtasks.serializers import (
+    SubtaskProgressField,
+    SubtaskShortSerializer,
+)
 from apps.tasks.error_messages import (
+    EMPTY_BULK_UPDATE_FILTER_ERROR,
+    EMPTY_BULK_UPDATE_PATCH_ERROR,
     TASK_TITLE_TOO_LONG_ERROR,
     WRONG_DEADLINE_ERROR,
     TASK_DESCRIPTION_TOO_LONG_ERROR,
+    UNKNOWN_TASK_FIELDS_ERROR,
 )
 from apps.tasks.models import Task
+from apps.tasks.validators import BatchUniqueForDateValidator
 
 
 class TaskInfoSerializer(serializers.ModelSerializer):
-    category = serializers.SlugRelatedField(
-        slug_field='name',
+    category = CachedNameRelatedField(
+        lookup_cache=category_cache,
         queryset=Category.objects.all()
     )
-    status = serializers.SlugRelatedField(
-        slug_field='name',
+    status = CachedNameRelatedField(
+        lookup_cache=status_cache,
         queryset=Status.objects.all()
     )
 
@@ -39,10 +57,64 @@ class TaskInfoSerializer(serializers.ModelSerializer):
         ]
 
 
+class UniqueForDateListSerializer(serializers.ListSerializer):
+    """
+    ListSerializer that checks ``unique_for_date`` for the whole batch
+    with one query instead of one query per item.
+    """
+    def to_internal_value(self, data):
+        if isinstance(data, list):
+            for validator in self.child.validators:
+                if isinstance(validator, BatchUniqueForDateValidator):
+                    validator.prefetch(self.child, data)
+
+        return super().to_internal_value(data)
+
+
 class AllTasksSerializer(serializers.ModelSerializer):
     class Meta:
         model = Task
         fields = '__all__'
+        list_serializer_class = UniqueForDateListSerializer
+
+    def __init__(self, *args, **kwargs):
+        fields = kwargs.pop("fields", None)
+        expand = kwargs.pop("expand", None) or ()
+        super().__init__(*args, **kwargs)
+
+        if fields is not None:
+            for field_name in set(self.fields) - set(fields):
+                self.fields.pop(field_name)
+
+        # needs the queryset of TasksRepository.get_all_tasks(expand=...)
+        if "subtasks" in expand:
+            self.fields["subtasks"] = SubtaskShortSerializer(
+                many=True,
+                read_only=True
+            )
+            self.fields["progress"] = SubtaskProgressField()
+
+    def run_validation(self, data=empty):
+        value = super().run_validation(data)
+
+        # validate() runs after the validators: only now is the item in
+        for validator in self.validators:
+            if isinstance(validator, BatchUniqueForDateValidator):
+                validator.remember(value)
+
+        return value
+
+    def get_validators(self):
+        validators = super().get_validators()
+
+        if not isinstance(self.parent, UniqueForDateListSerializer):
+            return validators
+
+        return [
+            BatchUniqueForDateValidator.from_validator(validator)
+            if type(validator) is UniqueForDateValidator else validator
+            for validator in validators
+        ]
 
     def validate(self, data):
         title = data.get("title")
@@ -65,3 +137,196 @@ class AllTasksSerializer(serializers.ModelSerializer):
             )
 
         return data
+
+
+class TaskRowSerializer:
+    """
+    Read-only fast path of ``AllTasksSerializer`` for list pages.
+
+    Turns ``values_list()`` rows into the same dicts the model
+    serializer builds from model instances, with one converter per
+    field compiled up front; fields whose database value already is
+    their representation (ids, strings, integers) are copied as is.
+
+    Args:
+        fields (list[str] | None): Output fields, as for
+        ``AllTasksSerializer``.
+    """
+    # DRF fields whose to_representation() leaves database values as
+    # they are
+    identity_fields = (
+        serializers.BooleanField,
+        serializers.CharField,
+        serializers.IntegerField,
+        serializers.PrimaryKeyRelatedField,
+    )
+
+    def __init__(self, fields=None):
+        serializer_fields = AllTasksSerializer(fields=fields).fields
+        self.names = list(serializer_fields)
+        self.columns = [
+            Task._meta.get_field(field.source).attname
+            for field in serializer_fields.values()
+        ]
+        # (row index, output name, converter) of the fields to convert
+        self.converters = [
+            (index, name, converter)
+            for index, (name, field) in enumerate(serializer_fields.items())
+            if (converter := self._converter(field)) is not None
+        ]
+
+    def to_representation(self, row):
+        # rows may carry extra columns (the ordering) after the fields
+        data = dict(zip(self.names, row))
+
+        for index, name, convert in self.converters:
+            value = row[index]
+            if value is not None:
+                data[name] = convert(value)
+
+        return data
+
+    def to_representation_many(self, rows):
+        with record_serialization():
+            return [self.to_representation(row) for row in rows]
+
+    def _converter(self, field):
+        if isinstance(field, self.identity_fields):
+            return None
+
+        if type(field) is serializers.DateField:
+            if getattr(field, "format", api_settings.DATE_FORMAT) == ISO_8601:
+                return datetime.date.isoformat
+
+        if type(field) is serializers.DateTimeField:
+            output_format = getattr(field, "format", api_settings.DATETIME_FORMAT)
+            field_timezone = getattr(field, "timezone", field.default_timezone())
+            if output_format == ISO_8601 and field_timezone is not None:
+                return self._iso_datetime(field_timezone)
+
+        return field.to_representation
+
+    @staticmethod
+    def _iso_datetime(field_timezone):
+        # DateTimeField.to_representation() for the aware datetimes the
+        # database returns with USE_TZ
+        def convert(value):
+            value = value.astimezone(field_timezone).isoformat()
+            if value.endswith("+00:00"):
+                return value[:-6] + "Z"
+            return value
+
+        return convert
+
+
+TASK_LIST_EXPANSIONS = ["subtasks"]
+
+# keyset ordering for every allowed ``ordering=`` value; ``id`` breaks ties
+TASK_LIST_ORDERINGS = {
+    "created_at": ("created_at", "id"),
+    "-created_at": ("-created_at", "-id"),
+    "updated_at": ("updated_at", "id"),
+    "-updated_at": ("-updated_at", "-id"),
+    "title": ("title", "id"),
+    "-title": ("-title", "-id"),
+    "id": ("id",),
+    "-id": ("-id",),
+}
+
+
+class TaskListQuerySerializer(serializers.Serializer):
+    status = serializers.IntegerField(required=False)
+    category = serializers.IntegerField(required=False)
+    creator = serializers.IntegerField(required=False)
+    date_started_after = serializers.DateField(required=False)
+    date_started_before = serializers.DateField(required=False)
+    deadline_after = serializers.DateField(required=False)
+    deadline_before = serializers.DateField(required=False)
+    deleted = serializers.BooleanField(required=False)
+    ordering = serializers.ChoiceField(
+        choices=list(TASK_LIST_ORDERINGS),
+        default="created_at"
+    )
+    fields = serializers.CharField(required=False)
+    expand = serializers.ChoiceField(
+        choices=TASK_LIST_EXPANSIONS,
+        required=False
+    )
+
+    def validate_fields(self, value):
+        fields = [name.strip() for name in value.split(",") if name.strip()]
+        known = AllTasksSerializer().fields
+        unknown = [name for name in fields if name not in known]
+
+        if unknown:
+            raise serializers.ValidationError(
+                UNKNOWN_TASK_FIELDS_ERROR.format(fields=", ".join(unknown))
+            )
+
+        return fields
+
+
+class TaskSearchQuerySerializer(serializers.Serializer):
+    q = serializers.CharField(max_length=200)
+    page = serializers.IntegerField(min_value=1, default=1)
+    page_size = serializers.IntegerField(min_value=1, required=False)
+
+
+class TaskChangesQuerySerializer(serializers.Serializer):
+    since = serializers.IntegerField(min_value=0, required=False)
+    page_size = serializers.IntegerField(min_value=1, required=False)
+
+
+class TaskBulkUpdateFilterSerializer(serializers.Serializer):
+    ids = serializers.ListField(
+        child=serializers.IntegerField(),
+        required=False,
+        allow_empty=False,
+        max_length=settings.TASKS_BULK_MAX_ITEMS
+    )
+    status = serializers.IntegerField(required=False)
+    category = serializers.IntegerField(required=False)
+    creator = serializers.IntegerField(required=False)
+    date_started_after = serializers.DateField(required=False)
+    date_started_before = serializers.DateField(required=False)
+    deadline_after = serializers.DateField(required=False)
+    deadline_before = serializers.DateField(required=False)
+
+    def validate(self, data):
+        # an empty filter would update every task
+        if not data:
+            raise serializers.ValidationError(EMPTY_BULK_UPDATE_FILTER_ERROR)
+
+        return data
+
+
+class TaskBulkPatchSerializer(serializers.Serializer):
+    status = serializers.PrimaryKeyRelatedField(
+        queryset=Status.objects.all(),
+        allow_null=True,
+        required=False
+    )
+    category = serializers.PrimaryKeyRelatedField(
+        queryset=Category.objects.all(),
+        allow_null=True,
+        required=False
+    )
+    deadline = serializers.DateField(allow_null=True, required=False)
+
+    def validate_deadline(self, value):
+        # tasks starting after the deadline are skipped by the update
+        if value is not None and value < datetime.date.today():
+            raise serializers.ValidationError(WRONG_DEADLINE_ERROR)
+
+        return value
+
+    def validate(self, data):
+        if not data:
+            raise serializers.ValidationError(EMPTY_BULK_UPDATE_PATCH_ERROR)
+
+        return data
+
+
+class TaskBulkUpdateSerializer(serializers.Serializer):
+    filter = TaskBulkUpdateFilterSerializer()
+    patch = TaskBulkPatchSerializer()
@@ -0,0 +1,82 @@
+from django.conf import settings
+
+from apps.tasks.models import TaskChange
+from apps.tasks.repositories.task_changes_repo import TaskChangesRepository
+from apps.tasks.repositories.tasks_repo import TasksRepository
+from apps.tasks.serializers import (
+    TaskChangesQuerySerializer,
+    TaskRowSerializer,
+)
+
+
+class TaskChangesService:
+    changes_repo = TaskChangesRepository()
+    tasks_repo = TasksRepository()
+    row_serializer = TaskRowSerializer
+    query_serializer = TaskChangesQuerySerializer
+
+    def get_changes(self, query_params):
+        """
+        Returns the tasks changed after the ``since`` cursor, each once
+        with its current state (``task`` is None for deleted ones), and
+        the cursor to continue from. Without ``since`` only the current
+        cursor is returned: the point to sync from after a full download.
+        """
+        query = self.query_serializer(data=query_params)
+        query.is_valid(raise_exception=True)
+        since = query.validated_data.get("since")
+
+        if since is None:
+            return {
+                "changes": [],
+                "cursor": self.changes_repo.get_head(),
+                "has_more": False,
+            }
+
+        page_size = min(
+            query.validated_data.get("page_size") or settings.TASKS_PAGE_SIZE,
+            settings.TASKS_MAX_PAGE_SIZE
+        )
+        changes = self.changes_repo.get_changes(since, limit=page_size + 1)
+        has_more = len(changes) > page_size
+        changes = changes[:page_size]
+
+        return {
+            "changes": self._latest_states(changes),
+            "cursor": changes[-1][0] if changes else since,
+            "has_more": has_more,
+        }
+
+    def _latest_states(self, changes):
+        # task id -> (its last change, its first action), in the order
+        # of the last changes
+        latest = {}
+        for seq, task_id, action in changes:
+            first_action = latest.pop(task_id, (None, action))[1]
+            latest[task_id] = (seq, first_action)
+
+        serializer = self.row_serializer()
+        rows = self.tasks_repo.get_all_task_rows(
+            filters={"ids": list(latest)},
+            columns=serializer.columns
+        )
+        tasks = {row.id: serializer.to_representation(row) for row in rows}
+
+        items = []
+        for task_id, (seq, first_action) in latest.items():
+            task = tasks.get(task_id)
+            if task is None:
+                action = TaskChange.DELETED
+            elif first_action == TaskChange.CREATED:
+                action = TaskChange.CREATED
+            else:
+                action = TaskChange.UPDATED
+
+            items.append({
+                "seq": seq,
+                "task_id": task_id,
+                "action": action,
+                "task": task,
+            })
+
+        return items
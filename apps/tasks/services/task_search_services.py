@@ -0,0 +1,52 @@
+from django.conf import settings
+
+from apps.core.response_cache import ResponseCache
+from apps.tasks.repositories.task_search_repo import TaskSearchRepository
+from apps.tasks.repositories.tasks_repo import TasksRepository
+from apps.tasks.serializers import (
+    AllTasksSerializer,
+    TaskSearchQuerySerializer,
+)
+
+
+class TaskSearchService:
+    search_repo = TaskSearchRepository()
+    tasks_repo = TasksRepository()
+    serializer = AllTasksSerializer
+    query_serializer = TaskSearchQuerySerializer
+    results_cache = ResponseCache("task_search")
+
+    def search_tasks(self, query_params):
+        query = self.query_serializer(data=query_params)
+        query.is_valid(raise_exception=True)
+
+        return self.results_cache.get_or_set(
+            self.tasks_repo.get_version(),
+            dict(query.validated_data),
+            lambda: self._search_page(**query.validated_data)
+        )
+
+    def _search_page(self, q, page, page_size=None):
+        page_size = min(
+            page_size or settings.TASKS_PAGE_SIZE,
+            settings.TASKS_MAX_PAGE_SIZE
+        )
+        offset = (page - 1) * page_size
+        # no pages past TASKS_SEARCH_MAX_RESULTS, so a client can't walk
+        # a common word with ever larger OFFSETs; the ranking itself
+        # still scores every match (see task_search_repo)
+        limit = min(page_size + 1, settings.TASKS_SEARCH_MAX_RESULTS - offset)
+
+        if limit <= 0:
+            ids = []
+        else:
+            ids = self.search_repo.search_task_ids(q, limit=limit, offset=offset)
+
+        has_next = len(ids) > page_size
+        tasks = self.search_repo.get_tasks_in_order(ids[:page_size])
+
+        return {
+            "next": page + 1 if has_next else None,
+            "previous": page - 1 if page > 1 else None,
+            "results": self.serializer(tasks, many=True).data,
+        }
@@ -0,0 +1,34 @@
+from apps.categories_statuses.lookup_cache import category_cache, status_cache
+from apps.tasks.models import TaskCounter
+from apps.tasks.repositories.task_counters_repo import TaskCountersRepository
+
+
+class TaskStatsService:
+    counters_repo = TaskCountersRepository()
+    lookup_caches = {
+        TaskCounter.STATUS: status_cache,
+        TaskCounter.CATEGORY: category_cache,
+    }
+
+    def get_tasks_stats(self):
+        by_status = self._counts(TaskCounter.STATUS)
+
+        return {
+            "total": sum(row["count"] for row in by_status),
+            "by_status": by_status,
+            "by_category": self._counts(TaskCounter.CATEGORY),
+        }
+
+    def reconcile_counters(self):
+        return len(self.counters_repo.rebuild())
+
+    def _counts(self, kind):
+        counts = self.counters_repo.get_counts(kind)
+        none_id = self.counters_repo.none_id
+        rows = [
+            {"id": row.id, "name": row.name, "count": counts.get(row.id, 0)}
+            for row in self.lookup_caches[kind].all()
+        ]
+        rows.append({"id": None, "name": None, "count": counts.get(none_id, 0)})
+
+        return rows
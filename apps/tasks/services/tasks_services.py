@@ -1,24 +1,242 @@
+from itertools import islice
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from rest_framework.exceptions import ValidationError
+from rest_framework.utils.encoders import JSONEncoder
+
+from apps.core.conditional import Validators, build_etag
+from apps.core.response_cache import ResponseCache
+from apps.tasks.pagination import KeysetPaginator
 from apps.tasks.repositories.tasks_repo import TasksRepository
-from apps.tasks.serializers import AllTasksSerializer
+from apps.tasks.serializers import (
+    AllTasksSerializer,
+    TASK_LIST_ORDERINGS,
+    TaskBulkUpdateSerializer,
+    TaskListQuerySerializer,
+    TaskRowSerializer,
+)
 
 
 class TasksService:
     tasks_repo = TasksRepository()
     serializer = AllTasksSerializer
+    row_serializer = TaskRowSerializer
+    query_serializer = TaskListQuerySerializer
+    list_cache = ResponseCache("tasks")
+    detail_cache = ResponseCache("task")
+
+    def get_all_tasks(self, query_params=None, cursor=None, page_size=None):
+        def build_page():
+            tasks, paginator, serialize = self._list_tasks(query_params)
+            page = paginator.paginate(
+                tasks,
+                cursor=cursor,
+                page_size=page_size
+            )
+
+            return self._page_data(page, serialize)
+
+        return self.list_cache.get_or_set(
+            self.tasks_repo.get_version(),
+            self._list_params(query_params, cursor, page_size),
+            build_page
+        )
+
+    async def aget_all_tasks(self, query_params=None, cursor=None, page_size=None):
+        async def build_page():
+            tasks, paginator, serialize = self._list_tasks(query_params)
+            page = await paginator.apaginate(
+                tasks,
+                cursor=cursor,
+                page_size=page_size
+            )
+
+            return self._page_data(page, serialize)
+
+        return await self.list_cache.aget_or_set(
+            await self.tasks_repo.aget_version(),
+            self._list_params(query_params, cursor, page_size),
+            build_page
+        )
+
+    def get_tasks_validators(self, variant):
+        return self._tasks_validators(self.tasks_repo.get_version(), variant)
+
+    async def aget_tasks_validators(self, variant):
+        version = await self.tasks_repo.aget_version()
+
+        return self._tasks_validators(version, variant)
+
+    def get_task_validators(self, task_id, variant):
+        return self._task_validators(
+            task_id,
+            self.tasks_repo.get_task_updated_at(pk=task_id),
+            self.tasks_repo.get_version(),
+            variant
+        )
+
+    async def aget_task_validators(self, task_id, variant):
+        return self._task_validators(
+            task_id,
+            await self.tasks_repo.aget_task_updated_at(pk=task_id),
+            await self.tasks_repo.aget_version(),
+            variant
+        )
+
+    def _list_tasks(self, query_params):
+        query = self.query_serializer(data=query_params or {})
+        query.is_valid(raise_exception=True)
+
+        filters = dict(query.validated_data)
+        ordering = TASK_LIST_ORDERINGS[filters.pop("ordering")]
+        fields = filters.pop("fields", None)
+        expand = filters.pop("expand", None)
+        paginator = KeysetPaginator(ordering=ordering)
+
+        if expand:
+            tasks = self.tasks_repo.get_all_tasks(
+                filters=filters,
+                fields=self._fields_to_load(fields, ordering),
+                expand=expand
+            )
+            serializer = self.serializer(
+                many=True,
+                fields=fields,
+                expand=[expand]
+            )
+
+            return tasks, paginator, serializer.to_representation
+
+        # read-only fast path: tuples instead of model instances
+        serializer = self.row_serializer(fields=fields)
+        # the cursor of the page is built from the ordering columns
+        columns = serializer.columns + [
+            name.lstrip("-") for name in ordering
+            if name.lstrip("-") not in serializer.columns
+        ]
+        tasks = self.tasks_repo.get_all_task_rows(
+            filters=filters,
+            columns=columns
+        )
+
+        return tasks, paginator, serializer.to_representation_many
+
+    @staticmethod
+    def _page_data(page, serialize):
+        return {
+            "next": page.next_cursor,
+            "previous": page.previous_cursor,
+            "results": serialize(page.items),
+        }
+
+    @staticmethod
+    def _list_params(query_params, cursor, page_size):
+        return {
+            "query": query_params or {},
+            "cursor": cursor,
+            "page_size": page_size,
+        }
+
+    @staticmethod
+    def _fields_to_load(fields, ordering):
+        if fields is None:
+            return None
+
+        # the cursor of the page is built from the ordering columns
+        return set(fields) | {name.lstrip("-") for name in ordering} | {"id"}
 
-    def get_all_tasks(self):
-        tasks = self.tasks_repo.get_all_tasks()
-        serializer = self.serializer(tasks, many=True)
+    @staticmethod
+    def _tasks_validators(version, variant):
+        return Validators(etag=build_etag("tasks", version, *variant))
 
-        return serializer.data
+    @staticmethod
+    def _task_validators(task_id, updated_at, version, variant):
+        if updated_at is None:
+            return None
+
+        # no Last-Modified: HTTP dates have a one-second resolution, so
+        # If-Modified-Since would answer 304 after a second write within
+        # the same second, which the ETag sees
+        return Validators(
+            etag=build_etag(
+                "task",
+                task_id,
+                updated_at.isoformat(),
+                version,
+                *variant
+            )
+        )
+
+    def export_all_tasks(self, chunk_size=None):
+        """
+        Yields every task as one NDJSON line, reading the table in
+        chunks through a server-side cursor. With
+        DB_DISABLE_SERVER_SIDE_CURSORS psycopg fetches the whole result
+        on the first chunk, so the export holds the table in memory.
+        """
+        tasks = self.tasks_repo.iter_all_tasks(
+            chunk_size=chunk_size or settings.TASKS_EXPORT_CHUNK_SIZE
+        )
+        serializer = self.serializer()
+        encoder = JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+        for task in tasks:
+            yield encoder.encode(serializer.to_representation(task)) + "\n"
+
+    async def aexport_all_tasks(self, chunk_size=None):
+        """
+        Async version of ``export_all_tasks()`` for ASGI responses, one
+        string per chunk. Django would turn a sync iterator into a list
+        before sending the first byte.
+        """
+        chunk_size = chunk_size or settings.TASKS_EXPORT_CHUNK_SIZE
+        lines = self.export_all_tasks(chunk_size=chunk_size)
+        # thread-sensitive: every chunk comes from the thread (and the
+        # connection) that opened the cursor
+        next_lines = sync_to_async(lambda: list(islice(lines, chunk_size)))
+
+        try:
+            while chunk := await next_lines():
+                yield "".join(chunk)
+        finally:
+            await sync_to_async(lines.close)()
 
     def get_task_info_by_task_id(self, task_id):
+        def build_task_info():
+            task = self.tasks_repo.get_task_info_by_pk(
+                pk=task_id
+            )
+            serializer = self.serializer(task, expand=["subtasks"])
+
+            return serializer.data
+
+        return self.detail_cache.get_or_set(
+            self.tasks_repo.get_version(),
+            {"task_id": task_id},
+            build_task_info
+        )
+
+    async def aget_task_info_by_task_id(self, task_id):
+        async def build_task_info():
+            task = await self.tasks_repo.aget_task_info_by_pk(
+                pk=task_id
+            )
+            serializer = self.serializer(task, expand=["subtasks"])
+
+            return serializer.data
+
+        return await self.detail_cache.aget_or_set(
+            await self.tasks_repo.aget_version(),
+            {"task_id": task_id},
+            build_task_info
+        )
+
+    def delete_task_by_id(self, task_id):
         task = self.tasks_repo.get_task_by_pk(
             pk=task_id
         )
-        serializer = self.serializer(task)
-
-        return serializer.data
+        self.tasks_repo.soft_delete_task(task=task)
 
     def create_new_task(self, data):
         serializer = self.serializer(
@@ -36,3 +254,44 @@ class TasksService:
 
         else:
             return serializer.errors
+
+    def create_new_tasks(self, data):
+        serializer = self.serializer(
+            data=data,
+            many=True,
+            allow_empty=False,
+            max_length=settings.TASKS_BULK_MAX_ITEMS
+        )
+
+        if not serializer.is_valid():
+            raise ValidationError(self._errors_by_index(serializer.errors))
+
+        new_tasks = self.tasks_repo.bulk_create_tasks(
+            data=serializer.validated_data,
+            batch_size=settings.TASKS_BULK_BATCH_SIZE
+        )
+
+        return self.serializer(new_tasks, many=True).data
+
+    def update_tasks_in_bulk(self, data):
+        serializer = TaskBulkUpdateSerializer(data=data)
+        serializer.is_valid(raise_exception=True)
+
+        updated = self.tasks_repo.bulk_update_tasks(
+            filters=serializer.validated_data["filter"],
+            patch=serializer.validated_data["patch"]
+        )
+
+        return {"updated": updated}
+
+    @staticmethod
+    def _errors_by_index(errors):
+        # errors of the list itself (not a list, too long) come as a dict
+        if not isinstance(errors, list):
+            return errors
+
+        return {
+            str(index): item_errors
+            for index, item_errors in enumerate(errors)
+            if item_errors
+        }
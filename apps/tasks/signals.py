@@ -0,0 +1,108 @@
+from django.db.models.signals import (
+    post_delete,
+    post_save,
+    pre_delete,
+    pre_save,
+)
+from django.dispatch import receiver
+
+from apps.categories_statuses.models import (
+    Category,
+    Status,
+)
+from apps.tasks.models import Task, TaskChange, TaskCounter
+from apps.tasks.repositories.task_changes_repo import TaskChangesRepository
+from apps.tasks.repositories.task_counters_repo import TaskCountersRepository
+from apps.tasks.repositories.tasks_repo import TasksRepository
+
+
+@receiver([post_save, post_delete], sender=Task)
+def bump_tasks_version_on_task_change(sender, **kwargs):
+    TasksRepository().bump_version()
+
+
+@receiver(post_delete, sender=Category)
+@receiver(post_delete, sender=Status)
+def bump_tasks_version_on_set_null(sender, **kwargs):
+    # deleting a category/status SET_NULLs its tasks without signals
+    TasksRepository().bump_version()
+
+
+@receiver(pre_save, sender=Task)
+def remember_counted_task_state(sender, instance, raw=False, **kwargs):
+    if raw or instance._state.adding:
+        return
+
+    # the counters need the values the row had before this save
+    instance._counted_state = (
+        Task.all_objects
+        .filter(pk=instance.pk)
+        .values("status_id", "category_id", "deleted_at")
+        .first()
+    )
+
+
+@receiver(post_save, sender=Task)
+def update_task_counters_on_save(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+
+    repo = TaskCountersRepository()
+    deltas = repo.task_deltas(instance)
+    previous = instance.__dict__.pop("_counted_state", None)
+
+    if previous is not None:
+        repo.task_deltas(previous, sign=-1, deltas=deltas)
+
+    repo.apply_deltas(deltas)
+
+
+@receiver(post_delete, sender=Task)
+def update_task_counters_on_delete(sender, instance, **kwargs):
+    repo = TaskCountersRepository()
+    repo.apply_deltas(repo.task_deltas(instance, sign=-1))
+
+
+@receiver(post_delete, sender=Category)
+def move_category_counter_on_set_null(sender, instance, **kwargs):
+    TaskCountersRepository().move_to_none(TaskCounter.CATEGORY, instance.pk)
+
+
+@receiver(post_delete, sender=Status)
+def move_status_counter_on_set_null(sender, instance, **kwargs):
+    TaskCountersRepository().move_to_none(TaskCounter.STATUS, instance.pk)
+
+
+@receiver(post_save, sender=Task)
+def record_task_change_on_save(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+
+    if created:
+        action = TaskChange.CREATED
+    elif instance.deleted_at is not None:
+        action = TaskChange.DELETED
+    else:
+        action = TaskChange.UPDATED
+
+    TaskChangesRepository().record([instance.pk], action)
+
+
+@receiver(post_delete, sender=Task)
+def record_task_change_on_delete(sender, instance, **kwargs):
+    TaskChangesRepository().record([instance.pk], TaskChange.DELETED)
+
+
+@receiver(pre_delete, sender=Category)
+def record_task_changes_on_category_delete(sender, instance, **kwargs):
+    # the SET_NULL that follows sends no signals
+    TaskChangesRepository().record_matching(
+        Task.objects.filter(category_id=instance.pk), TaskChange.UPDATED
+    )
+
+
+@receiver(pre_delete, sender=Status)
+def record_task_changes_on_status_delete(sender, instance, **kwargs):
+    TaskChangesRepository().record_matching(
+        Task.objects.filter(status_id=instance.pk), TaskChange.UPDATED
+    )
@@ -0,0 +1 @@
+TASK_SUCCESS_DELETING_MESSAGE = "Task was deleted successful."
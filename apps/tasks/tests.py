@@ -1,3 +1,881 @@
-from django.test import TestCase
+import base64
+import datetime
+import json
+from io import StringIO
+from unittest import mock
 
-# Create your tests here.
+from asgiref.sync import sync_to_async
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import DatabaseError, connection
+from django.db.models import Count
+from django.db.transaction import TransactionManagementError
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from apps.categories_statuses.lookup_cache import category_cache, status_cache
+from apps.categories_statuses.models import Category, Status
+from apps.core.db_routing import STICKY_COOKIE
+from apps.subtasks.models import Subtask
+from apps.tasks import seeding
+from apps.tasks.models import Task, TaskChange, TaskCounter
+from apps.tasks.pagination import KeysetPaginator
+from apps.tasks.repositories.task_changes_repo import TaskChangesRepository
+from apps.tasks.repositories.task_counters_repo import TaskCountersRepository
+from apps.tasks.repositories.tasks_repo import TasksRepository
+from apps.tasks.serializers import (
+    AllTasksSerializer,
+    TASK_LIST_ORDERINGS,
+    TaskRowSerializer,
+)
+from apps.tasks.services.tasks_services import TasksService
+
+
+class TaskIndexesTestCase(TestCase):
+    def test_planned_queries_use_their_indexes(self):
+        call_command("explain_task_queries", "--check", stdout=StringIO())
+
+
+class KeysetPaginatorTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        moment = timezone.now()
+        # pairs of tasks share created_at, so ``id`` has to break ties
+        for index in range(7):
+            task = Task.objects.create(title=f"task {index % 3}")
+            Task.objects.filter(id=task.id).update(
+                created_at=moment - datetime.timedelta(minutes=index // 2)
+            )
+
+    def walk(self, paginator, page_size):
+        """
+        Follows the next cursors to the end, then the previous cursors
+        back to the start; returns the ids seen each way.
+        """
+        forward, backward = [], []
+        page = paginator.paginate(Task.objects.all(), page_size=page_size)
+        forward.extend(task.id for task in page.items)
+        self.assertIsNone(page.previous_cursor)
+
+        while page.next_cursor:
+            page = paginator.paginate(
+                Task.objects.all(), cursor=page.next_cursor, page_size=page_size
+            )
+            forward.extend(task.id for task in page.items)
+
+        backward[:0] = [task.id for task in page.items]
+        while page.previous_cursor:
+            page = paginator.paginate(
+                Task.objects.all(), cursor=page.previous_cursor, page_size=page_size
+            )
+            backward[:0] = [task.id for task in page.items]
+
+        return forward, backward
+
+    def test_every_ordering_pages_through_all_tasks_both_ways(self):
+        for name, ordering in TASK_LIST_ORDERINGS.items():
+            with self.subTest(ordering=name):
+                expected = list(
+                    Task.objects.order_by(*ordering).values_list("id", flat=True)
+                )
+                forward, backward = self.walk(KeysetPaginator(ordering), 2)
+
+                self.assertEqual(forward, expected)
+                self.assertEqual(backward, expected)
+
+    @override_settings(TASKS_PAGE_SIZE=3, TASKS_MAX_PAGE_SIZE=4)
+    def test_page_size_defaults_and_is_capped(self):
+        paginator = KeysetPaginator()
+
+        self.assertEqual(paginator.get_page_size(), 3)
+        self.assertEqual(paginator.get_page_size("100"), 4)
+        self.assertEqual(
+            len(paginator.paginate(Task.objects.all(), page_size=100).items), 4
+        )
+
+    def test_invalid_page_size_is_rejected(self):
+        for page_size in ("0", "-1", "many"):
+            with self.subTest(page_size=page_size):
+                response = self.client.get("/tasks/", {"page_size": page_size})
+
+                self.assertEqual(response.status_code, 400)
+                self.assertIn("page_size", response.json())
+
+    def test_tampered_cursors_are_rejected(self):
+        def encode(payload):
+            raw = json.dumps(payload).encode()
+            return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+        valid = KeysetPaginator().paginate(Task.objects.all(), page_size=2)
+        cursors = [
+            "not a cursor",
+            valid.next_cursor[:-3],
+            encode(["created_at", "id"]),
+            # a cursor of another ordering
+            encode({"o": "title,id", "p": ["task 1", 1], "r": 0}),
+            encode({"o": "created_at,id", "p": ["yesterday", 1], "r": 0}),
+            encode({"o": "created_at,id", "p": [1], "r": 0}),
+        ]
+
+        for cursor in cursors:
+            with self.subTest(cursor=cursor):
+                response = self.client.get("/tasks/", {"cursor": cursor})
+
+                self.assertEqual(response.status_code, 400)
+                self.assertIn("cursor", response.json())
+
+
+class BatchUniqueForDateTestCase(TestCase):
+    """
+    The batch validator must report what DRF's UniqueForDateValidator
+    reports for each item validated on its own.
+    """
+    @classmethod
+    def setUpTestData(cls):
+        Task.objects.create(title="taken", date_started=datetime.date(2030, 1, 1))
+
+    @staticmethod
+    def item(title, date_started="2030-01-01"):
+        return {"title": title, "description": "details", "date_started": date_started}
+
+    @staticmethod
+    def single_errors(item):
+        serializer = AllTasksSerializer(data=item)
+        serializer.is_valid()
+        return serializer.errors
+
+    @staticmethod
+    def batch_errors(items):
+        serializer = AllTasksSerializer(data=items, many=True)
+        serializer.is_valid()
+        return serializer.errors or [{} for _ in items]
+
+    def test_existing_row(self):
+        items = [self.item("free"), self.item("taken")]
+
+        errors = self.batch_errors(items)
+
+        self.assertEqual(errors[0], {})
+        self.assertEqual(errors[1], self.single_errors(items[1]))
+        self.assertIn("title", errors[1])
+
+    def test_duplicate_inside_the_batch(self):
+        items = [self.item("twice"), self.item("other"), self.item("twice")]
+
+        errors = self.batch_errors(items)
+        # on its own, the second copy only conflicts once the first is saved
+        Task.objects.create(title="twice", date_started=datetime.date(2030, 1, 1))
+
+        self.assertEqual(errors[:2], [{}, {}])
+        self.assertEqual(errors[2], self.single_errors(items[2]))
+
+    def test_same_title_on_another_date(self):
+        items = [self.item("taken", "2030-01-02"), self.item("taken", "2030-01-03")]
+
+        self.assertEqual(self.batch_errors(items), [{}, {}])
+        self.assertEqual(self.single_errors(items[0]), {})
+
+    def test_rejected_item_does_not_count_as_a_duplicate(self):
+        late = {**self.item("again"), "deadline": "2029-12-31"}
+        items = [late, self.item("again")]
+
+        errors = self.batch_errors(items)
+
+        self.assertEqual(errors[0], self.single_errors(late))
+        self.assertNotIn("title", errors[0])
+        self.assertEqual(errors[1], {})
+
+    def test_none_date(self):
+        # DRF's validator fails on a None date (date.day); the batch one
+        # follows Model.validate_unique, which never reports a conflict
+        items = [self.item("taken", None), self.item("taken", None)]
+
+        self.assertEqual(self.batch_errors(items), [{}, {}])
+        Task(title="taken", date_started=None).validate_unique()
+
+
+class TaskQueryCountTestCase(TestCase):
+    """
+    Guards the task read paths against N+1 queries: the number of
+    queries must not grow with the number of tasks returned.
+    """
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="creator")
+        cls.category = Category.objects.create(name="work")
+        cls.status = Status.objects.create(name="new")
+
+    def create_tasks(self, count):
+        # run the on_commit version bumps, as a real commit would
+        with self.captureOnCommitCallbacks(execute=True):
+            for index in range(count):
+                Task.objects.create(
+                    title=f"task {index}",
+                    creator=self.user,
+                    category=self.category,
+                    status=self.status,
+                )
+
+    def test_related_objects_are_joined_on_request(self):
+        self.create_tasks(10)
+
+        with self.assertNumQueries(1):
+            names = [
+                (task.category.name, task.status.name, task.creator.username)
+                for task in TasksRepository().get_all_tasks(
+                    related=("category", "status", "creator")
+                )
+            ]
+
+        self.assertEqual(len(names), 10)
+
+    def test_id_only_read_paths_join_nothing(self):
+        self.create_tasks(2)
+        task = Task.objects.first()
+        related_tables = (
+            Category._meta.db_table, Status._meta.db_table, User._meta.db_table
+        )
+
+        with CaptureQueriesContext(connection) as queries:
+            detail = self.client.get(f"/tasks/{task.id}/")
+            export = b"".join(self.client.get("/tasks/export/").streaming_content)
+            search = self.client.get("/tasks/search/", {"q": "task"})
+
+        self.assertEqual(detail.json()["category"], self.category.id)
+        self.assertEqual(len(export.splitlines()), 2)
+        self.assertEqual(len(search.json()["results"]), 2)
+        for query in queries:
+            self.assertFalse(
+                any(table in query["sql"] for table in related_tables),
+                query["sql"]
+            )
+
+    def test_tasks_list_query_count_is_constant(self):
+        self.create_tasks(3)
+        with CaptureQueriesContext(connection) as small_page:
+            self.client.get("/tasks/")
+
+        self.create_tasks(20)
+        with CaptureQueriesContext(connection) as large_page:
+            response = self.client.get("/tasks/")
+
+        self.assertEqual(len(response.json()["results"]), 23)
+        self.assertEqual(len(small_page), len(large_page))
+
+
+class TaskRowSerializerTestCase(TestCase):
+    """
+    Contract of the list fast path: its output must render to the same
+    bytes as AllTasksSerializer for the same tasks.
+    """
+    @classmethod
+    def setUpTestData(cls):
+        user = User.objects.create_user(username="creator")
+        category = Category.objects.create(name="work")
+        status = Status.objects.create(name="new")
+        Task.objects.create(
+            title="full — ünïcode",
+            description="all fields set",
+            creator=user,
+            category=category,
+            status=status,
+            date_started=datetime.date(2024, 2, 29),
+            deadline=datetime.date(2024, 3, 1),
+            deleted_at=None,
+        )
+        Task.objects.create(title="empty", description="")
+        Task.all_objects.create(
+            title="deleted",
+            description="soft-deleted",
+            deleted_at=timezone.now(),
+        )
+
+    def assertRendersLikeModelSerializer(self, fields=None):
+        row_serializer = TaskRowSerializer(fields=fields)
+        tasks = Task.all_objects.order_by("id")
+        rows = tasks.values_list(*row_serializer.columns, named=True)
+
+        expected = AllTasksSerializer(tasks, many=True, fields=fields).data
+        actual = row_serializer.to_representation_many(rows)
+
+        self.assertEqual(
+            JSONRenderer().render(actual),
+            JSONRenderer().render(expected)
+        )
+
+    def test_all_fields(self):
+        self.assertRendersLikeModelSerializer()
+
+    def test_selected_fields(self):
+        self.assertRendersLikeModelSerializer(["title", "category", "updated_at"])
+
+    def test_other_time_zone(self):
+        with timezone.override("Europe/Berlin"):
+            self.assertRendersLikeModelSerializer()
+
+
+class TaskChangesFeedTestCase(TestCase):
+    def setUp(self):
+        self.start = self.client.get("/tasks/changes/").json()["cursor"]
+
+    def get_changes(self, since, page_size=50):
+        return self.client.get(
+            "/tasks/changes/", {"since": since, "page_size": page_size}
+        ).json()
+
+    def test_feed_returns_current_states_and_tombstones(self):
+        kept = Task.objects.create(title="kept")
+        deleted = Task.objects.create(title="deleted")
+        TasksRepository().soft_delete_task(deleted)
+        TasksRepository().bulk_update_tasks(
+            filters={"ids": [kept.id]},
+            patch={"description": "patched"}
+        )
+
+        feed = self.get_changes(self.start)
+
+        self.assertFalse(feed["has_more"])
+        self.assertEqual(
+            [(item["task_id"], item["action"]) for item in feed["changes"]],
+            [(deleted.id, "deleted"), (kept.id, "created")]
+        )
+        self.assertIsNone(feed["changes"][0]["task"])
+        self.assertEqual(feed["changes"][1]["task"]["description"], "patched")
+        self.assertEqual(self.get_changes(feed["cursor"])["changes"], [])
+
+    def test_feed_pages_follow_the_cursor(self):
+        tasks = [Task.objects.create(title=f"task {index}") for index in range(5)]
+
+        first = self.get_changes(self.start, page_size=3)
+        rest = self.get_changes(first["cursor"], page_size=3)
+
+        self.assertTrue(first["has_more"])
+        self.assertFalse(rest["has_more"])
+        self.assertEqual(
+            [item["task_id"] for item in first["changes"] + rest["changes"]],
+            [task.id for task in tasks]
+        )
+
+
+class TasksExportTestCase(TestCase):
+    def setUp(self):
+        self.tasks = [Task.objects.create(title=f"task {index}") for index in range(5)]
+
+    def assertExported(self, content):
+        lines = content.decode().splitlines()
+
+        self.assertEqual(
+            [json.loads(line)["id"] for line in lines],
+            [task.id for task in self.tasks]
+        )
+        self.assertEqual(json.loads(lines[0]), AllTasksSerializer(self.tasks[0]).data)
+
+    @override_settings(TASKS_EXPORT_CHUNK_SIZE=2)
+    def test_exports_every_task_as_a_line(self):
+        response = self.client.get("/tasks/export/")
+
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        self.assertFalse(response.is_async)
+        self.assertExported(b"".join(response.streaming_content))
+
+    @override_settings(TASKS_EXPORT_CHUNK_SIZE=2)
+    async def test_asgi_export_streams_chunks(self):
+        response = await self.async_client.get("/tasks/export/")
+        chunks = [chunk async for chunk in response.streaming_content]
+
+        # an async iterator: Django would list a sync one up front
+        self.assertTrue(response.is_async)
+        self.assertEqual(len(chunks), 3)
+        self.assertExported(b"".join(chunks))
+
+
+class TaskChangesAutocommitTestCase(TransactionTestCase):
+    def test_recording_needs_a_transaction(self):
+        repo = TaskChangesRepository()
+
+        with self.assertRaises(TransactionManagementError):
+            repo.record([1], TaskChange.UPDATED)
+        with self.assertRaises(TransactionManagementError):
+            repo.record_matching(Task.objects.all(), TaskChange.UPDATED)
+        self.assertFalse(TaskChange.objects.exists())
+
+    def test_saves_outside_a_transaction_record_with_the_write(self):
+        status = Status.objects.create(name="new")
+        task = Task.objects.create(title="task", status=status)
+        task.title = "renamed"
+        task.save()
+
+        self.assertEqual(
+            list(TaskChange.objects.order_by("id").values_list("task_id", "action")),
+            [(task.id, TaskChange.CREATED), (task.id, TaskChange.UPDATED)]
+        )
+        self.assertEqual(
+            TaskCountersRepository().get_counts(TaskCounter.STATUS), {status.id: 1}
+        )
+
+
+class TasksBulkCreateTestCase(TestCase):
+    @staticmethod
+    def task(title, **fields):
+        return {
+            "title": title,
+            "description": "details",
+            "date_started": "2030-01-01",
+            **fields,
+        }
+
+    def post(self, items):
+        return self.client.post("/tasks/bulk/", items, content_type="application/json")
+
+    def test_creates_every_task(self):
+        response = self.post([self.task("first"), self.task("second")])
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(
+            [task["title"] for task in response.json()], ["first", "second"]
+        )
+        self.assertEqual(Task.objects.count(), 2)
+
+    def test_errors_are_reported_by_index(self):
+        Task.objects.create(title="taken", date_started=datetime.date(2030, 1, 1))
+
+        response = self.post([
+            self.task("fine"),
+            self.task("late", deadline="2000-01-01"),
+            self.task("taken"),
+            self.task("x" * 80),
+        ])
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(sorted(response.json()), ["1", "2", "3"])
+        self.assertIn("title", response.json()["2"])
+        self.assertEqual(Task.objects.count(), 1)
+
+    @override_settings(TASKS_BULK_MAX_ITEMS=2)
+    def test_batch_size_is_limited(self):
+        response = self.post([self.task(f"task {index}") for index in range(3)])
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("non_field_errors", response.json())
+        self.assertFalse(Task.objects.exists())
+
+    def test_empty_batch_is_rejected(self):
+        self.assertEqual(self.post([]).status_code, 400)
+
+    @override_settings(TASKS_BULK_BATCH_SIZE=1)
+    def test_a_failing_write_rolls_back_the_whole_batch(self):
+        items = [self.task(f"task {index}") for index in range(3)]
+
+        with mock.patch.object(
+            TaskChangesRepository, "record", side_effect=DatabaseError
+        ):
+            with self.assertRaises(DatabaseError):
+                TasksService().create_new_tasks(items)
+
+        self.assertFalse(Task.all_objects.exists())
+        self.assertFalse(TaskCounter.objects.exists())
+
+
+class TasksBulkUpdateTestCase(TestCase):
+    def setUp(self):
+        self.new = Status.objects.create(name="new")
+        self.done = Status.objects.create(name="done")
+        start = datetime.date.today()
+        self.tasks = [
+            Task.objects.create(
+                title=f"task {index}",
+                status=self.new,
+                date_started=start + datetime.timedelta(days=index * 10)
+            )
+            for index in range(3)
+        ]
+        Task.objects.create(title="other", status=self.done)
+        self.head = TaskChangesRepository().get_head()
+
+    def patch(self, filters, patch):
+        return self.client.post(
+            "/tasks/bulk-update/",
+            {"filter": filters, "patch": patch},
+            content_type="application/json"
+        )
+
+    def test_updates_every_match_and_moves_the_counters(self):
+        response = self.patch({"status": self.new.id}, {"status": self.done.id})
+
+        self.assertEqual(response.json(), {"updated": 3})
+        self.assertEqual(Task.objects.filter(status=self.done).count(), 4)
+        self.assertEqual(
+            TaskCountersRepository().get_counts(TaskCounter.STATUS),
+            {self.new.id: 0, self.done.id: 4}
+        )
+        self.assertEqual(
+            sorted(
+                TaskChange.objects.filter(id__gt=self.head)
+                .values_list("task_id", flat=True)
+            ),
+            [task.id for task in self.tasks]
+        )
+
+    def test_statements_do_not_grow_with_the_matches(self):
+        def statements(filters):
+            with CaptureQueriesContext(connection) as queries:
+                TasksRepository().bulk_update_tasks(
+                    filters=filters, patch={"status": self.done}
+                )
+            return len(queries)
+
+        self.assertEqual(
+            statements({"ids": [self.tasks[0].id]}),
+            statements({"status": self.new.id})
+        )
+
+    def test_deadline_before_today_is_rejected(self):
+        yesterday = datetime.date.today() - datetime.timedelta(days=1)
+
+        response = self.patch({"status": self.new.id}, {"deadline": str(yesterday)})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("deadline", response.json()["patch"])
+
+    def test_tasks_starting_after_the_deadline_are_skipped(self):
+        deadline = self.tasks[1].date_started
+
+        response = self.patch({"status": self.new.id}, {"deadline": str(deadline)})
+
+        self.assertEqual(response.json(), {"updated": 2})
+        self.assertEqual(
+            list(Task.objects.filter(deadline=deadline).order_by("id")),
+            self.tasks[:2]
+        )
+
+
+# a single test process shares its locmem version counters
+@override_settings(VERSIONS_SHARED=True)
+class TaskDetailConditionalGetTestCase(TestCase):
+    def setUp(self):
+        # committed writes bump the versions the cached responses hang on
+        with self.captureOnCommitCallbacks(execute=True):
+            self.category = Category.objects.create(name="work")
+            self.task = Task.objects.create(title="task", category=self.category)
+        self.url = f"/tasks/{self.task.id}/"
+        # replica reads get no validators; read the primary even when a
+        # replica is configured
+        self.client.cookies[STICKY_COOKIE] = "1"
+
+    def test_only_the_etag_validates_the_detail(self):
+        first = self.client.get(self.url)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.task.title = "renamed"
+            self.task.save()
+
+        by_date = self.client.get(
+            self.url, HTTP_IF_MODIFIED_SINCE="Fri, 01 Jan 2100 00:00:00 GMT"
+        )
+        by_etag = self.client.get(self.url, HTTP_IF_NONE_MATCH=first["ETag"])
+
+        self.assertNotIn("Last-Modified", first)
+        self.assertEqual(by_date.status_code, 200)
+        self.assertEqual(by_etag.status_code, 200)
+
+    def test_unchanged_task_is_answered_with_304(self):
+        first = self.client.get(self.url)
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=first["ETag"])
+
+        self.assertEqual(response.status_code, 304)
+
+
+@override_settings(VERSIONS_SHARED=True)
+class TasksListConditionalGetTestCase(TestCase):
+    def setUp(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.task = Task.objects.create(title="task")
+        self.client.cookies[STICKY_COOKIE] = "1"
+
+    def test_list_is_revalidated_until_a_committed_write(self):
+        first = self.client.get("/tasks/")
+        unchanged = self.client.get("/tasks/", HTTP_IF_NONE_MATCH=first["ETag"])
+        with self.captureOnCommitCallbacks(execute=True):
+            Task.objects.create(title="another task")
+        changed = self.client.get("/tasks/", HTTP_IF_NONE_MATCH=first["ETag"])
+
+        self.assertEqual(unchanged.status_code, 304)
+        self.assertEqual(changed.status_code, 200)
+        self.assertNotEqual(changed["ETag"], first["ETag"])
+        self.assertEqual(len(changed.json()["results"]), 2)
+
+
+class TaskDetailTestCase(TestCase):
+    def setUp(self):
+        category = Category.objects.create(name="work")
+        self.task = Task.objects.create(title="task", category=category)
+        Subtask.objects.create(task=self.task, title="step", is_done=True)
+        Subtask.objects.create(task=self.task, title="next step")
+
+    def assertDetail(self, data):
+        expected = AllTasksSerializer(self.task).data
+        # the list representation plus the subtasks and their progress
+        self.assertEqual(set(data), set(expected) | {"subtasks", "progress"})
+        self.assertEqual(data["category"], self.task.category_id)
+        self.assertEqual(data["progress"], {"done": 1, "total": 2})
+        self.assertEqual(len(data["subtasks"]), 2)
+
+    def test_detail_extends_the_list_representation(self):
+        self.assertDetail(self.client.get(f"/tasks/{self.task.id}/").json())
+
+    async def test_async_detail_with_cold_lookup_caches(self):
+        await sync_to_async(category_cache.invalidate)()
+        await sync_to_async(status_cache.invalidate)()
+
+        data = await TasksService().aget_task_info_by_task_id(self.task.id)
+
+        await sync_to_async(self.assertDetail)(data)
+
+
+class SoftDeleteTestCase(TestCase):
+    def setUp(self):
+        self.status = Status.objects.create(name="new")
+        self.task = Task.objects.create(title="task", status=self.status)
+
+    def test_delete_hides_the_task_but_keeps_the_row(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.delete(f"/tasks/{self.task.id}/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(Task.objects.filter(id=self.task.id).exists())
+        self.assertIsNotNone(Task.all_objects.get(id=self.task.id).deleted_at)
+        self.assertEqual(self.client.get(f"/tasks/{self.task.id}/").status_code, 404)
+        self.assertEqual(
+            TaskCounter.objects.get(kind=TaskCounter.STATUS, object_id=self.status.id).count,
+            0
+        )
+
+    def test_deleted_tasks_are_listed_on_request_only(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            TasksRepository().soft_delete_task(self.task)
+            live = Task.objects.create(title="live")
+
+        self.assertEqual(list(Task.objects.values_list("id", flat=True)), [live.id])
+        self.assertEqual(
+            [task["id"] for task in self.client.get("/tasks/").json()["results"]],
+            [live.id]
+        )
+        self.assertEqual(
+            [
+                task["id"] for task in
+                self.client.get("/tasks/", {"deleted": "true"}).json()["results"]
+            ],
+            [self.task.id]
+        )
+
+
+class PurgeDeletedTasksTestCase(TestCase):
+    def setUp(self):
+        long_ago = timezone.now() - datetime.timedelta(days=60)
+        self.old = [Task.objects.create(title=f"old {index}") for index in range(5)]
+        self.recent = Task.objects.create(title="recent")
+        for task in self.old + [self.recent]:
+            TasksRepository().soft_delete_task(task)
+            Subtask.objects.create(task=task, title="step")
+        Task.all_objects.filter(id__in=[task.id for task in self.old]).update(
+            deleted_at=long_ago
+        )
+        self.kept = Task.objects.create(title="kept")
+
+    def test_purges_old_tasks_in_batches(self):
+        changes = TaskChange.objects.count()
+
+        with mock.patch("apps.tasks.repositories.tasks_repo.bump_version") as bump:
+            with self.captureOnCommitCallbacks(execute=True):
+                call_command(
+                    "purge_deleted_tasks", "--batch-size=2", "--sleep=0",
+                    stdout=StringIO()
+                )
+
+        self.assertEqual(
+            set(Task.all_objects.values_list("id", flat=True)),
+            {self.recent.id, self.kept.id}
+        )
+        self.assertEqual(
+            list(Subtask.objects.values_list("task_id", flat=True)),
+            [self.recent.id]
+        )
+        # one bump per batch, no second tombstone for the purged rows
+        self.assertEqual(bump.call_count, 3)
+        self.assertEqual(TaskChange.objects.count(), changes)
+
+
+class TaskCountersTestCase(TestCase):
+    def setUp(self):
+        self.new = Status.objects.create(name="new")
+        self.done = Status.objects.create(name="done")
+        self.work = Category.objects.create(name="work")
+        self.home = Category.objects.create(name="home")
+
+    @staticmethod
+    def counts(kind):
+        return {
+            object_id: count
+            for object_id, count in TaskCountersRepository().get_counts(kind).items()
+            if count
+        }
+
+    def assertCounts(self, statuses, categories):
+        self.assertEqual(self.counts(TaskCounter.STATUS), statuses)
+        self.assertEqual(self.counts(TaskCounter.CATEGORY), categories)
+
+    def assertMatchesRebuild(self):
+        incremental = (self.counts(TaskCounter.STATUS), self.counts(TaskCounter.CATEGORY))
+        call_command("reconcile_task_counters", stdout=StringIO())
+
+        self.assertEqual(
+            (self.counts(TaskCounter.STATUS), self.counts(TaskCounter.CATEGORY)),
+            incremental
+        )
+
+    def test_create(self):
+        Task.objects.create(title="a", status=self.new, category=self.work)
+        Task.objects.create(title="b", status=self.new)
+
+        self.assertCounts({self.new.id: 2}, {self.work.id: 1, 0: 1})
+        self.assertMatchesRebuild()
+
+    def test_update_moves_the_task(self):
+        task = Task.objects.create(title="a", status=self.new, category=self.work)
+
+        task.status = self.done
+        task.category = None
+        task.save()
+
+        self.assertCounts({self.done.id: 1}, {0: 1})
+        self.assertMatchesRebuild()
+
+    def test_soft_delete(self):
+        Task.objects.create(title="a", status=self.new, category=self.work)
+        deleted = Task.objects.create(title="b", status=self.new, category=self.home)
+
+        TasksRepository().soft_delete_task(deleted)
+
+        self.assertCounts({self.new.id: 1}, {self.work.id: 1})
+        self.assertMatchesRebuild()
+
+    def test_deleting_a_status_or_category_moves_its_tasks_to_none(self):
+        Task.objects.create(title="a", status=self.new, category=self.work)
+        Task.objects.create(title="b", status=self.done, category=self.work)
+
+        self.work.delete()
+        self.new.delete()
+
+        self.assertCounts({0: 1, self.done.id: 1}, {0: 2})
+        self.assertMatchesRebuild()
+
+    def test_bulk_writes(self):
+        tasks = TasksRepository().bulk_create_tasks(
+            [{"title": f"task {index}", "status": self.new} for index in range(3)],
+            batch_size=2
+        )
+        TasksRepository().bulk_update_tasks(
+            filters={"ids": [tasks[0].id]},
+            patch={"status": self.done, "category": self.home}
+        )
+
+        self.assertCounts(
+            {self.new.id: 2, self.done.id: 1}, {self.home.id: 1, 0: 2}
+        )
+        self.assertMatchesRebuild()
+
+
+class TaskSearchTestCase(TestCase):
+    def search(self, q, **params):
+        return self.client.get("/tasks/search/", {"q": q, **params}).json()
+
+    def titles(self, q, **params):
+        return [task["title"] for task in self.search(q, **params)["results"]]
+
+    def test_title_matches_rank_first(self):
+        Task.objects.create(title="groceries", description="buy milk")
+        Task.objects.create(title="milk", description="from the farm")
+
+        self.assertEqual(self.titles("milk"), ["milk", "groceries"])
+
+    def test_pages_link_to_each_other(self):
+        for index in range(5):
+            Task.objects.create(title=f"report {index}")
+
+        first = self.search("report", page_size=2)
+        last = self.search("report", page_size=2, page=3)
+
+        self.assertIsNone(first["previous"])
+        self.assertIn("page=2", first["next"])
+        self.assertIsNone(last["next"])
+        self.assertIn("page=2", last["previous"])
+        self.assertEqual(len(last["results"]), 1)
+
+    @override_settings(TASKS_SEARCH_MAX_RESULTS=3)
+    def test_results_past_the_limit_are_not_served(self):
+        for index in range(5):
+            Task.objects.create(title=f"report {index}")
+
+        second = self.search("report", page_size=2, page=2)
+
+        self.assertEqual(len(second["results"]), 1)
+        self.assertIsNone(second["next"])
+        self.assertEqual(self.search("report", page_size=2, page=3)["results"], [])
+
+    def test_index_follows_updates_and_deletes(self):
+        task = Task.objects.create(title="draft")
+        deleted = Task.objects.create(title="draft copy")
+
+        task.title = "final"
+        task.save()
+        TasksRepository().soft_delete_task(deleted)
+
+        self.assertEqual(self.titles("final"), ["final"])
+        self.assertEqual(self.titles("draft"), [])
+
+        deleted.delete()
+
+        if connection.vendor == "sqlite":
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT rowid FROM tasks_task_fts WHERE tasks_task_fts MATCH 'draft'"
+                )
+                self.assertEqual(cursor.fetchall(), [])
+
+
+class SeedTasksCommandTestCase(TestCase):
+    def setUp(self):
+        self.existing = Task.objects.create(title="existing")
+        self.head = TaskChangesRepository().get_head()
+
+    def test_bulk_seeding_keeps_the_derived_data_in_step(self):
+        with mock.patch(
+            "apps.tasks.seeding.insert_rows", wraps=seeding.insert_rows
+        ) as insert_rows:
+            call_command(
+                "seed_tasks", count=25, chunk_size=10, users=3,
+                stdout=StringIO()
+            )
+
+        # SQLite writes one chunk at a time with bulk_create
+        self.assertEqual(insert_rows.call_count, 3)
+        self.assertEqual(Task.all_objects.count(), 26)
+        self.assertTrue(
+            Task.objects.filter(title=f"task {self.existing.id + 25}").exists()
+        )
+        for kind, column in (
+            (TaskCounter.STATUS, "status"),
+            (TaskCounter.CATEGORY, "category"),
+        ):
+            expected = {
+                row[column] or TaskCountersRepository.none_id: row["count"]
+                for row in Task.objects.values(column).annotate(count=Count("id"))
+            }
+            self.assertEqual(TaskCountersTestCase.counts(kind), expected)
+        # one CREATED change per seeded task, after the earlier head
+        seeded = TaskChange.objects.filter(id__gt=self.head)
+        self.assertEqual(TaskChangesRepository().get_head(), self.head + 25)
+        self.assertEqual(seeded.filter(action=TaskChange.CREATED).count(), 25)
+        self.assertNotIn(self.existing.id, seeded.values_list("task_id", flat=True))
@@ -1,14 +1,55 @@
+from django.conf import settings
 from django.urls import path
 
+from apps.core.async_views import async_or_sync_view
 from apps.tasks.controllers.all_tasks_controller import (
     AllTasksController,
 )
+from apps.tasks.controllers.async_tasks_controllers import (
+    AsyncAllTasksController,
+    AsyncTaskInfoController,
+)
+from apps.tasks.controllers.tasks_bulk_controller import (
+    TasksBulkController,
+)
+from apps.tasks.controllers.tasks_bulk_update_controller import (
+    TasksBulkUpdateController,
+)
+from apps.tasks.controllers.task_changes_controller import (
+    TaskChangesController,
+)
 from apps.tasks.controllers.task_info_controller import (
     TaskInfoController,
 )
+from apps.tasks.controllers.task_search_controller import (
+    TaskSearchController,
+)
+from apps.tasks.controllers.task_stats_controller import (
+    TaskStatsController,
+)
+from apps.tasks.controllers.tasks_export_controller import (
+    TasksExportController,
+)
+
 
+if settings.ASYNC_API_VIEWS:
+    all_tasks_view = async_or_sync_view(
+        AsyncAllTasksController, AllTasksController.as_view()
+    )
+    task_info_view = async_or_sync_view(
+        AsyncTaskInfoController, TaskInfoController.as_view()
+    )
+else:
+    all_tasks_view = AllTasksController.as_view()
+    task_info_view = TaskInfoController.as_view()
 
 urlpatterns = [
-    path("", AllTasksController.as_view()),
-    path("<int:task_id>/", TaskInfoController.as_view()),
+    path("", all_tasks_view),
+    path("<int:task_id>/", task_info_view),
+    path("export/", TasksExportController.as_view()),
+    path("bulk/", TasksBulkController.as_view()),
+    path("bulk-update/", TasksBulkUpdateController.as_view()),
+    path("stats/", TaskStatsController.as_view()),
+    path("search/", TaskSearchController.as_view()),
+    path("changes/", TaskChangesController.as_view()),
 ]
@@ -0,0 +1,97 @@
+from rest_framework.exceptions import ValidationError
+from rest_framework.fields import SkipField, empty
+from rest_framework.validators import UniqueForDateValidator
+
+
+class BatchUniqueForDateValidator(UniqueForDateValidator):
+    """
+    UniqueForDateValidator for serializers validating many items at once.
+
+    ``prefetch()`` looks up every ``(field, date)`` pair of the batch with
+    one query before the items are validated; each item is then checked
+    against that result and against the valid items before it (see
+    ``remember()``), with the same error as UniqueForDateValidator.
+    Without a prefetch it behaves exactly like UniqueForDateValidator.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.existing = None
+        self.seen = set()
+
+    @classmethod
+    def from_validator(cls, validator):
+        return cls(
+            queryset=validator.queryset,
+            field=validator.field,
+            date_field=validator.date_field,
+            message=validator.message,
+        )
+
+    def prefetch(self, serializer, data):
+        """
+        Fetches the already stored pairs among the raw batch items.
+
+        Args:
+            serializer (Serializer): The child serializer of the batch.
+            data (list): Raw, not yet validated items.
+        """
+        pairs = set()
+
+        for item in data:
+            if not isinstance(item, dict):
+                continue
+            try:
+                value = serializer.fields[self.field].run_validation(
+                    item.get(self.field, empty)
+                )
+                date = serializer.fields[self.date_field].run_validation(
+                    item.get(self.date_field, empty)
+                )
+            except (ValidationError, SkipField):
+                continue
+            if date is not None:
+                pairs.add((value, date))
+
+        field_name = serializer.fields[self.field].source_attrs[-1]
+        date_field_name = serializer.fields[self.date_field].source_attrs[-1]
+        self.seen = set()
+        self.existing = set()
+
+        if pairs:
+            stored = self.queryset.filter(**{
+                f"{field_name}__in": {value for value, _ in pairs},
+                f"{date_field_name}__in": {date for _, date in pairs},
+            }).values_list(field_name, date_field_name)
+            self.existing = pairs.intersection(stored)
+
+    def __call__(self, attrs, serializer):
+        if self.existing is None or serializer.instance is not None:
+            return super().__call__(attrs, serializer)
+
+        self.enforce_required_fields(attrs)
+        date = attrs[self.date_field]
+
+        # like Model.validate_unique, a missing date is never a conflict
+        if date is None:
+            return
+
+        key = (attrs[self.field], date)
+
+        if key in self.existing or key in self.seen:
+            message = self.message.format(date_field=self.date_field)
+            raise ValidationError({
+                self.field: message
+            }, code='unique')
+
+    def remember(self, attrs):
+        """
+        Adds a fully validated item to the ones the later items of the
+        batch must not repeat. An item rejected by any other check is
+        never saved, so it can't conflict.
+        """
+        if self.existing is None:
+            return
+
+        date = attrs.get(self.date_field)
+        if date is not None:
+            self.seen.add((attrs[self.field], date))
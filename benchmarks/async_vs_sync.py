@@ -0,0 +1,101 @@
+"""
+Compares the sync DRF controllers with the native async ones under uvicorn.
+
+Starts ``uvicorn config.asgi:application`` twice, once with
+ASYNC_API_VIEWS=0 and once with ASYNC_API_VIEWS=1, drives the same
+endpoints with benchmarks.http_load and prints requests/sec and latency
+percentiles side by side. Needs ``uvicorn`` installed and the database
+of the current settings migrated (and ideally seeded):
+
+    python -m benchmarks.async_vs_sync -c 64 -d 20
+"""
+import argparse
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+
+from benchmarks.http_load import run_load
+
+
+DEFAULT_PATHS = ["/tasks/", "/tasks/1/", "/categories/", "/statuses/"]
+
+
+def _wait_for_port(port, timeout=20.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        with socket.socket() as sock:
+            if sock.connect_ex(("127.0.0.1", port)) == 0:
+                return
+        time.sleep(0.1)
+    raise RuntimeError(f"server on port {port} did not start")
+
+
+def run_server_benchmark(async_views, paths, port, workers, concurrency, duration,
+                         extra_env=None):
+    env = dict(
+        os.environ,
+        ASYNC_API_VIEWS="1" if async_views else "0",
+        **(extra_env or {}),
+    )
+    server = subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "config.asgi:application",
+            "--port", str(port), "--workers", str(workers),
+            "--log-level", "warning", "--no-access-log",
+        ],
+        env=env,
+    )
+    try:
+        _wait_for_port(port)
+        return {
+            path: run_load(
+                f"http://127.0.0.1:{port}{path}",
+                concurrency=concurrency,
+                duration=duration,
+            )
+            for path in paths
+        }
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("paths", nargs="*", default=DEFAULT_PATHS)
+    parser.add_argument("-c", "--concurrency", type=int, default=32)
+    parser.add_argument("-d", "--duration", type=float, default=10.0)
+    parser.add_argument("-w", "--workers", type=int, default=1)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--json", dest="json_path")
+    args = parser.parse_args()
+
+    results = {
+        mode: run_server_benchmark(
+            async_views=mode == "async",
+            paths=args.paths,
+            port=args.port,
+            workers=args.workers,
+            concurrency=args.concurrency,
+            duration=args.duration,
+        )
+        for mode in ("sync", "async")
+    }
+
+    print(f"{'endpoint':<20}{'sync rps':>10}{'async rps':>11}"
+          f"{'sync p99':>10}{'async p99':>11}")
+    for path in args.paths:
+        sync, async_ = results["sync"][path], results["async"][path]
+        print(f"{path:<20}{sync['rps']:>10}{async_['rps']:>11}"
+              f"{sync['p99_ms']:>10}{async_['p99_ms']:>11}")
+
+    if args.json_path:
+        with open(args.json_path, "w") as output:
+            json.dump(results, output, indent=2)
+
+
+if __name__ == "__main__":
+    main()
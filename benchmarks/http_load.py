@@ -0,0 +1,120 @@
+"""
+Closed-loop HTTP load generator for a running server.
+
+Each worker keeps one keep-alive connection and sends requests back to
+back; the run reports throughput and latency percentiles, e.g. to
+compare DB_CONN_MAX_AGE=0 with persistent connections:
+
+    DB_CONN_MAX_AGE=0 gunicorn config.wsgi -w 4 &
+    python -m benchmarks.http_load http://127.0.0.1:8000/tasks/ -c 16 -d 30
+
+Only the standard library is used, so it runs anywhere the project does.
+"""
+import argparse
+import http.client
+import json
+import statistics
+import threading
+import time
+from urllib.parse import urlsplit
+
+
+def percentile(samples, fraction):
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def _worker(url, deadline, latencies, errors, lock):
+    parts = urlsplit(url)
+    path = parts.path + (f"?{parts.query}" if parts.query else "")
+    connection_class = (
+        http.client.HTTPSConnection if parts.scheme == "https"
+        else http.client.HTTPConnection
+    )
+    connection = connection_class(parts.netloc, timeout=30)
+    local_latencies, local_errors = [], 0
+
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        try:
+            connection.request("GET", path, headers={"Accept": "application/json"})
+            response = connection.getresponse()
+            response.read()
+            if response.status >= 400:
+                local_errors += 1
+        except (OSError, http.client.HTTPException):
+            local_errors += 1
+            connection.close()
+            connection = connection_class(parts.netloc, timeout=30)
+            continue
+        local_latencies.append(time.perf_counter() - started)
+
+    connection.close()
+    with lock:
+        latencies.extend(local_latencies)
+        errors.append(local_errors)
+
+
+def run_load(url, concurrency=8, duration=10.0, warmup=1.0):
+    """
+    Drives ``url`` with ``concurrency`` connections for ``duration`` seconds.
+
+    Returns:
+        dict: Request count, errors, requests/sec and p50/p95/p99 in ms.
+    """
+    if warmup:
+        run_load(url, concurrency=concurrency, duration=warmup, warmup=0)
+
+    latencies, errors, lock = [], [], threading.Lock()
+    deadline = time.perf_counter() + duration
+    threads = [
+        threading.Thread(
+            target=_worker, args=(url, deadline, latencies, errors, lock)
+        )
+        for _ in range(concurrency)
+    ]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    def ms(value):
+        return None if value is None else round(value * 1000, 2)
+
+    return {
+        "url": url,
+        "concurrency": concurrency,
+        "requests": len(latencies),
+        "errors": sum(errors),
+        "rps": round(len(latencies) / elapsed, 1),
+        "mean_ms": ms(statistics.fmean(latencies)) if latencies else None,
+        "p50_ms": ms(percentile(latencies, 0.50)),
+        "p95_ms": ms(percentile(latencies, 0.95)),
+        "p99_ms": ms(percentile(latencies, 0.99)),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("url")
+    parser.add_argument("-c", "--concurrency", type=int, default=8)
+    parser.add_argument("-d", "--duration", type=float, default=10.0)
+    parser.add_argument("--warmup", type=float, default=1.0)
+    args = parser.parse_args()
+
+    result = run_load(
+        args.url,
+        concurrency=args.concurrency,
+        duration=args.duration,
+        warmup=args.warmup,
+    )
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
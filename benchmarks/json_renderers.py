@@ -0,0 +1,95 @@
+"""
+Compares DRF's stock JSONRenderer with apps.core.renderers.OrjsonRenderer.
+
+Renders ``/tasks/``-shaped payloads (AllTasksSerializer output of
+in-memory tasks, no database needed) plus a raw payload of datetimes,
+dates and decimals and prints the mean time per render (the tests of
+apps.core check that both renderers produce the same bytes):
+
+    python -m benchmarks.json_renderers --tasks 10000 --repeat 20
+"""
+import argparse
+import datetime
+import decimal
+import os
+import random
+import time
+
+import django
+
+
+def build_payloads(count, rng):
+    from django.utils import timezone
+
+    from apps.tasks.models import Task
+    from apps.tasks.serializers import AllTasksSerializer
+
+    now = timezone.now()
+    tasks = []
+    for index in range(count):
+        created_at = now - datetime.timedelta(seconds=rng.randrange(365 * 86400))
+        tasks.append(Task(
+            id=index + 1,
+            title=f"task {index} — ünïcode",
+            description="lorem ipsum " * rng.randrange(1, 20),
+            creator_id=rng.randrange(1, 100),
+            category_id=rng.choice([None, *range(1, 13)]),
+            status_id=rng.randrange(1, 6),
+            date_started=created_at.date(),
+            deadline=created_at.date() + datetime.timedelta(days=30),
+            created_at=created_at,
+            updated_at=created_at,
+        ))
+
+    serialized = {
+        "next": "http://testserver/tasks/?cursor=abc",
+        "previous": None,
+        "results": AllTasksSerializer(tasks, many=True).data,
+    }
+    # what values() querysets or hand-built dicts hand the renderer
+    raw = [
+        {
+            "id": task.id,
+            "created_at": task.created_at,
+            "date_started": task.date_started,
+            "score": decimal.Decimal(rng.randrange(10000)) / 100,
+        }
+        for task in tasks
+    ]
+
+    return {"tasks list": serialized, "raw values": raw}
+
+
+def time_render(renderer, data, repeat):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        output = renderer.render(data)
+    return (time.perf_counter() - started) / repeat, output
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+    django.setup()
+
+    from rest_framework.renderers import JSONRenderer
+
+    from apps.core.renderers import OrjsonRenderer
+
+    payloads = build_payloads(args.tasks, random.Random(args.seed))
+
+    print(f"{'payload':<12} {'stock ms':>10} {'orjson ms':>10} {'speedup':>8}  bytes")
+    for name, data in payloads.items():
+        stock, _ = time_render(JSONRenderer(), data, args.repeat)
+        fast, output = time_render(OrjsonRenderer(), data, args.repeat)
+        print(f"{name:<12} {stock * 1000:>10.2f} {fast * 1000:>10.2f} "
+              f"{stock / fast:>7.1f}x  {len(output)}")
+
+
+if __name__ == "__main__":
+    main()
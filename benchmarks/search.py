@@ -0,0 +1,76 @@
+"""
+Measures the ranked task search against a seeded dataset.
+
+The bench database of benchmarks.suite is topped up to --size tasks,
+then every query is run --repeat times through
+TaskSearchRepository.search_task_ids() with the page size of the API,
+once for the first page and once for the deepest page that
+TASKS_SEARCH_MAX_RESULTS serves. Seeded titles are "task <n>" and
+descriptions repeat "lorem ipsum", so "task" and "lorem" match every
+task while a task number matches one: the gap between them is the cost
+of ranking every match.
+
+    python -m benchmarks.search --size 1m --repeat 20
+"""
+import argparse
+import random
+import time
+
+from benchmarks.http_load import percentile
+from benchmarks.suite import create_bench_database, parse_size, setup_django
+
+
+def time_search(repo, query, limit, offset, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        ids = repo.search_task_ids(query, limit=limit, offset=offset)
+        timings.append(time.perf_counter() - started)
+    return timings, ids
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", default="100k",
+                        help="Tasks in the bench database, e.g. 100k or 1m.")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--keepdb", action="store_true",
+                        help="Reuse the bench database of an earlier run.")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    setup_django(response_cache=False)
+
+    from django.conf import settings
+
+    from apps.tasks.models import Task
+    from apps.tasks.repositories.task_search_repo import TaskSearchRepository
+    from apps.tasks.seeding import seed_tasks
+
+    connection, _ = create_bench_database(args.keepdb)
+    size = parse_size(args.size)
+    missing = size - Task.all_objects.count()
+    if missing > 0:
+        seed_tasks(missing, seed=args.seed, log=print)
+
+    rng = random.Random(args.seed)
+    last_id = Task.objects.order_by("-id").values_list("id", flat=True).first()
+    queries = ["task", "lorem", "lorem ipsum", str(rng.randint(1, last_id))]
+    page_size = settings.TASKS_PAGE_SIZE
+    deepest = settings.TASKS_SEARCH_MAX_RESULTS - page_size
+    repo = TaskSearchRepository()
+
+    print(f"{connection.vendor}, {size} tasks, page size {page_size}")
+    print(f"{'query':<14} {'offset':>7} {'p50 ms':>9} {'p95 ms':>9} {'rows':>5}")
+    for query in queries:
+        for offset in (0, deepest):
+            timings, ids = time_search(
+                repo, query, page_size + 1, offset, args.repeat
+            )
+            print(f"{query:<14} {offset:>7} "
+                  f"{percentile(timings, 0.5) * 1000:>9.2f} "
+                  f"{percentile(timings, 0.95) * 1000:>9.2f} {len(ids):>5}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,328 @@
+"""
+Benchmarks the read endpoints against seeded datasets of several sizes.
+
+For every size the bench database (a separate test database of the
+current settings, so real data is never touched) is topped up with
+apps.tasks.seeding, then every endpoint is driven twice:
+
+* in process through the Django test client: throughput, latency
+  percentiles, SQL queries per request and peak Python memory;
+* over HTTP against ``uvicorn config.asgi:application``: throughput,
+  latency percentiles and the server's peak RSS.
+
+The response cache is replaced by a dummy one unless --response-cache
+is given, so the numbers show the database path. Results are written
+as JSON; with --baseline the run fails when a metric regresses past
+--threshold (query counts may not grow at all), and skips the
+comparison when the baseline file doesn't exist yet:
+
+    python -m benchmarks.suite --sizes 1k,100k --output bench.json
+    python -m benchmarks.suite --sizes 1k --save-baseline baseline.json
+    python -m benchmarks.suite --sizes 1k --baseline baseline.json
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import resource
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import django
+
+from benchmarks.async_vs_sync import run_server_benchmark
+from benchmarks.http_load import percentile
+
+SIZE_SUFFIXES = {"k": 1_000, "m": 1_000_000}
+ENDPOINTS = ("tasks list", "task detail", "categories list", "statuses list")
+
+
+def parse_size(value):
+    value = value.strip().lower()
+    if value[-1:] in SIZE_SUFFIXES:
+        return int(float(value[:-1]) * SIZE_SUFFIXES[value[-1]])
+    return int(value)
+
+
+def setup_django(response_cache):
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+    # the runs only read, so per-process versions can't go stale
+    os.environ.setdefault("VERSIONS_SHARED", "True")
+    if not response_cache:
+        os.environ["RESPONSE_CACHE_URL"] = "dummycache://"
+    django.setup()
+
+    from django.conf import settings
+
+    settings.ALLOWED_HOSTS = [*settings.ALLOWED_HOSTS, "testserver", "127.0.0.1"]
+
+
+def create_bench_database(keepdb):
+    """
+    Creates (or reuses) the bench database and returns the environment
+    that points a server process at it.
+    """
+    from django.db import connection
+
+    settings_dict = connection.settings_dict
+    if connection.vendor == "sqlite":
+        # a file, so that the server process can open it too
+        settings_dict["TEST"]["NAME"] = os.path.join(
+            tempfile.gettempdir(), "tasks_bench.sqlite3"
+        )
+    else:
+        settings_dict["TEST"]["NAME"] = f"bench_{settings_dict['NAME']}"
+
+    name = connection.creation.create_test_db(
+        verbosity=0, autoclobber=True, keepdb=keepdb
+    )
+    env_name = "SQLITE_PATH" if connection.vendor == "sqlite" else "DB_NAME_POS"
+
+    return connection, {env_name: str(name)}
+
+
+def endpoint_paths(client, pages, rng):
+    """
+    The request paths of every endpoint: a walk over the first pages
+    of the tasks list and random task ids, so that requests differ.
+    """
+    from django.db.models import Max, Min
+
+    from apps.tasks.models import Task
+
+    list_paths, url = [], "/tasks/"
+    while url and len(list_paths) < pages:
+        list_paths.append(url)
+        url = client.get(url).json()["next"]
+
+    # seeded ids are dense, so sampling the id range avoids ORDER BY RANDOM()
+    bounds = Task.objects.aggregate(low=Min("id"), high=Max("id"))
+    candidates = rng.sample(
+        range(bounds["low"], bounds["high"] + 1),
+        min(pages * 2, bounds["high"] - bounds["low"] + 1)
+    )
+    ids = list(
+        Task.objects.filter(id__in=candidates).values_list("id", flat=True)
+    )[:pages]
+    rng.shuffle(ids)
+
+    return {
+        "tasks list": list_paths,
+        "task detail": [f"/tasks/{pk}/" for pk in ids],
+        "categories list": ["/categories/"],
+        "statuses list": ["/statuses/"],
+    }
+
+
+def bench_client(client, connection, paths, requests):
+    from django.test.utils import CaptureQueriesContext
+
+    latencies, errors = [], 0
+    started = time.perf_counter()
+
+    for index in range(requests):
+        request_started = time.perf_counter()
+        response = client.get(paths[index % len(paths)])
+        latencies.append(time.perf_counter() - request_started)
+        errors += response.status_code >= 400
+
+    elapsed = time.perf_counter() - started
+
+    # query capture and tracemalloc slow requests down, so they get a
+    # separate pass over every distinct path
+    query_counts = []
+    tracemalloc.start()
+    for path in paths:
+        with CaptureQueriesContext(connection) as queries:
+            client.get(path)
+        query_counts.append(len(queries))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    def ms(value):
+        return round(value * 1000, 2)
+
+    return {
+        "requests": requests,
+        "errors": errors,
+        "rps": round(requests / elapsed, 1),
+        "p50_ms": ms(percentile(latencies, 0.50)),
+        "p95_ms": ms(percentile(latencies, 0.95)),
+        "p99_ms": ms(percentile(latencies, 0.99)),
+        "queries_avg": round(sum(query_counts) / len(query_counts), 2),
+        "queries_max": max(query_counts),
+        "peak_kb": peak // 1024,
+    }
+
+
+def bench_size(size, args, connection, server_env, rng):
+    from django.test import Client
+
+    from apps.tasks.models import Task
+    from apps.tasks.seeding import seed_tasks
+
+    missing = max(0, size - Task.objects.count())
+    elapsed = seed_tasks(
+        missing,
+        workers=args.seed_workers,
+        seed=args.seed,
+        log=print if args.verbose else None
+    )
+    print(f"{size} tasks ready ({missing} seeded in {elapsed:.1f}s)")
+
+    client = Client()
+    paths = endpoint_paths(client, pages=args.pages, rng=rng)
+    results = {
+        name: {
+            "client": bench_client(client, connection, paths[name], args.requests)
+        }
+        for name in ENDPOINTS
+    }
+
+    if not args.skip_asgi:
+        server_paths = {paths[name][0]: name for name in ENDPOINTS}
+        served = run_server_benchmark(
+            async_views=args.async_views,
+            paths=list(server_paths),
+            port=args.port,
+            workers=args.workers,
+            concurrency=args.concurrency,
+            duration=args.duration,
+            extra_env=server_env,
+        )
+        # max RSS of the waited-for children, i.e. of the servers so far
+        server_rss = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+        for path, name in server_paths.items():
+            results[name]["asgi"] = {
+                **served[path],
+                "server_peak_rss_kb": server_rss,
+            }
+
+    return results
+
+
+# metric -> (direction, uses the relative threshold)
+CHECKED_METRICS = {
+    "rps": ("lower", True),
+    "p95_ms": ("higher", True),
+    "p99_ms": ("higher", True),
+    "peak_kb": ("higher", True),
+    "queries_max": ("higher", False),
+}
+
+
+def find_regressions(results, baseline, threshold):
+    """
+    Compares a run with a baseline run.
+
+    Returns:
+        list[str]: One line per metric that got worse than allowed.
+    """
+    regressions = []
+
+    for size, endpoints in results["results"].items():
+        for name, legs in endpoints.items():
+            for leg, metrics in legs.items():
+                base = baseline["results"].get(size, {}).get(name, {}).get(leg)
+                if not base:
+                    continue
+                for metric, (worse, relative) in CHECKED_METRICS.items():
+                    if metric not in metrics or metric not in base:
+                        continue
+                    now, before = metrics[metric], base[metric]
+                    margin = threshold if relative else 0
+                    if worse == "higher":
+                        failed = now > before * (1 + margin)
+                    else:
+                        failed = now < before * (1 - margin)
+                    if failed:
+                        regressions.append(
+                            f"{size} {name} [{leg}] {metric}: {before} -> {now}"
+                        )
+
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default="1k,100k,1m",
+                        help="Comma separated dataset sizes, e.g. 1k,100k,1m.")
+    parser.add_argument("--requests", type=int, default=500,
+                        help="Test client requests per endpoint.")
+    parser.add_argument("--pages", type=int, default=20,
+                        help="Distinct list pages / task ids to cycle through.")
+    parser.add_argument("-c", "--concurrency", type=int, default=16)
+    parser.add_argument("-d", "--duration", type=float, default=10.0)
+    parser.add_argument("-w", "--workers", type=int, default=1)
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--async-views", action="store_true",
+                        help="Serve with ASYNC_API_VIEWS=1.")
+    parser.add_argument("--skip-asgi", action="store_true",
+                        help="Only run the in-process test client leg.")
+    parser.add_argument("--response-cache", action="store_true",
+                        help="Keep the response cache enabled.")
+    parser.add_argument("--keepdb", action="store_true",
+                        help="Keep and reuse the seeded bench database.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--seed-workers", type=int, default=os.cpu_count() or 1,
+                        help="Processes seeding the dataset (Postgres only).")
+    parser.add_argument("--output", help="Write the results to this JSON file.")
+    parser.add_argument("--baseline", help="Fail on regressions against this run.")
+    parser.add_argument("--save-baseline", help="Store this run as the baseline.")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="Allowed relative regression, 0.2 = 20%%.")
+    parser.add_argument("-v", "--verbose", action="store_true")
+    args = parser.parse_args()
+
+    setup_django(response_cache=args.response_cache)
+    connection, server_env = create_bench_database(keepdb=args.keepdb)
+    rng = random.Random(args.seed)
+    sizes = sorted(parse_size(size) for size in args.sizes.split(","))
+
+    try:
+        results = {
+            "meta": {
+                "python": platform.python_version(),
+                "database": connection.vendor,
+                "async_views": args.async_views,
+                "response_cache": args.response_cache,
+                "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            },
+            "results": {
+                str(size): bench_size(size, args, connection, server_env, rng)
+                for size in sizes
+            },
+        }
+    finally:
+        if not args.keepdb:
+            connection.creation.destroy_test_db(
+                connection.settings_dict["NAME"], verbosity=0
+            )
+
+    output = json.dumps(results, indent=2)
+    print(output)
+    for path in filter(None, (args.output, args.save_baseline)):
+        with open(path, "w") as result_file:
+            result_file.write(output)
+
+    if args.baseline and not os.path.exists(args.baseline):
+        # timings only compare on the same machine, so none is committed
+        print(f"no baseline at {args.baseline}, comparison skipped; "
+              "store one with --save-baseline (make bench-baseline)",
+              file=sys.stderr)
+    elif args.baseline:
+        with open(args.baseline) as baseline_file:
+            regressions = find_regressions(
+                results, json.load(baseline_file), args.threshold
+            )
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,7 @@
 ASGI config for config project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
+The /events/ server-sent events stream is only served through it.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/5.0/howto/deployment/asgi/
@@ -12,5 +13,10 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+# every ASGI request runs its sync code in a new thread, and a persistent
+# connection stays with the thread that opened it: with DB_CONN_MAX_AGE
+# above 0 each request would leave one behind (see the Django docs on
+# persistent connections), so they are off unless set explicitly
+os.environ.setdefault("DB_CONN_MAX_AGE", "0")
 
 application = get_asgi_application()
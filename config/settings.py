@@ -51,12 +51,18 @@ INSTALLED_APPS = [
     "drf_yasg",
 
     # local
+    "apps.core.apps.CoreConfig",
     "apps.categories_statuses.apps.CategoriesStatusesConfig",
     "apps.subtasks.apps.SubtasksConfig",
     "apps.tasks.apps.TasksConfig",
 ]
 
 MIDDLEWARE = [
+    # first, so that it sees the whole cost of a request; off unless
+    # PERF_PROFILING is set
+    "apps.core.perf.PerfMiddleware",
+    # off unless a read replica is configured
+    "apps.core.db_routing.ReplicaStickinessMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -99,16 +105,71 @@ if env("POSTGRES"):
             'PASSWORD': env('DB_PASSWORD_POS'),
             'HOST': env('DB_HOST_POS'),
             'PORT': env('DB_PORT_POS'),
+            # keep connections open between requests instead of paying
+            # the TCP + auth handshake every time; 0 closes them per request.
+            # WSGI only: config.asgi defaults it to 0, since under ASGI
+            # every request thread would leak its connection
+            'CONN_MAX_AGE': env.int('DB_CONN_MAX_AGE', default=60),
+            'CONN_HEALTH_CHECKS': env.bool('DB_CONN_HEALTH_CHECKS', default=True),
+            # required behind PgBouncer in transaction pooling mode; then
+            # .iterator() fetches whole results, so /tasks/export/ holds
+            # the table in memory instead of TASKS_EXPORT_CHUNK_SIZE rows
+            'DISABLE_SERVER_SIDE_CURSORS': env.bool(
+                'DB_DISABLE_SERVER_SIDE_CURSORS',
+                default=False
+            ),
         }
     }
 else:
     DATABASES = {
         "default": {
             "ENGINE": "django.db.backends.sqlite3",
-            "NAME": BASE_DIR / "db.sqlite3",
+            "NAME": env("SQLITE_PATH", default=str(BASE_DIR / "db.sqlite3")),
         }
     }
 
+# Read replica
+# optional; safe requests read the API tables from it and clients that
+# just wrote stick to the primary for a few seconds (apps/core/db_routing.py).
+# Locally two SQLite files work: REPLICA_DATABASE_URL=sqlite:////abs/path/replica.sqlite3
+# plus "migrate --database replica" (replication itself is out of scope).
+
+REPLICA_READS = bool(env('REPLICA_DATABASE_URL', default=''))
+if REPLICA_READS:
+    DATABASES['replica'] = {
+        **DATABASES['default'],
+        **env.db_url('REPLICA_DATABASE_URL'),
+        # tests run against the primary test database
+        'TEST': {'MIRROR': 'default'},
+    }
+    DATABASE_ROUTERS = ['apps.core.db_routing.ReplicaRouter']
+REPLICA_STICKY_SECONDS = env.int('REPLICA_STICKY_SECONDS', default=5)
+# responses built from replica reads are cached at most this long, as a
+# lagging replica may serve old rows under an already bumped version
+REPLICA_RESPONSE_CACHE_TIMEOUT = env.int(
+    'REPLICA_RESPONSE_CACHE_TIMEOUT', default=REPLICA_STICKY_SECONDS
+)
+
+
+# Cache
+# Needs a shared backend (e.g. CACHE_URL=redis://...) in production: the
+# version counters that invalidate in-process caches live here.
+# "responses" holds serialized read responses keyed by those versions,
+# so a per-process backend is fine for it too (but shares nothing).
+# With the per-process locmem default the response cache, the lookup
+# table snapshots and the ETags are off, as a write in one worker would
+# not reach the others; VERSIONS_SHARED=True turns them on anyway for a
+# single-process server.
+
+CACHES = {
+    'default': env.cache('CACHE_URL', default='locmemcache://'),
+    'responses': env.cache(
+        'RESPONSE_CACHE_URL', default='locmemcache://responses'
+    ),
+}
+RESPONSE_CACHE_TIMEOUT = env.int('RESPONSE_CACHE_TIMEOUT', default=300)
+VERSIONS_SHARED = env.bool('VERSIONS_SHARED', default=None)
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators
@@ -150,3 +211,59 @@ STATIC_URL = "static/"
 # https://docs.djangoproject.com/en/5.0/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
+
+
+# API
+
+# serve the task/category/status endpoints with native async views
+# (run under config.asgi); other methods still go to the DRF views
+ASYNC_API_VIEWS = env.bool('ASYNC_API_VIEWS', default=False)
+
+# orjson drop-ins for DRF's JSON renderer/parser (apps/core/renderers.py),
+# same output bytes; the rest are DRF's defaults
+REST_FRAMEWORK = {
+    'DEFAULT_RENDERER_CLASSES': [
+        'apps.core.renderers.OrjsonRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'apps.core.renderers.OrjsonParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
+}
+
+
+# Profiling
+# per-route request cost histograms (apps/core/perf.py), read at /_perf/
+# or with manage.py perf_report; workers flush them to the default cache
+
+PERF_PROFILING = env.bool('PERF_PROFILING', default=False)
+PERF_FLUSH_INTERVAL = env.int('PERF_FLUSH_INTERVAL', default=10)
+
+
+# Events
+# server-sent events of task/category/status changes at /events/ (ASGI
+# only, apps/core/events.py); the local backend reaches the streams of
+# one worker, apps.core.events.RedisEventBackend those of all workers
+
+EVENTS_BACKEND = env(
+    'EVENTS_BACKEND', default='apps.core.events.LocalEventBackend'
+)
+EVENTS_REDIS_URL = env('EVENTS_REDIS_URL', default='redis://localhost:6379/0')
+EVENTS_QUEUE_SIZE = env.int('EVENTS_QUEUE_SIZE', default=100)
+EVENTS_HEARTBEAT_SECONDS = env.int('EVENTS_HEARTBEAT_SECONDS', default=15)
+EVENTS_RETRY_MS = env.int('EVENTS_RETRY_MS', default=3000)
+
+
+# Tasks API
+
+TASKS_PAGE_SIZE = env.int('TASKS_PAGE_SIZE', default=50)
+TASKS_MAX_PAGE_SIZE = env.int('TASKS_MAX_PAGE_SIZE', default=500)
+TASKS_EXPORT_CHUNK_SIZE = env.int('TASKS_EXPORT_CHUNK_SIZE', default=2000)
+TASKS_BULK_MAX_ITEMS = env.int('TASKS_BULK_MAX_ITEMS', default=5000)
+TASKS_BULK_BATCH_SIZE = env.int('TASKS_BULK_BATCH_SIZE', default=500)
+TASKS_PURGE_AFTER_DAYS = env.int('TASKS_PURGE_AFTER_DAYS', default=30)
+TASKS_PURGE_BATCH_SIZE = env.int('TASKS_PURGE_BATCH_SIZE', default=500)
+# ranked search results past this depth are not served
+TASKS_SEARCH_MAX_RESULTS = env.int('TASKS_SEARCH_MAX_RESULTS', default=1000)
@@ -3,6 +3,9 @@ from django.urls import path, include, re_path
 
 from rest_framework.permissions import AllowAny
 
+from apps.core.controllers.events_controller import EventStreamController
+from apps.core.controllers.perf_controller import PerfReportController
+
 from drf_yasg import openapi
 from drf_yasg.views import get_schema_view
 
@@ -21,6 +24,8 @@ schema_view = get_schema_view(
 
 urlpatterns = [
     path("admin/", admin.site.urls),
+    path("_perf/", PerfReportController.as_view()),
+    path("events/", EventStreamController.as_view()),
     path("", include('apps.router')),
     re_path(
         r"^swagger(?P<format>\.json|\.yaml)$",